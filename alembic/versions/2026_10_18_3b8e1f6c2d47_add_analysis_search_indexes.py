@@ -0,0 +1,30 @@
+"""add analysis search indexes
+
+Revision ID: 3b8e1f6c2d47
+Revises: f943917ee854
+Create Date: 2026-10-18 10:12:41.204518
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = "3b8e1f6c2d47"
+down_revision = "f943917ee854"
+branch_labels = None
+depends_on = None
+
+from alembic import op
+
+
+def upgrade():
+    op.create_index(index_name="ix_analysis_workflow", table_name="analysis", columns=["workflow"])
+    op.create_index(
+        index_name="ix_analysis_comment_fulltext",
+        table_name="analysis",
+        columns=["comment"],
+        mysql_prefix="FULLTEXT",
+    )
+
+
+def downgrade():
+    op.drop_index(index_name="ix_analysis_comment_fulltext", table_name="analysis")
+    op.drop_index(index_name="ix_analysis_workflow", table_name="analysis")
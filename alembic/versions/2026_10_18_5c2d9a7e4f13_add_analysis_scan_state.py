@@ -0,0 +1,26 @@
+"""add analysis scan state
+
+Revision ID: 5c2d9a7e4f13
+Revises: 3b8e1f6c2d47
+Create Date: 2026-10-18 13:41:07.582931
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = "5c2d9a7e4f13"
+down_revision = "3b8e1f6c2d47"
+branch_labels = None
+depends_on = None
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def upgrade():
+    op.add_column("analysis", sa.Column("job_fingerprint", sa.String(64), nullable=True))
+    op.add_column("analysis", sa.Column("scanned_at", sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("analysis", "scanned_at")
+    op.drop_column("analysis", "job_fingerprint")
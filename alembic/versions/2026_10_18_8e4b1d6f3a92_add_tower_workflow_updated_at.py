@@ -0,0 +1,24 @@
+"""add tower workflow updated at
+
+Revision ID: 8e4b1d6f3a92
+Revises: 5c2d9a7e4f13
+Create Date: 2026-10-18 16:02:45.318274
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = "8e4b1d6f3a92"
+down_revision = "5c2d9a7e4f13"
+branch_labels = None
+depends_on = None
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def upgrade():
+    op.add_column("analysis", sa.Column("tower_workflow_updated_at", sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("analysis", "tower_workflow_updated_at")
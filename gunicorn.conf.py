@@ -1,3 +1,8 @@
+import os
+from pathlib import Path
+
+from trailblazer.utils.metrics import REGISTRY, remove_snapshots
+
 bind = "0.0.0.0:8000"
 threads = 4
 timeout = 400
@@ -7,3 +12,21 @@ syslog = True
 forwarded_allow_ips = "10.0.2.100,127.0.0.1"
 accesslog = "-"
 workers = 2
+
+
+# Each worker writes a snapshot of its metrics to the metrics directory, if set, and /metrics
+# renders the sum over all workers. The snapshots are removed when the server starts, which
+# Prometheus handles as a counter reset. When a worker exits, its counts are folded into the
+# snapshot of the exited workers so that the sums do not drop.
+METRICS_DIRECTORY: str | None = os.environ.get("METRICS_DIRECTORY")
+
+
+def on_starting(server):
+    if METRICS_DIRECTORY:
+        Path(METRICS_DIRECTORY).mkdir(parents=True, exist_ok=True)
+        remove_snapshots(Path(METRICS_DIRECTORY))
+
+
+def child_exit(server, worker):
+    if METRICS_DIRECTORY:
+        REGISTRY.retire_snapshot(directory=Path(METRICS_DIRECTORY), process_id=worker.pid)
@@ -1,5 +1,17 @@
-from trailblazer.clients.slurm_cli_client.utils import get_squeue_result
+from unittest.mock import Mock
+
+from pytest_mock import MockerFixture
+
+from trailblazer.clients.slurm_cli_client import utils
+from trailblazer.clients.slurm_cli_client.utils import (
+    cancel_slurm_jobs,
+    get_scancel_errors,
+    get_slurm_jobs,
+    get_squeue_jobs,
+    get_squeue_result,
+)
 from trailblazer.clients.slurm_cli_client.models import SqueueResult
+from trailblazer.constants import SQUEUE_MAX_JOB_IDS
 
 
 def test_get_squeue_result(squeue_stream_jobs):
@@ -11,3 +23,85 @@ def test_get_squeue_result(squeue_stream_jobs):
     # THEN it should return squeue results and jobs
     assert isinstance(squeue_result, SqueueResult)
     assert isinstance(squeue_result.jobs, list)
+
+
+def test_get_slurm_jobs_chunks_job_ids(mocker: MockerFixture, squeue_stream_jobs: str):
+    # GIVEN more job ids than can be passed to a single squeue call
+    job_ids: list[int] = list(range(SQUEUE_MAX_JOB_IDS + 1))
+
+    # GIVEN a squeue call returning jobs
+    squeue_output: Mock = mocker.patch.object(
+        utils, "get_slurm_queue_output", return_value=squeue_stream_jobs
+    )
+
+    # WHEN getting the jobs
+    jobs, errors = get_slurm_jobs(job_ids)
+
+    # THEN squeue was called once per chunk of job ids
+    assert squeue_output.call_count == 2
+
+    # THEN the jobs from all calls are returned
+    assert len(jobs) == 2 * len(squeue_stream_jobs.splitlines()[1:])
+    assert not errors
+
+
+def test_get_squeue_jobs_without_jobs():
+    # GIVEN a squeue stream with only the header
+
+    # WHEN getting the squeue jobs
+    jobs, errors = get_squeue_jobs("JOBID,NAME,STATE,TIME_LIMIT,TIME,START_TIME")
+
+    # THEN no jobs are returned
+    assert jobs == []
+    assert not errors
+
+
+def test_get_squeue_jobs_with_unknown_state():
+    # GIVEN a squeue stream with a job in a state unknown to Trailblazer
+    squeue_response: str = (
+        "JOBID,NAME,STATE,TIME_LIMIT,TIME,START_TIME\n"
+        "1,job,RUNNING,10:00:00,0:19,N/A\n"
+        "2,job,OUT_OF_MEMORY,10:00:00,0:19,N/A"
+    )
+
+    # WHEN getting the squeue jobs
+    jobs, errors = get_squeue_jobs(squeue_response)
+
+    # THEN the valid job is returned
+    assert [job.id for job in jobs] == [1]
+
+    # THEN only the job in the unknown state failed
+    assert list(errors) == [2]
+
+
+def test_cancel_slurm_jobs_in_one_call(mocker: MockerFixture):
+    # GIVEN an scancel call failing for one of the jobs
+    run: Mock = mocker.patch.object(
+        utils.subprocess,
+        "run",
+        return_value=Mock(
+            returncode=1,
+            stderr="scancel: error: Kill job error on job id 2: Invalid job id specified\n",
+        ),
+    )
+
+    # WHEN cancelling the jobs
+    errors: dict[int, str] = cancel_slurm_jobs([1, 2, 3])
+
+    # THEN all jobs were cancelled with one scancel call
+    run.assert_called_once()
+    assert run.call_args.args[0] == ["scancel", "1", "2", "3"]
+
+    # THEN the failure is reported for the failed job
+    assert list(errors) == [2]
+    assert "Invalid job id specified" in errors[2]
+
+
+def test_get_scancel_errors_without_job_id():
+    # GIVEN an scancel error which does not mention a job
+
+    # WHEN getting the errors per job
+    errors: dict[int, str] = get_scancel_errors(stderr="ssh: connect failed", job_ids=[1, 2])
+
+    # THEN the error is reported for all jobs
+    assert errors == {1: "ssh: connect failed", 2: "ssh: connect failed"}
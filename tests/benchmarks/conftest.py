@@ -0,0 +1,151 @@
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Generator
+
+import pytest
+import requests_mock
+from pytest_mock import MockerFixture
+from sqlalchemy.orm import Session
+
+from tests.benchmarks.utils import (
+    get_squeue_output,
+    get_tower_tasks,
+    get_tower_tasks_page,
+    get_tower_workflows,
+    write_job_id_file,
+)
+from trailblazer.clients.slurm_cli_client.slurm_cli_client import SlurmCLIClient
+from trailblazer.clients.tower.tower_client import TowerAPIClient
+from trailblazer.constants import FileFormat, TrailblazerStatus, WorkflowManager
+from trailblazer.io.controller import ReadFile
+from trailblazer.services.analysis_service.analysis_service import AnalysisService
+from trailblazer.services.job_service.job_service import JobService
+from trailblazer.services.slurm.slurm_cli_service.slurm_cli_service import SlurmCLIService
+from trailblazer.services.tower.tower_api_service import TowerAPIService
+from trailblazer.store.database import (
+    create_all_tables,
+    drop_all_tables,
+    get_session,
+    initialize_database,
+)
+from trailblazer.store.models import Analysis
+from trailblazer.store.store import Store
+
+TOWER_URL: str = "https://tower/"
+
+
+@pytest.fixture(scope="session")
+def number_of_analyses() -> int:
+    """Return the number of analyses to scan, set with TRAILBLAZER_BENCHMARK_ANALYSES."""
+    return int(os.environ.get("TRAILBLAZER_BENCHMARK_ANALYSES", 20))
+
+
+@pytest.fixture(scope="session")
+def jobs_per_analysis() -> int:
+    """Return the number of jobs per analysis, set with TRAILBLAZER_BENCHMARK_JOBS."""
+    return int(os.environ.get("TRAILBLAZER_BENCHMARK_JOBS", 10))
+
+
+@pytest.fixture(params=["sqlite-memory", "sqlite-file"])
+def database(request, tmp_path: Path) -> Generator[str, None, None]:
+    """Initialise an in-memory or a file-backed database and return its name."""
+    if request.param == "sqlite-memory":
+        initialize_database("sqlite:///:memory:")
+    else:
+        initialize_database(f"sqlite:///{Path(tmp_path, 'trailblazer.db')}")
+    create_all_tables()
+    yield request.param
+    get_session().remove()
+    drop_all_tables()
+
+
+@pytest.fixture
+def benchmark_store(
+    database: str, tmp_path: Path, number_of_analyses: int, jobs_per_analysis: int
+) -> Store:
+    """Return a store with ongoing SLURM and Tower analyses, every other of each kind."""
+    session: Session = get_session()
+    for index in range(number_of_analyses):
+        case_id = f"case_{index}"
+        analysis = Analysis(
+            case_id=case_id,
+            started_at=datetime.now(),
+            status=TrailblazerStatus.RUNNING,
+            workflow="balsamic",
+        )
+        if index % 2:
+            analysis.workflow_manager = WorkflowManager.TOWER
+            analysis.tower_workflow_id = f"workflow_{index}"
+        else:
+            analysis.workflow_manager = WorkflowManager.SLURM
+            first_job_id: int = index * jobs_per_analysis
+            job_ids: list[int] = list(range(first_job_id, first_job_id + jobs_per_analysis))
+            analysis.config_path = str(write_job_id_file(tmp_path, case_id, job_ids))
+        session.add(analysis)
+    session.commit()
+    return Store()
+
+
+@pytest.fixture
+def fake_squeue(mocker: MockerFixture) -> None:
+    """Answer squeue calls with synthesized output for the requested job ids."""
+    mocker.patch(
+        "trailblazer.clients.slurm_cli_client.utils.subprocess.check_output",
+        side_effect=lambda commands, text: get_squeue_output(
+            commands[commands.index("--jobs") + 1]
+        ),
+    )
+
+
+@pytest.fixture
+def fake_tower(
+    fixtures_dir: Path, number_of_analyses: int, jobs_per_analysis: int
+) -> Generator[None, None, None]:
+    """Answer Tower requests with synthesized tasks and a running workflow for all analyses."""
+    tasks_response: dict = ReadFile.get_content_from_file(
+        file_format=FileFormat.JSON,
+        file_path=Path(fixtures_dir, "tower", "tower_tasks_running.json"),
+    )
+    workflow_response: dict = ReadFile.get_content_from_file(
+        file_format=FileFormat.JSON,
+        file_path=Path(fixtures_dir, "tower", "tower_workflow_running.json"),
+    )
+    with requests_mock.Mocker() as mock:
+        mock.get(
+            f"{TOWER_URL}workflow",
+            json=lambda request, context: get_tower_workflows(
+                workflow_response=workflow_response, search=request.qs.get("search", [""])[0]
+            ),
+        )
+        for index in range(1, number_of_analyses, 2):
+            workflow_url = f"{TOWER_URL}workflow/workflow_{index}"
+            mock.get(workflow_url, json=workflow_response)
+            tasks: dict = get_tower_tasks(
+                tasks_response=tasks_response,
+                first_native_id=index * jobs_per_analysis,
+                number_of_tasks=jobs_per_analysis,
+            )
+            mock.get(
+                f"{workflow_url}/tasks",
+                json=lambda request, context, tasks=tasks: get_tower_tasks_page(
+                    tasks_response=tasks, query=request.qs
+                ),
+            )
+        yield
+
+
+@pytest.fixture
+def benchmark_analysis_service(
+    benchmark_store: Store, fake_squeue: None, fake_tower: None
+) -> AnalysisService:
+    """Return an analysis service scanning against the fake SLURM and Tower backends."""
+    slurm_service = SlurmCLIService(client=SlurmCLIClient(host=None), store=benchmark_store)
+    tower_client = TowerAPIClient(
+        base_url=TOWER_URL, access_token="token", workspace_id="workspace_id"
+    )
+    tower_service = TowerAPIService(client=tower_client, store=benchmark_store)
+    job_service = JobService(
+        store=benchmark_store, slurm_service=slurm_service, tower_service=tower_service
+    )
+    return AnalysisService(store=benchmark_store, job_service=job_service)
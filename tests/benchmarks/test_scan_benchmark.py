@@ -0,0 +1,73 @@
+"""Benchmarks of the scan of ongoing analyses against a fake SLURM and Tower backend.
+
+Scale the workload with TRAILBLAZER_BENCHMARK_ANALYSES and TRAILBLAZER_BENCHMARK_JOBS and run with
+`pytest tests/benchmarks -s` to print the reports."""
+
+from sqlalchemy.orm import Session
+
+from tests.benchmarks.utils import ScanReport, run_scan
+from trailblazer.constants import TrailblazerStatus, WorkflowManager
+from trailblazer.services.analysis_service.analysis_service import AnalysisService
+from trailblazer.store.database import get_session
+
+
+def test_scan_ongoing_analyses(
+    benchmark_analysis_service: AnalysisService,
+    database: str,
+    number_of_analyses: int,
+    jobs_per_analysis: int,
+    record_property,
+):
+    # GIVEN ongoing SLURM and Tower analyses without any jobs
+    session: Session = get_session()
+
+    # WHEN scanning the ongoing analyses
+    report: ScanReport = run_scan(
+        analysis_service=benchmark_analysis_service,
+        session=session,
+        database=database,
+        jobs_per_analysis=jobs_per_analysis,
+        max_workers=4,
+    )
+    record_property("first_scan", str(report))
+    print(f"\nFirst scan - {report}")
+
+    # THEN the jobs of the SLURM analyses and the progress of the running Tower workflows are stored
+    for analysis in benchmark_analysis_service.store.get_ongoing_analyses():
+        if analysis.workflow_manager == WorkflowManager.SLURM:
+            assert len(analysis.jobs) == jobs_per_analysis
+        else:
+            assert analysis.progress > 0
+        assert analysis.status == TrailblazerStatus.RUNNING
+
+    # THEN the jobs and the status of each analysis are committed on their own
+    assert report.commits <= 2 * number_of_analyses + 1
+
+    # THEN the analyses are read with a constant number of queries
+    assert report.queries - report.writes <= 4
+
+
+def test_rescan_unchanged_analyses(
+    benchmark_analysis_service: AnalysisService,
+    database: str,
+    number_of_analyses: int,
+    jobs_per_analysis: int,
+    record_property,
+):
+    # GIVEN ongoing analyses which have been scanned
+    session: Session = get_session()
+    benchmark_analysis_service.update_ongoing_analyses()
+
+    # WHEN scanning the analyses again without any changes in SLURM or Tower
+    report: ScanReport = run_scan(
+        analysis_service=benchmark_analysis_service,
+        session=session,
+        database=database,
+        jobs_per_analysis=jobs_per_analysis,
+        max_workers=4,
+    )
+    record_property("rescan", str(report))
+    print(f"\nUnchanged rescan - {report}")
+
+    # THEN nothing is written to the database
+    assert report.writes == 0
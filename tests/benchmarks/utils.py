@@ -0,0 +1,133 @@
+"""Helpers to synthesize scan workloads and measure scans against a fake SLURM and Tower backend."""
+
+import copy
+import time
+import tracemalloc
+from dataclasses import dataclass
+from itertools import cycle
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from tests.store.utils.query_counter import count_queries
+from trailblazer.services.analysis_service.analysis_service import AnalysisService
+
+SQUEUE_HEADER: str = "JOBID,NAME,STATE,TIME_LIMIT,TIME,START_TIME"
+SQUEUE_STATES: list[str] = ["COMPLETED", "RUNNING", "PENDING"]
+WRITE_STATEMENTS: tuple[str, ...] = ("INSERT", "UPDATE", "DELETE")
+
+
+@dataclass
+class ScanReport:
+    """Resources used by one scan of the ongoing analyses."""
+
+    database: str
+    analyses: int
+    jobs_per_analysis: int
+    queries: int
+    writes: int
+    commits: int
+    wall_time: float
+    peak_memory: int
+
+    def __str__(self) -> str:
+        return (
+            f"{self.database}: {self.analyses} analyses x {self.jobs_per_analysis} jobs - "
+            f"{self.queries} queries ({self.writes} writes), {self.commits} commits, "
+            f"{self.wall_time:.3f} s, peak memory {self.peak_memory / 1024:.0f} KiB"
+        )
+
+
+def write_job_id_file(directory: Path, case_id: str, job_ids: list[int]) -> Path:
+    """Write a SLURM job id file in the format written by the workflows."""
+    job_id_file = Path(directory, f"{case_id}_slurm_job_ids.yaml")
+    lines: list[str] = ["---", f"{case_id}:"] + [f"  - '{job_id}'" for job_id in job_ids]
+    job_id_file.write_text("\n".join(lines) + "\n")
+    return job_id_file
+
+
+def get_squeue_output(job_ids: str) -> str:
+    """Return squeue output in the format of the squeue fixtures for comma separated job ids."""
+    states = cycle(SQUEUE_STATES)
+    rows: list[str] = [
+        f"{job_id},job_{job_id},{next(states)},10:00:00,0:19,2020-10-22T11:43:33"
+        for job_id in job_ids.split(",")
+    ]
+    return "\n".join([SQUEUE_HEADER] + rows)
+
+
+def get_tower_tasks(tasks_response: dict, first_native_id: int, number_of_tasks: int) -> dict:
+    """Return a Tower tasks response with the given number of tasks based on a fixture response."""
+    template_tasks: list[dict] = tasks_response["tasks"]
+    tasks: list[dict] = []
+    for index in range(number_of_tasks):
+        task: dict = copy.deepcopy(template_tasks[index % len(template_tasks)])
+        task["task"]["nativeId"] = str(first_native_id + index)
+        task["task"]["taskId"] = index + 1
+        tasks.append(task)
+    return {"tasks": tasks, "total": number_of_tasks}
+
+
+def get_tower_workflows(workflow_response: dict, search: str) -> dict:
+    """Return a Tower workflow list response with a workflow for each workflow id searched for."""
+    workflow_ids: list[str] = [
+        word.split(":", 1)[1] for word in search.split() if word.startswith("workflowid:")
+    ]
+    workflows: list[dict] = [
+        {
+            "workflow": workflow_response["workflow"] | {"id": workflow_id},
+            "progress": workflow_response["progress"],
+        }
+        for workflow_id in workflow_ids
+    ]
+    return {"workflows": workflows, "totalSize": len(workflows)}
+
+
+def get_tower_tasks_page(tasks_response: dict, query: dict[str, list[str]]) -> dict:
+    """Return the page of a Tower tasks response requested by the max and offset parameters."""
+    offset: int = int(query.get("offset", ["0"])[0])
+    page_size: int = int(query.get("max", [len(tasks_response["tasks"])])[0])
+    page: list[dict] = tasks_response["tasks"][offset : offset + page_size]
+    return {"tasks": page, "total": tasks_response["total"]}
+
+
+def run_scan(
+    analysis_service: AnalysisService,
+    session: Session,
+    database: str,
+    jobs_per_analysis: int,
+    max_workers: int = 1,
+) -> ScanReport:
+    """Scan the ongoing analyses and report the queries, commits, wall time and peak memory."""
+    analyses: int = len(analysis_service.store.get_ongoing_analyses())
+    session.expunge_all()
+    commits: list[Session] = []
+
+    def after_commit(committed_session: Session) -> None:
+        commits.append(committed_session)
+
+    session_instance: Session = session()
+    event.listen(session_instance, "after_commit", after_commit)
+    tracemalloc.start()
+    try:
+        with count_queries(session) as statements:
+            started_at: float = time.perf_counter()
+            analysis_service.update_ongoing_analyses(max_workers=max_workers)
+            wall_time: float = time.perf_counter() - started_at
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        event.remove(session_instance, "after_commit", after_commit)
+    return ScanReport(
+        database=database,
+        analyses=analyses,
+        jobs_per_analysis=jobs_per_analysis,
+        queries=len(statements),
+        writes=len(
+            [statement for statement in statements if statement.startswith(WRITE_STATEMENTS)]
+        ),
+        commits=len(commits),
+        wall_time=wall_time,
+        peak_memory=peak_memory,
+    )
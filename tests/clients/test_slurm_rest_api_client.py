@@ -12,3 +12,19 @@ def test_get_slurm_jobs(slurm_client: SlurmAPIClient, mock_request: Mocker, jobs
 
     # THEN the jobs are deserialized without error
     assert jobs_response
+
+
+def test_get_all_slurm_jobs(
+    slurm_client: SlurmAPIClient, mock_request: Mocker, jobs_response: dict
+):
+    # GIVEN a mocked jobs endpoint
+    mock_request.get(f"{slurm_client.base_url}/slurm/v0.0.40/jobs", json=jobs_response)
+
+    # WHEN retrieving all jobs
+    response: SlurmJobsResponse = slurm_client.get_jobs()
+
+    # THEN all jobs are deserialized
+    assert len(response.jobs) == 2
+
+    # THEN the request is authenticated
+    assert mock_request.last_request.headers["X-SLURM-USER-NAME"] == "user_name"
@@ -0,0 +1,80 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+from dependency_injector import providers
+from pytest_mock import MockerFixture
+
+from trailblazer.clients.slurm_cli_client import ssh_connection as ssh_module
+from trailblazer.clients.slurm_cli_client.ssh_connection import (
+    SSHConnection,
+    open_ssh_connection,
+)
+
+
+def test_get_command_reuses_control_path(mocker: MockerFixture):
+    # GIVEN an SSH connection to a host
+    mocker.patch.object(ssh_module.subprocess, "run", return_value=Mock(returncode=0))
+    connection = SSHConnection("host")
+
+    # WHEN getting the commands for two calls
+    first_command: list[str] = connection.get_command(["squeue"])
+    second_command: list[str] = connection.get_command(["scancel", "1"])
+
+    # THEN both commands are multiplexed over the same control path
+    assert "ControlMaster=auto" in first_command
+    assert first_command[:-1] == second_command[:-2]
+
+    # THEN the commands are run on the host
+    assert first_command[-2:] == ["host", "squeue"]
+    connection.close()
+
+
+def test_close_stops_master_connection(mocker: MockerFixture):
+    # GIVEN an SSH connection which has been used
+    run: Mock = mocker.patch.object(ssh_module.subprocess, "run", return_value=Mock(returncode=0))
+    connection = SSHConnection("host")
+    connection.get_command(["squeue"])
+    control_dir: Path = connection.control_path.parent
+
+    # WHEN closing the connection
+    connection.close()
+
+    # THEN the master connection is stopped
+    assert ["-O", "exit", "host"] == run.call_args.args[0][-3:]
+
+    # THEN the control directory is removed
+    assert not control_dir.exists()
+
+
+def test_close_unused_connection(mocker: MockerFixture):
+    # GIVEN an SSH connection which has not been used
+    run: Mock = mocker.patch.object(ssh_module.subprocess, "run")
+
+    # WHEN closing the connection
+    SSHConnection("host").close()
+
+    # THEN no command is run
+    run.assert_not_called()
+
+
+def test_open_ssh_connection_without_host():
+    # GIVEN no analysis host
+
+    # WHEN opening the connection resource
+    # THEN commands are run locally
+    assert next(open_ssh_connection(None)) is None
+
+
+def test_ssh_connection_resource_is_closed_on_shutdown(mocker: MockerFixture):
+    # GIVEN an SSH connection resource which has been used
+    run: Mock = mocker.patch.object(ssh_module.subprocess, "run", return_value=Mock(returncode=0))
+    resource = providers.Resource(open_ssh_connection, host="host")
+    connection: SSHConnection = resource()
+    control_dir: Path = connection.control_path.parent
+
+    # WHEN shutting down the resource, as when a CLI command or a server worker exits
+    resource.shutdown()
+
+    # THEN the master connection is stopped and the control directory is removed
+    assert ["-O", "exit", "host"] == run.call_args.args[0][-3:]
+    assert not control_dir.exists()
@@ -1,5 +1,11 @@
+import pytest
 from requests_mock import Mocker
+
+from tests.mocks.fake_tower_server import FakeTowerServer
+
+from trailblazer.clients.tower.models import TowerTask, TowerTaskSummary, TowerWorkflowResponse
 from trailblazer.clients.tower.tower_client import TowerAPIClient
+from trailblazer.exc import TowerRequestFailed
 
 
 def test_empty_tasks_response_is_accepted(
@@ -54,3 +60,106 @@ def test_completed_tasks_response_is_accepted(
 
     # THEN the response should have a total of tasks
     assert response.total
+
+
+def test_get_all_tasks_fetches_every_page(
+    tower_client: TowerAPIClient,
+    tower_completed_tasks_response: dict,
+    mock_request: Mocker,
+):
+    # GIVEN a workflow with more tasks than fit on a page
+    tower_client.page_size = 4
+    tasks: list[dict] = tower_completed_tasks_response["tasks"]
+    mock_request.get(
+        "https://tower/workflow/1/tasks",
+        json=lambda request, context: {
+            "tasks": tasks[int(request.qs["offset"][0]) :][: int(request.qs["max"][0])],
+            "total": len(tasks),
+        },
+    )
+
+    # WHEN fetching all tasks of the workflow
+    all_tasks: list[TowerTaskSummary] = list(tower_client.get_all_tasks(workflow_id="1"))
+
+    # THEN every task is returned in order
+    assert [task.nativeId for task in all_tasks] == [task["task"]["nativeId"] for task in tasks]
+
+    # THEN the tasks are fetched in pages
+    assert mock_request.call_count == 2
+
+
+def test_get_all_tasks_raises_when_a_page_fails(
+    tower_client: TowerAPIClient,
+    tower_completed_tasks_response: dict,
+    mock_request: Mocker,
+):
+    # GIVEN a workflow with more tasks than fit on a page
+    tower_client.page_size = 4
+
+    # GIVEN that fetching the second page fails
+    mock_request.get("https://tower/workflow/1/tasks?offset=0", json=tower_completed_tasks_response)
+    mock_request.get("https://tower/workflow/1/tasks?offset=4", status_code=500)
+
+    # WHEN fetching all tasks of the workflow
+    # THEN the request failure is raised
+    with pytest.raises(TowerRequestFailed):
+        list(tower_client.get_all_tasks(workflow_id="1"))
+
+
+def test_task_summaries_match_full_tasks(
+    tower_client: TowerAPIClient,
+    tower_running_tasks_response: dict,
+    mock_request: Mocker,
+):
+    # GIVEN a workflow response with running tasks
+    mock_request.get("https://tower/workflow/1/tasks", json=tower_running_tasks_response)
+
+    # WHEN fetching the tasks and the task summaries for the workflow
+    tasks: list[TowerTask] = tower_client.get_tasks(workflow_id="1").get_tasks()
+    summaries: list[TowerTaskSummary] = tower_client.get_task_summaries(workflow_id="1").get_tasks()
+
+    # THEN the summaries have the same job attributes as the full tasks
+    job_fields: set[str] = set(TowerTaskSummary.model_fields)
+    assert [summary.model_dump() for summary in summaries] == [
+        task.model_dump(include=job_fields) for task in tasks
+    ]
+
+    # THEN the other attributes of the tasks are not kept
+    assert not hasattr(summaries[0], "script")
+
+
+def test_get_workflows_lists_workflows_in_one_request(fake_tower_server: FakeTowerServer):
+    # GIVEN a client of a Tower server with two running workflows
+    client = TowerAPIClient(
+        base_url=fake_tower_server.base_url, access_token="token", workspace_id="workspace_id"
+    )
+
+    # WHEN getting the workflows by id
+    workflows: dict[str, TowerWorkflowResponse] = client.get_workflows(
+        ["workflow_1", "workflow_2", "unknown_workflow"]
+    )
+
+    # THEN the known workflows are returned with their status and progress
+    assert set(workflows) == {"workflow_1", "workflow_2"}
+    assert workflows["workflow_1"].workflow.status == "RUNNING"
+    assert workflows["workflow_1"].progress.processes_progress
+
+    # THEN the workflows are listed in a single request
+    assert fake_tower_server.requests == ["/workflow"]
+
+
+def test_get_workflows_searches_chunks_of_workflow_ids(fake_tower_server: FakeTowerServer):
+    # GIVEN a client searching for one workflow id per request
+    client = TowerAPIClient(
+        base_url=fake_tower_server.base_url,
+        access_token="token",
+        workspace_id="workspace_id",
+        workflows_per_search=1,
+    )
+
+    # WHEN getting two workflows by id
+    workflows: dict[str, TowerWorkflowResponse] = client.get_workflows(["workflow_1", "workflow_2"])
+
+    # THEN both workflows are returned from one search per workflow id
+    assert set(workflows) == {"workflow_1", "workflow_2"}
+    assert fake_tower_server.requests == ["/workflow", "/workflow"]
@@ -5,6 +5,7 @@ from typing import Dict, Generator
 import pytest
 from sqlalchemy.orm import Session
 
+from tests.mocks.fake_tower_server import FakeTowerServer
 from tests.mocks.store_mock import MockStore
 from tests.store.utils.store_helper import StoreHelpers
 from trailblazer.clients.slurm_api_client.dto.common import SlurmAPIJobInfo
@@ -363,7 +364,12 @@ def tower_tasks_response():
 @pytest.fixture
 def tower_workflow_response() -> TowerWorkflowResponse:
     workflow = TowerWorkflow(status="RUNNING")
-    progress = TowerProgress(workflowProgress={}, processesProgress=[])
+    progress = TowerProgress(
+        workflowProgress={},
+        processesProgress=[
+            {"process": "example_process", "succeeded": 1, "running": 1},
+        ],
+    )
     return TowerWorkflowResponse(
         workflow=workflow,
         progress=progress,
@@ -417,3 +423,29 @@ def slurm_job_response() -> SlurmJobResponse:
         name="Test Job",
     )
     return SlurmJobResponse(jobs=[job_info], errors=None, warnings=None)
+
+
+@pytest.fixture
+def fake_tower_server(fixtures_dir: Path) -> Generator[FakeTowerServer, None, None]:
+    """Return a local Tower server with the running workflows workflow_1 and workflow_2."""
+    workflow_response: dict = ReadFile.get_content_from_file(
+        file_format=FileFormat.JSON,
+        file_path=Path(fixtures_dir, "tower", "tower_workflow_running.json"),
+    )
+    tasks_response: dict = ReadFile.get_content_from_file(
+        file_format=FileFormat.JSON,
+        file_path=Path(fixtures_dir, "tower", "tower_tasks_running.json"),
+    )
+    workflows: dict[str, dict] = {}
+    for workflow_id in ["workflow_1", "workflow_2"]:
+        workflows[workflow_id] = {
+            "workflow": workflow_response["workflow"] | {"id": workflow_id},
+            "progress": workflow_response["progress"],
+        }
+    server = FakeTowerServer(
+        workflows=workflows,
+        tasks={workflow_id: tasks_response["tasks"] for workflow_id in workflows},
+    )
+    server.start()
+    yield server
+    server.stop()
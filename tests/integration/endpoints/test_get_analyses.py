@@ -182,3 +182,25 @@ def test_get_analyses_by_hold_delivery_none(client: FlaskClient, analyses: list[
 
     # THEN the same numebr of analyses is returned
     assert len(response.json["analyses"]) == len(analyses)
+
+
+def test_get_analyses_with_cursor_of_other_sorting(client: FlaskClient, analyses: list[Analysis]):
+    # GIVEN the cursor of the next page of analyses sorted by ticket id
+    response = client.get("/api/v1/analyses?pageSize=1&sortField=ticket_id&sortOrder=asc")
+    cursor: str = response.json["next_cursor"]
+
+    # WHEN retrieving the next page sorted by when the analyses were started
+    response = client.get(f"/api/v1/analyses?pageSize=1&sortField=started_at&cursor={cursor}")
+
+    # THEN it gives a bad request response
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_get_analyses_with_invalid_cursor(client: FlaskClient, analyses: list[Analysis]):
+    # GIVEN a cursor which was not returned by the endpoint
+
+    # WHEN retrieving the analyses after the cursor
+    response = client.get("/api/v1/analyses?cursor=not-a-cursor")
+
+    # THEN it gives a bad request response
+    assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -1,7 +1,11 @@
+from sqlalchemy.orm import Session
+
+from tests.store.utils.query_counter import count_queries
 from trailblazer.clients.slurm_api_client.dto.job_response import SlurmJobResponse
 from trailblazer.clients.tower.models import TowerTasksResponse, TowerWorkflowResponse
 from trailblazer.constants import TrailblazerStatus
 from trailblazer.services.analysis_service.analysis_service import AnalysisService
+from trailblazer.store.database import get_session
 from trailblazer.store.models import Analysis
 
 
@@ -12,7 +16,9 @@ def test_updating_tower_analysis(
     tower_workflow_response: TowerWorkflowResponse,
 ):
     # GIVEN an analysis started with tower without any job entries but running tasks
-    analysis_service.job_service.tower_service.client.get_tasks.return_value = tower_tasks_response
+    analysis_service.job_service.tower_service.client.get_all_tasks.return_value = (
+        tower_tasks_response.get_tasks()
+    )
     analysis_service.job_service.tower_service.client.get_workflow.return_value = (
         tower_workflow_response
     )
@@ -49,3 +55,56 @@ def test_updating_slurm_analysis(
 
     # THEN the progress of the analysis is updated
     assert slurm_analysis.progress > 0
+
+
+def test_updating_ongoing_analyses_concurrently(
+    analysis_service: AnalysisService,
+    tower_analysis: Analysis,
+    tower_tasks_response: TowerTasksResponse,
+    tower_workflow_response: TowerWorkflowResponse,
+):
+    # GIVEN an ongoing tower analysis with a running workflow
+    analysis_service.job_service.tower_service.client.get_all_tasks.return_value = (
+        tower_tasks_response.get_tasks()
+    )
+    analysis_service.job_service.tower_service.client.get_workflow.return_value = (
+        tower_workflow_response
+    )
+
+    # WHEN updating all ongoing analyses with several workers
+    analysis_service.update_ongoing_analyses(max_workers=4)
+
+    # THEN the tasks of the running workflow are not fetched
+    analysis_service.job_service.tower_service.client.get_all_tasks.assert_not_called()
+
+    # THEN the status and progress of the analysis are taken from the workflow
+    assert tower_analysis.status == TrailblazerStatus.RUNNING
+    assert tower_analysis.progress == 0.5
+
+
+def test_updating_slurm_analysis_loads_and_commits_once(
+    analysis_service: AnalysisService,
+    slurm_analysis: Analysis,
+    slurm_job_response: SlurmJobResponse,
+    mocker,
+):
+    # GIVEN an analysis started with slurm which is not loaded in the session
+    analysis_service.job_service.slurm_service.client.get_job.return_value = slurm_job_response
+    analysis_id: int = slurm_analysis.id
+    session: Session = get_session()
+    session.commit()
+    session.expunge_all()
+    commit = mocker.spy(session(), "commit")
+
+    # WHEN updating the slurm analysis
+    with count_queries(session) as statements:
+        analysis_service.update_analysis_meta_data(analysis_id)
+
+    # THEN the analysis is loaded from the database once
+    assert len([statement for statement in statements if "FROM analysis" in statement]) == 1
+
+    # THEN the jobs, progress and status are committed together
+    assert commit.call_count == 1
+    analysis: Analysis = analysis_service.store.get_analysis_with_id(analysis_id)
+    assert analysis.jobs
+    assert analysis.status == TrailblazerStatus.COMPLETED
@@ -0,0 +1,93 @@
+"""A local HTTP server answering the Tower API endpoints used by Trailblazer."""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+WORKFLOW_ID_FILTER = re.compile(r"workflowId:(\S+)")
+
+
+class FakeTowerServer:
+    """Serve workflows and their tasks from memory and record the requested paths.
+
+    Workflows are given as workflow responses, with a workflow and its progress, by workflow id.
+    The workflow list honours the workflowId search filter unless the filter is disabled, in which
+    case the workflows are listed without their progress, like by Tower versions not listing it."""
+
+    def __init__(self, workflows: dict[str, dict], tasks: dict[str, list[dict]]):
+        self.workflows = workflows
+        self.tasks = tasks
+        self.supports_workflow_list = True
+        self.requests: list[str] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._get_handler())
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def get_response(self, path: str, query: dict[str, list[str]]) -> dict | None:
+        parts: list[str] = path.strip("/").split("/")
+        if parts == ["workflow"]:
+            return self._list_workflows(query)
+        if len(parts) == 2 and parts[0] == "workflow":
+            return self.workflows.get(parts[1])
+        if len(parts) == 3 and parts[0] == "workflow" and parts[2] == "tasks":
+            return self._get_tasks(workflow_id=parts[1], query=query)
+        return None
+
+    def _list_workflows(self, query: dict[str, list[str]]) -> dict:
+        search: str = query.get("search", [""])[0]
+        workflow_ids: list[str] = WORKFLOW_ID_FILTER.findall(search)
+        elements: list[dict] = [
+            self.workflows[workflow_id]
+            for workflow_id in workflow_ids
+            if workflow_id in self.workflows
+        ]
+        if not self.supports_workflow_list:
+            elements = [{"workflow": response["workflow"]} for response in self.workflows.values()]
+        return {"workflows": elements, "totalSize": len(elements)}
+
+    def _get_tasks(self, workflow_id: str, query: dict[str, list[str]]) -> dict | None:
+        if workflow_id not in self.tasks:
+            return None
+        tasks: list[dict] = self.tasks[workflow_id]
+        offset: int = int(query.get("offset", ["0"])[0])
+        page_size: int = int(query.get("max", [len(tasks)])[0])
+        return {"tasks": tasks[offset : offset + page_size], "total": len(tasks)}
+
+    def _get_handler(self) -> type[BaseHTTPRequestHandler]:
+        server: FakeTowerServer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                server.requests.append(url.path)
+                response: dict | None = server.get_response(
+                    path=url.path, query=parse_qs(url.query)
+                )
+                body: bytes = json.dumps(response).encode() if response is not None else b""
+                self.send_response(200 if response is not None else 404)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
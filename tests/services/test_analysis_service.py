@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import Mock, create_autospec
 
 import pytest
@@ -6,11 +8,15 @@ from sqlalchemy.orm import Session
 
 import trailblazer.services.analysis_service.analysis_service as service
 from tests.typed_mock import TypedMock, create_typed_mock
-from trailblazer.constants import TrailblazerStatus
+from trailblazer.constants import TrailblazerStatus, WorkflowManager
 from trailblazer.dto import AnalysisUpdateRequest
+from trailblazer.dto.summaries_request import SummariesRequest
+from trailblazer.dto.summaries_response import SummariesResponse
 from trailblazer.dto.update_analyses import AnalysisUpdate, UpdateAnalyses
+from trailblazer.exceptions import JobServiceError
 from trailblazer.services.analysis_service.analysis_service import AnalysisService
 from trailblazer.services.job_service.job_service import JobService
+from trailblazer.store.database import get_session
 from trailblazer.store.models import Analysis, User
 from trailblazer.store.store import Store
 
@@ -176,3 +182,170 @@ def test_update_analysis_meta_data(
     # THEN the analysis should be completed
     assert analysis_with_running_jobs.status == TrailblazerStatus.COMPLETED
     assert analysis_with_running_jobs.progress == 100
+
+
+def test_update_ongoing_analyses_with_failed_job_update(
+    analysis_service: AnalysisService,
+    analysis_with_running_jobs: Analysis,
+):
+    # GIVEN that the jobs of the other ongoing analyses are running
+    ongoing_analyses: list[Analysis] = analysis_service.store.get_ongoing_analyses()
+    analysis_service.job_service.get_analysis_statuses.return_value = (
+        {analysis.id: TrailblazerStatus.RUNNING for analysis in ongoing_analyses},
+        {},
+    )
+    analysis_service.job_service.get_analysis_progression.return_value = 0.5
+
+    # GIVEN that the jobs of an ongoing analysis could not be updated
+    analysis_service.job_service.update_jobs_for_analyses.return_value = {
+        analysis_with_running_jobs.id: JobServiceError("squeue failed")
+    }
+
+    # WHEN updating the ongoing analyses
+    analysis_service.update_ongoing_analyses()
+
+    # THEN the jobs of all ongoing analyses were updated in one batch
+    analysis_service.job_service.update_jobs_for_analyses.assert_called_once()
+
+    # THEN the analysis with the failed job update has status error
+    assert analysis_with_running_jobs.status == TrailblazerStatus.ERROR
+
+
+def test_update_ongoing_analyses_isolates_failed_analysis_writes(
+    analysis_service: AnalysisService, analysis_with_running_jobs: Analysis
+):
+    # GIVEN that the jobs of the ongoing analyses are running
+    ongoing_analyses: list[Analysis] = analysis_service.store.get_ongoing_analyses()
+    analysis_service.job_service.update_jobs_for_analyses.return_value = {}
+    analysis_service.job_service.get_analysis_statuses.return_value = (
+        {analysis.id: TrailblazerStatus.RUNNING for analysis in ongoing_analyses},
+        {},
+    )
+    failing_analysis_id: int = analysis_with_running_jobs.id
+    get_session().commit()
+
+    # GIVEN that the update of one of the analyses fails to flush
+    def get_analysis_progression(analysis_id: int) -> float:
+        if analysis_id == failing_analysis_id:
+            analysis_with_running_jobs.case_id = None
+        return 0.5
+
+    analysis_service.job_service.get_analysis_progression.side_effect = get_analysis_progression
+
+    # WHEN updating the ongoing analyses
+    analysis_service.update_ongoing_analyses()
+
+    # THEN the update of the failing analysis is rolled back
+    session: Session = get_session()
+    session.expunge_all()
+    failing_analysis: Analysis = analysis_service.store.get_analysis_with_id(failing_analysis_id)
+    assert failing_analysis.case_id
+    assert failing_analysis.progress != 0.5
+
+    # THEN the updates of the other analyses are stored
+    for analysis in analysis_service.store.get_ongoing_analyses():
+        if analysis.id != failing_analysis_id:
+            assert analysis.progress == 0.5
+            assert analysis.status == TrailblazerStatus.RUNNING
+
+
+def test_update_ongoing_analyses_backs_off_long_pending_analyses(
+    analysis_service: AnalysisService, analysis_with_running_jobs: Analysis
+):
+    # GIVEN an analysis which has been pending for hours and was scanned a few minutes ago
+    now = datetime.now()
+    analysis_with_running_jobs.status = TrailblazerStatus.PENDING
+    analysis_with_running_jobs.started_at = now - timedelta(hours=7)
+    analysis_with_running_jobs.scanned_at = now - timedelta(minutes=5)
+
+    # GIVEN that the jobs of the other ongoing analyses are running
+    ongoing_analyses: list[Analysis] = analysis_service.store.get_ongoing_analyses()
+    analysis_service.job_service.update_jobs_for_analyses.return_value = {}
+    analysis_service.job_service.get_analysis_statuses.return_value = (
+        {analysis.id: TrailblazerStatus.RUNNING for analysis in ongoing_analyses},
+        {},
+    )
+    analysis_service.job_service.get_analysis_progression.return_value = 0.5
+
+    # WHEN updating the ongoing analyses
+    analysis_service.update_ongoing_analyses()
+
+    # THEN the long pending analysis is not scanned
+    scanned_analyses: list[Analysis] = (
+        analysis_service.job_service.update_jobs_for_analyses.call_args.kwargs["analyses"]
+    )
+    assert analysis_with_running_jobs not in scanned_analyses
+    assert len(scanned_analyses) == len(ongoing_analyses) - 1
+    assert analysis_with_running_jobs.status == TrailblazerStatus.PENDING
+
+    # WHEN updating the ongoing analyses after the backoff interval
+    analysis_with_running_jobs.scanned_at = now - timedelta(hours=1)
+    analysis_service.update_ongoing_analyses()
+
+    # THEN the long pending analysis is scanned again
+    scanned_analyses = analysis_service.job_service.update_jobs_for_analyses.call_args.kwargs[
+        "analyses"
+    ]
+    assert analysis_with_running_jobs in scanned_analyses
+    assert analysis_with_running_jobs.scanned_at > now - timedelta(minutes=1)
+
+
+def test_get_analysis_fetches_tasks_of_ongoing_tower_analysis(
+    analysis_service: AnalysisService, analysis: Analysis
+):
+    # GIVEN a running Tower analysis
+    analysis.workflow_manager = WorkflowManager.TOWER
+
+    # WHEN getting the analysis
+    analysis_service.get_analysis(analysis.id)
+
+    # THEN its jobs are updated from the tasks of its workflow
+    analysis_service.job_service.update_jobs.assert_called_once_with(analysis.id)
+
+
+def test_get_analysis_when_tower_is_unavailable(
+    analysis_service: AnalysisService, analysis: Analysis
+):
+    # GIVEN a running Tower analysis whose tasks can not be fetched
+    analysis.workflow_manager = WorkflowManager.TOWER
+    analysis_service.job_service.update_jobs.side_effect = JobServiceError("Tower unavailable")
+
+    # WHEN getting the analysis
+    response = analysis_service.get_analysis(analysis.id)
+
+    # THEN the analysis is returned with its stored jobs
+    assert response.id == analysis.id
+
+
+def test_get_analysis_of_slurm_analysis(analysis_service: AnalysisService, analysis: Analysis):
+    # GIVEN a running SLURM analysis
+
+    # WHEN getting the analysis
+    analysis_service.get_analysis(analysis.id)
+
+    # THEN its jobs are not updated
+    analysis_service.job_service.update_jobs.assert_not_called()
+
+
+def test_get_summaries():
+    # GIVEN a store with a running and a delivered case in an order
+    store: Store = create_autospec(Store)
+    store.get_latest_analysis_statuses_for_orders.return_value = [
+        SimpleNamespace(order_id=1, case_id="running", status="running", is_delivered=False),
+        SimpleNamespace(order_id=1, case_id="delivered", status="qc", is_delivered=True),
+    ]
+    analysis_service = AnalysisService(store=store, job_service=create_autospec(JobService))
+
+    # WHEN getting the summaries of the order and an order without analyses
+    response: SummariesResponse = analysis_service.get_summaries(SummariesRequest(orderIds=["1,2"]))
+
+    # THEN the statuses of all orders are fetched in one call
+    store.get_latest_analysis_statuses_for_orders.assert_called_once_with([1, 2])
+
+    # THEN the analyses are summarised per order
+    summary_1, summary_2 = response.summaries
+    assert summary_1.total == 2
+    assert summary_1.running.case_ids == ["running"]
+    assert summary_1.delivered.case_ids == ["delivered"]
+    assert summary_2.order_id == 2
+    assert summary_2.total == 0
@@ -0,0 +1,86 @@
+import pytest
+from requests_mock import Mocker
+
+from trailblazer.services.user_verification_service.exc import GoogleCertsError
+from trailblazer.services.user_verification_service.google_certs_cache import (
+    GOOGLE_CERTS_URL,
+    GoogleCertsCache,
+    get_max_age,
+)
+
+
+@pytest.fixture
+def certs() -> dict[str, str]:
+    return {"key_1": "certificate_1"}
+
+
+def test_get_certs_is_cached_for_max_age(certs: dict[str, str]):
+    # GIVEN a certificates endpoint allowing the response to be cached
+    with Mocker() as mock:
+        mock.get(GOOGLE_CERTS_URL, json=certs, headers={"Cache-Control": "public, max-age=3600"})
+        cache = GoogleCertsCache()
+
+        # WHEN getting the certificates twice
+        cache.get_certs()
+        cached_certs = cache.get_certs()
+
+        # THEN the certificates were only fetched once
+        assert mock.call_count == 1
+        assert cached_certs == certs
+
+
+def test_get_certs_without_max_age_is_not_cached(certs: dict[str, str]):
+    # GIVEN a certificates endpoint without caching headers
+    with Mocker() as mock:
+        mock.get(GOOGLE_CERTS_URL, json=certs)
+        cache = GoogleCertsCache()
+
+        # WHEN getting the certificates twice
+        cache.get_certs()
+        cache.get_certs()
+
+        # THEN the certificates were fetched each time
+        assert mock.call_count == 2
+
+
+def test_get_certs_with_unknown_key_id_refreshes(certs: dict[str, str]):
+    # GIVEN cached certificates that do not contain a newly rotated key
+    with Mocker() as mock:
+        mock.get(
+            GOOGLE_CERTS_URL,
+            [
+                {"json": certs, "headers": {"Cache-Control": "max-age=3600"}},
+                {"json": certs | {"key_2": "certificate_2"}},
+            ],
+        )
+        cache = GoogleCertsCache(min_forced_refresh_interval=0)
+        cache.get_certs()
+
+        # WHEN getting the certificates for the new key
+        refreshed_certs = cache.get_certs_with_key_id("key_2")
+
+        # THEN the certificates were refreshed
+        assert "key_2" in refreshed_certs
+
+
+def test_get_certs_request_fails():
+    # GIVEN a failing certificates endpoint
+    with Mocker() as mock:
+        mock.get(GOOGLE_CERTS_URL, status_code=500)
+
+        # WHEN getting the certificates
+        # THEN an error is raised
+        with pytest.raises(GoogleCertsError):
+            GoogleCertsCache().get_certs()
+
+
+@pytest.mark.parametrize(
+    "cache_control, max_age",
+    [("public, max-age=19532, must-revalidate", 19532), ("no-cache", 0), ("", 0)],
+)
+def test_get_max_age(cache_control: str, max_age: int):
+    # GIVEN a Cache-Control header
+
+    # WHEN parsing the max age
+    # THEN the max age in seconds is returned
+    assert get_max_age(cache_control) == max_age
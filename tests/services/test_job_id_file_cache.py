@@ -0,0 +1,80 @@
+import os
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from trailblazer.constants import FileFormat
+from trailblazer.io.controller import ReadFile
+from trailblazer.services.slurm import job_id_file_cache
+from trailblazer.services.slurm.job_id_file_cache import JobIdFileCache, parse_job_ids
+
+JOB_ID_FILES: list[Path] = sorted(Path("tests/fixtures/case").glob("*_slurm_job_ids.yaml"))
+
+
+@pytest.mark.parametrize("job_id_file", JOB_ID_FILES, ids=lambda path: path.name)
+def test_parse_job_ids_matches_yaml_loader(job_id_file: Path):
+    # GIVEN a job id file
+
+    # WHEN parsing the job ids line by line
+    job_ids: list[int] | None = parse_job_ids(job_id_file.read_text())
+
+    # THEN the job ids are the same as when loading the file as YAML
+    content: dict = ReadFile.get_content_from_file(
+        file_format=FileFormat.YAML, file_path=job_id_file
+    )
+    assert job_ids == [int(job_id) for row in content.values() for job_id in row]
+
+
+def test_get_job_ids_with_flow_style_file(tmp_path: Path):
+    # GIVEN a job id file with the job ids in a flow style list
+    job_id_file: Path = tmp_path / "job_ids.yaml"
+    job_id_file.write_text("case: [1, '2']\n")
+
+    # WHEN getting the job ids
+    job_ids: list[int] = JobIdFileCache().get_job_ids(job_id_file)
+
+    # THEN the file is read with the YAML loader
+    assert job_ids == [1, 2]
+
+
+def test_get_job_ids_reads_unchanged_file_once(tmp_path: Path, mocker: MockerFixture):
+    # GIVEN a job id file
+    job_id_file: Path = tmp_path / "job_ids.yaml"
+    job_id_file.write_text("case:\n  - '1'\n")
+    read_job_ids = mocker.spy(job_id_file_cache, "read_job_ids")
+    cache = JobIdFileCache()
+
+    # WHEN getting the job ids twice
+    cache.get_job_ids(job_id_file)
+    job_ids: list[int] = cache.get_job_ids(job_id_file)
+
+    # THEN the file is only read once
+    assert job_ids == [1]
+    assert read_job_ids.call_count == 1
+
+    # WHEN the file is modified
+    job_id_file.write_text("case:\n  - '1'\n  - '2'\n")
+    os.utime(job_id_file, ns=(0, 0))
+    job_ids = cache.get_job_ids(job_id_file)
+
+    # THEN the file is read again
+    assert job_ids == [1, 2]
+    assert read_job_ids.call_count == 2
+
+
+def test_get_job_ids_evicts_least_recently_used_file(tmp_path: Path, mocker: MockerFixture):
+    # GIVEN a cache holding a single file
+    cache = JobIdFileCache(max_size=1)
+    first_file: Path = tmp_path / "first.yaml"
+    second_file: Path = tmp_path / "second.yaml"
+    for job_id_file in [first_file, second_file]:
+        job_id_file.write_text("case:\n  - '1'\n")
+    read_job_ids = mocker.spy(job_id_file_cache, "read_job_ids")
+
+    # WHEN getting the job ids of both files and then of the first file again
+    for job_id_file in [first_file, second_file, first_file]:
+        cache.get_job_ids(job_id_file)
+
+    # THEN the first file was evicted and read again
+    assert read_job_ids.call_count == 3
@@ -1,10 +1,15 @@
+from datetime import datetime
+
 import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.orm import Session
 
 from trailblazer.clients.tower.models import TowerWorkflowResponse
-from trailblazer.constants import TrailblazerStatus, WorkflowManager
-from trailblazer.exceptions import NoJobsError
+from trailblazer.constants import SlurmJobStatus, TrailblazerStatus, WorkflowManager
+from trailblazer.exceptions import JobServiceError, NoJobsError
 from trailblazer.services.job_service import JobService
-from trailblazer.store.models import Analysis
+from trailblazer.store.database import get_session
+from trailblazer.store.models import Analysis, Job
 
 
 def test_job_progression_completed(job_service: JobService, analysis_with_completed_jobs: Analysis):
@@ -95,3 +100,129 @@ def test_no_jobs_error_for_slurm_analysis(job_service: JobService, analysis_with
     # THEN a NoJobsError should be raised
     with pytest.raises(NoJobsError):
         job_service.get_analysis_status(analysis_without_jobs.id)
+
+
+def test_update_jobs_for_analyses_writes_slurm_and_tower_jobs(
+    job_service: JobService,
+    slurm_analysis: Analysis,
+    tower_analysis: Analysis,
+    mocker: MockerFixture,
+):
+    # GIVEN the jobs of a SLURM analysis and of a Tower analysis
+    workflow_updated_at = datetime(2023, 3, 30, 8, 8, 14)
+    mocker.patch.object(
+        job_service.slurm_service,
+        "get_jobs_for_analyses",
+        return_value=(
+            {slurm_analysis.id: ([Job(slurm_id=1, name="job", status="running")], "fingerprint")},
+            {},
+        ),
+    )
+    mocker.patch.object(
+        job_service.tower_service,
+        "get_jobs_for_analyses",
+        return_value=(
+            {
+                tower_analysis.id: (
+                    [Job(slurm_id=2, name="task", status="completed")],
+                    workflow_updated_at,
+                )
+            },
+            {},
+        ),
+    )
+
+    # WHEN updating the jobs of the analyses in a scan
+    with job_service.store.scan_context():
+        errors: dict[int, Exception] = job_service.update_jobs_for_analyses(
+            [slurm_analysis, tower_analysis]
+        )
+
+    # THEN the jobs of both analyses are written without errors
+    assert not errors
+    assert [job.slurm_id for job in slurm_analysis.jobs] == [1]
+    assert slurm_analysis.job_fingerprint == "fingerprint"
+    assert [job.slurm_id for job in tower_analysis.jobs] == [2]
+    assert tower_analysis.tower_workflow_updated_at == workflow_updated_at
+
+
+def test_update_jobs_for_analyses_isolates_failing_writes(
+    job_service: JobService,
+    slurm_analysis: Analysis,
+    tower_analysis: Analysis,
+    mocker: MockerFixture,
+):
+    # GIVEN the jobs of a SLURM analysis and of a Tower analysis
+    mocker.patch.object(
+        job_service.slurm_service,
+        "get_jobs_for_analyses",
+        return_value=(
+            {slurm_analysis.id: ([Job(slurm_id=1, name="job", status="running")], "fingerprint")},
+            {},
+        ),
+    )
+    mocker.patch.object(
+        job_service.tower_service,
+        "get_jobs_for_analyses",
+        return_value=(
+            {tower_analysis.id: ([Job(slurm_id=2, name="task", status="completed")], None)},
+            {},
+        ),
+    )
+
+    # GIVEN that storing the Tower jobs fails after they have been added
+    store_error = RuntimeError("Flush failed")
+
+    def store_jobs(analysis_id: int, jobs: list[Job], **kwargs) -> None:
+        job_service.store.replace_jobs(analysis_id=analysis_id, jobs=jobs)
+        raise store_error
+
+    mocker.patch.object(job_service.tower_service, "store_jobs", side_effect=store_jobs)
+
+    # WHEN updating the jobs of the analyses in a scan
+    with job_service.store.scan_context():
+        errors: dict[int, Exception] = job_service.update_jobs_for_analyses(
+            [slurm_analysis, tower_analysis]
+        )
+        session: Session = get_session()
+        session.rollback()
+
+    # THEN the failing analysis is returned as a job service error
+    assert list(errors) == [tower_analysis.id]
+    assert isinstance(errors[tower_analysis.id], JobServiceError)
+
+    # THEN the jobs of the other analysis are committed and those of the failing one are not
+    assert [job.slurm_id for job in slurm_analysis.jobs] == [1]
+    assert slurm_analysis.jobs[0].status == SlurmJobStatus.RUNNING
+    assert not tower_analysis.jobs
+
+
+def test_update_jobs_for_analyses_returns_lookup_errors_as_job_service_errors(
+    job_service: JobService,
+    slurm_analysis: Analysis,
+    tower_analysis: Analysis,
+    mocker: MockerFixture,
+):
+    # GIVEN that the jobs of a SLURM analysis and of a Tower analysis could not be fetched
+    slurm_error = RuntimeError("squeue failed")
+    tower_error = RuntimeError("Tower unavailable")
+    mocker.patch.object(
+        job_service.slurm_service,
+        "get_jobs_for_analyses",
+        return_value=({}, {slurm_analysis.id: slurm_error}),
+    )
+    mocker.patch.object(
+        job_service.tower_service,
+        "get_jobs_for_analyses",
+        return_value=({}, {tower_analysis.id: tower_error}),
+    )
+
+    # WHEN updating the jobs of the analyses
+    errors: dict[int, Exception] = job_service.update_jobs_for_analyses(
+        [slurm_analysis, tower_analysis]
+    )
+
+    # THEN the errors are returned as job service errors per analysis
+    assert set(errors) == {slurm_analysis.id, tower_analysis.id}
+    assert all(isinstance(error, JobServiceError) for error in errors.values())
+    assert errors[slurm_analysis.id].args == (slurm_error,)
@@ -0,0 +1,157 @@
+from pathlib import Path
+from unittest.mock import create_autospec
+
+from sqlalchemy.orm import Session
+
+from trailblazer.clients.slurm_api_client.dto import SlurmJobsResponse
+from trailblazer.clients.slurm_api_client.dto.common import SlurmAPIJobInfo
+from trailblazer.clients.slurm_api_client.slurm_api_client import SlurmAPIClient
+from trailblazer.constants import SlurmJobStatus
+from trailblazer.exc import MissingJob
+from trailblazer.services.slurm.slurm_api_service.slurm_api_service import SlurmAPIService
+from trailblazer.services.slurm.slurm_api_service.utils import create_job_info_dto_from_job
+from trailblazer.services.slurm.utils import get_jobs_fingerprint
+from trailblazer.store.database import get_session
+from trailblazer.store.models import Analysis, Job
+from trailblazer.store.store import Store
+
+
+def test_get_jobs_for_analyses(
+    analysis_store: Store, slurm_analysis: Analysis, analysis_without_jobs: Analysis
+):
+    # GIVEN a SLURM analysis with a job id file and an analysis with a missing job id file
+
+    # GIVEN a SLURM controller with the job of the first analysis and an unrelated job
+    job = SlurmAPIJobInfo(job_id=6123780, job_state=["RUNNING"], name="job")
+    client: SlurmAPIClient = create_autospec(SlurmAPIClient)
+    client.get_jobs.return_value = SlurmJobsResponse(
+        jobs=[job, SlurmAPIJobInfo(job_id=1, job_state=["RUNNING"], name="other job")]
+    )
+    service = SlurmAPIService(client=client, store=analysis_store)
+
+    # WHEN getting the jobs of both analyses
+    jobs_per_analysis, errors = service.get_jobs_for_analyses(
+        [slurm_analysis.id, analysis_without_jobs.id]
+    )
+
+    # THEN the jobs were fetched in a single request
+    client.get_jobs.assert_called_once()
+    client.get_job.assert_not_called()
+
+    # THEN only the job of the first analysis is returned, with the fingerprint of its state
+    jobs, fingerprint = jobs_per_analysis[slurm_analysis.id]
+    assert list(jobs_per_analysis) == [slurm_analysis.id]
+    assert [job.slurm_id for job in jobs] == [6123780]
+    assert jobs[0].status == SlurmJobStatus.RUNNING
+    assert fingerprint == get_jobs_fingerprint([create_job_info_dto_from_job(job)])
+
+    # THEN only the analysis with the missing job id file failed
+    assert list(errors) == [analysis_without_jobs.id]
+
+
+def test_get_jobs_for_analyses_without_jobs_in_controller(
+    analysis_store: Store, slurm_analysis: Analysis
+):
+    # GIVEN a SLURM controller without the jobs of the analysis
+    client: SlurmAPIClient = create_autospec(SlurmAPIClient)
+    client.get_jobs.return_value = SlurmJobsResponse(jobs=[])
+    service = SlurmAPIService(client=client, store=analysis_store)
+
+    # WHEN getting the jobs of the analysis
+    jobs_per_analysis, errors = service.get_jobs_for_analyses([slurm_analysis.id])
+
+    # THEN no jobs are returned and the analysis failed with a missing job error
+    assert not jobs_per_analysis
+    assert isinstance(errors[slurm_analysis.id], MissingJob)
+
+
+def test_get_jobs_for_analyses_ignores_unrelated_jobs_in_unknown_states(
+    analysis_store: Store, slurm_analysis: Analysis
+):
+    # GIVEN a SLURM controller with the job of the analysis and an unrelated timed out job
+    client: SlurmAPIClient = create_autospec(SlurmAPIClient)
+    client.get_jobs.return_value = SlurmJobsResponse(
+        jobs=[
+            SlurmAPIJobInfo(job_id=6123780, job_state=["RUNNING"], name="job"),
+            SlurmAPIJobInfo(job_id=1, job_state=["TIMEOUT"], name="other job"),
+        ]
+    )
+    service = SlurmAPIService(client=client, store=analysis_store)
+
+    # WHEN getting the jobs of the analysis
+    jobs_per_analysis, errors = service.get_jobs_for_analyses([slurm_analysis.id])
+
+    # THEN the jobs of the analysis are returned without errors
+    assert not errors
+    jobs, _ = jobs_per_analysis[slurm_analysis.id]
+    assert [job.slurm_id for job in jobs] == [6123780]
+
+
+def test_get_jobs_for_analyses_returns_job_conversion_errors_per_analysis(
+    analysis_store: Store, slurm_analysis: Analysis
+):
+    # GIVEN a SLURM controller with the job of the analysis in a state unknown to Trailblazer
+    client: SlurmAPIClient = create_autospec(SlurmAPIClient)
+    client.get_jobs.return_value = SlurmJobsResponse(
+        jobs=[SlurmAPIJobInfo(job_id=6123780, job_state=["TIMEOUT"], name="job")]
+    )
+    service = SlurmAPIService(client=client, store=analysis_store)
+
+    # WHEN getting the jobs of the analysis
+    jobs_per_analysis, errors = service.get_jobs_for_analyses([slurm_analysis.id])
+
+    # THEN no jobs are returned and the conversion error is returned for the analysis
+    assert not jobs_per_analysis
+    assert isinstance(errors[slurm_analysis.id], KeyError)
+
+
+def test_get_jobs_for_analyses_skips_unchanged_jobs(
+    analysis_store: Store, slurm_analysis: Analysis
+):
+    # GIVEN a SLURM controller with the job of the analysis
+    client: SlurmAPIClient = create_autospec(SlurmAPIClient)
+    client.get_jobs.return_value = SlurmJobsResponse(
+        jobs=[SlurmAPIJobInfo(job_id=6123780, job_state=["RUNNING"], name="job")]
+    )
+    service = SlurmAPIService(client=client, store=analysis_store)
+
+    # GIVEN that the fingerprint of the current job states is stored for the analysis
+    _, fingerprint = service.get_jobs_for_analyses([slurm_analysis.id])[0][slurm_analysis.id]
+    slurm_analysis.job_fingerprint = fingerprint
+
+    # WHEN getting the jobs of the analysis again
+    jobs_per_analysis, errors = service.get_jobs_for_analyses([slurm_analysis.id])
+
+    # THEN the unchanged analysis is left out
+    assert not jobs_per_analysis
+    assert not errors
+
+
+def test_get_jobs_for_analyses_keeps_jobs_missing_from_controller(
+    analysis_store: Store, slurm_analysis: Analysis, tmp_path: Path
+):
+    # GIVEN a SLURM analysis with two jobs, of which the completed one is stored
+    config_path = Path(tmp_path, "two_jobs.yaml")
+    config_path.write_text("---\ncase_id:\n- '1'\n- '2'\n")
+    slurm_analysis.config_path = str(config_path)
+    slurm_analysis.jobs.append(Job(slurm_id=1, name="job", status=SlurmJobStatus.COMPLETED))
+    session: Session = get_session()
+    session.commit()
+
+    # GIVEN a SLURM controller from which the completed job has aged out
+    client: SlurmAPIClient = create_autospec(SlurmAPIClient)
+    client.get_jobs.return_value = SlurmJobsResponse(
+        jobs=[SlurmAPIJobInfo(job_id=2, job_state=["RUNNING"], name="job")]
+    )
+    service = SlurmAPIService(client=client, store=analysis_store)
+
+    # WHEN getting the jobs of the analysis
+    jobs_per_analysis, errors = service.get_jobs_for_analyses([slurm_analysis.id])
+
+    # THEN the stored job is returned as stored next to the job in the controller
+    assert not errors
+    jobs, _ = jobs_per_analysis[slurm_analysis.id]
+    assert {job.slurm_id: job.status for job in jobs} == {
+        1: SlurmJobStatus.COMPLETED,
+        2: SlurmJobStatus.RUNNING,
+    }
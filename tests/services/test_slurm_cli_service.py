@@ -0,0 +1,148 @@
+from unittest.mock import Mock, create_autospec
+
+import pytest
+from pytest_mock import MockerFixture
+
+from trailblazer.clients.slurm_cli_client.models import SqueueJob
+from trailblazer.clients.slurm_cli_client.slurm_cli_client import SlurmCLIClient
+from trailblazer.constants import SlurmJobStatus
+from trailblazer.exc import CancelSlurmJobsError
+from trailblazer.services.slurm.slurm_cli_service import slurm_cli_service
+from trailblazer.services.slurm.slurm_cli_service.slurm_cli_service import SlurmCLIService
+from trailblazer.store.models import Analysis
+from trailblazer.store.store import Store
+
+
+def create_squeue_job(job_id: int, status: str) -> SqueueJob:
+    return SqueueJob(
+        JOBID=job_id,
+        NAME="job",
+        STATE=status,
+        TIME_LIMIT="10:00:00",
+        TIME="0:19",
+        START_TIME="N/A",
+    )
+
+
+def test_get_jobs_for_analyses(
+    analysis_store: Store, slurm_analysis: Analysis, analysis_without_jobs: Analysis
+):
+    # GIVEN a SLURM analysis with a job id file and an analysis with a missing job id file
+
+    # GIVEN a SLURM queue with the job of the first analysis
+    client: SlurmCLIClient = create_autospec(SlurmCLIClient)
+    client.get_slurm_jobs.return_value = ([create_squeue_job(job_id=6123780, status="RUNNING")], {})
+    service = SlurmCLIService(client=client, store=analysis_store)
+
+    # WHEN getting the jobs of both analyses
+    jobs_per_analysis, errors = service.get_jobs_for_analyses(
+        [slurm_analysis.id, analysis_without_jobs.id]
+    )
+
+    # THEN the queue was queried once
+    client.get_slurm_jobs.assert_called_once_with([6123780])
+
+    # THEN the jobs of the first analysis are returned with a fingerprint of their state
+    jobs, fingerprint = jobs_per_analysis[slurm_analysis.id]
+    assert list(jobs_per_analysis) == [slurm_analysis.id]
+    assert jobs[0].status == SlurmJobStatus.RUNNING
+    assert fingerprint
+
+    # THEN only the analysis with the missing job id file failed
+    assert list(errors) == [analysis_without_jobs.id]
+
+
+def test_get_jobs_for_analyses_with_invalid_job(analysis_store: Store, slurm_analysis: Analysis):
+    # GIVEN a SLURM analysis whose job could not be parsed from the queue
+    client: SlurmCLIClient = create_autospec(SlurmCLIClient)
+    job_error = ValueError("Unknown job state OUT_OF_MEMORY")
+    client.get_slurm_jobs.return_value = ([], {6123780: job_error})
+    service = SlurmCLIService(client=client, store=analysis_store)
+
+    # WHEN getting the jobs of the analysis
+    jobs_per_analysis, errors = service.get_jobs_for_analyses([slurm_analysis.id])
+
+    # THEN no jobs are returned and the analysis failed with the error of its job
+    assert not jobs_per_analysis
+    assert errors == {slurm_analysis.id: job_error}
+
+
+def test_get_jobs_for_analyses_with_failing_queue(analysis_store: Store, slurm_analysis: Analysis):
+    # GIVEN a SLURM queue which can not be queried
+    client: SlurmCLIClient = create_autospec(SlurmCLIClient)
+    queue_error = RuntimeError("squeue failed")
+    client.get_slurm_jobs.side_effect = queue_error
+    service = SlurmCLIService(client=client, store=analysis_store)
+
+    # WHEN getting the jobs of the analysis
+    jobs_per_analysis, errors = service.get_jobs_for_analyses([slurm_analysis.id])
+
+    # THEN the failure is reported against the analysis
+    assert not jobs_per_analysis
+    assert errors == {slurm_analysis.id: queue_error}
+
+
+def test_get_jobs_for_analyses_skips_unchanged_jobs(
+    analysis_store: Store, slurm_analysis: Analysis
+):
+    # GIVEN a SLURM analysis whose job fingerprint matches the queue
+    client: SlurmCLIClient = create_autospec(SlurmCLIClient)
+    client.get_slurm_jobs.return_value = ([create_squeue_job(job_id=6123780, status="PENDING")], {})
+    service = SlurmCLIService(client=client, store=analysis_store)
+    _, fingerprint = service.get_jobs_for_analyses([slurm_analysis.id])[0][slurm_analysis.id]
+    slurm_analysis.job_fingerprint = fingerprint
+
+    # WHEN getting the jobs again while the queue is unchanged
+    jobs_per_analysis, errors = service.get_jobs_for_analyses([slurm_analysis.id])
+
+    # THEN the analysis is left out
+    assert not errors
+    assert not jobs_per_analysis
+
+    # WHEN the state of the job changes
+    client.get_slurm_jobs.return_value = ([create_squeue_job(job_id=6123780, status="RUNNING")], {})
+    jobs_per_analysis, errors = service.get_jobs_for_analyses([slurm_analysis.id])
+
+    # THEN the changed jobs are returned with a new fingerprint
+    jobs, new_fingerprint = jobs_per_analysis[slurm_analysis.id]
+    assert jobs[0].status == SlurmJobStatus.RUNNING
+    assert new_fingerprint != fingerprint
+
+
+def test_cancel_jobs(analysis_store: Store, slurm_analysis: Analysis, mocker: MockerFixture):
+    # GIVEN a SLURM analysis with a running job which is cancelled after a while
+    client: SlurmCLIClient = create_autospec(SlurmCLIClient)
+    client.cancel_jobs.return_value = {}
+    client.get_slurm_jobs.side_effect = [
+        ([create_squeue_job(job_id=6123780, status="RUNNING")], {}),
+        ([create_squeue_job(job_id=6123780, status="CANCELLED")], {}),
+    ]
+    sleep: Mock = mocker.patch.object(slurm_cli_service.time, "sleep")
+    service = SlurmCLIService(client=client, store=analysis_store)
+
+    # WHEN cancelling the jobs of the analysis
+    service.cancel_jobs(slurm_analysis.id)
+
+    # THEN all jobs were cancelled in one call
+    client.cancel_jobs.assert_called_once_with([6123780])
+
+    # THEN the queue was polled until the job stopped
+    assert client.get_slurm_jobs.call_count == 2
+    sleep.assert_called_once()
+
+
+def test_cancel_jobs_still_running(
+    analysis_store: Store, slurm_analysis: Analysis, mocker: MockerFixture
+):
+    # GIVEN a SLURM analysis with a job which could not be cancelled
+    client: SlurmCLIClient = create_autospec(SlurmCLIClient)
+    client.cancel_jobs.return_value = {6123780: "Access/permission denied"}
+    client.get_slurm_jobs.return_value = ([create_squeue_job(job_id=6123780, status="RUNNING")], {})
+    mocker.patch.object(slurm_cli_service.time, "sleep")
+    mocker.patch.object(slurm_cli_service.time, "monotonic", side_effect=[0, 0, 1000])
+    service = SlurmCLIService(client=client, store=analysis_store)
+
+    # WHEN cancelling the jobs of the analysis
+    # THEN the jobs which could not be cancelled are reported
+    with pytest.raises(CancelSlurmJobsError, match="6123780: Access/permission denied"):
+        service.cancel_jobs(slurm_analysis.id)
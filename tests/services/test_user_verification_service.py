@@ -0,0 +1,98 @@
+import time
+from unittest.mock import create_autospec
+
+import pytest
+from pytest_mock import MockerFixture
+
+from trailblazer.services.user_verification_service.google_certs_cache import GoogleCertsCache
+from trailblazer.services.user_verification_service.user_verification_service import (
+    UserVerificationService,
+)
+from trailblazer.services.user_verification_service.verified_token_cache import (
+    VerifiedTokenCache,
+)
+from trailblazer.store.models import User
+from trailblazer.store.store import Store
+
+JWT_MODULE = "trailblazer.services.user_verification_service.user_verification_service.jwt"
+
+
+@pytest.fixture
+def user_verification_service(user_store: Store) -> UserVerificationService:
+    return UserVerificationService(
+        store=user_store,
+        oauth_client_id="client_id",
+        certs_cache=create_autospec(GoogleCertsCache),
+        token_cache=VerifiedTokenCache(),
+    )
+
+
+def test_verify_user_caches_verified_token(
+    user_verification_service: UserVerificationService, user_email: str, mocker: MockerFixture
+):
+    # GIVEN a valid token
+    jwt = mocker.patch(JWT_MODULE)
+    jwt.decode.return_value = {"email": user_email, "exp": time.time() + 3600}
+
+    # WHEN verifying the user with the same token twice
+    user_verification_service.verify_user("Bearer token")
+    user: User = user_verification_service.verify_user("Bearer token")
+
+    # THEN the token was only decoded once
+    assert jwt.decode.call_count == 1
+    assert user.email == user_email
+
+
+def test_verify_user_does_not_cache_expired_token(
+    user_verification_service: UserVerificationService, user_email: str, mocker: MockerFixture
+):
+    # GIVEN a token which has expired once verified
+    jwt = mocker.patch(JWT_MODULE)
+    jwt.decode.return_value = {"email": user_email, "exp": time.time() - 1}
+
+    # WHEN verifying the user with the same token twice
+    user_verification_service.verify_user("Bearer token")
+    user_verification_service.verify_user("Bearer token")
+
+    # THEN the token was decoded each time
+    assert jwt.decode.call_count == 2
+
+
+def test_verify_user_archived_after_caching(
+    user_verification_service: UserVerificationService,
+    user_store: Store,
+    user_email: str,
+    mocker: MockerFixture,
+):
+    # GIVEN a cached token of a user
+    jwt = mocker.patch(JWT_MODULE)
+    jwt.decode.return_value = {"email": user_email, "exp": time.time() + 3600}
+    user: User = user_verification_service.verify_user("Bearer token")
+
+    # GIVEN that the user is archived
+    user_store.update_user_is_archived(user=user, archive=True)
+
+    # WHEN verifying the user with the cached token
+    # THEN the user is rejected
+    with pytest.raises(ValueError):
+        user_verification_service.verify_user("Bearer token")
+
+    # THEN the tokens of the user are removed from the cache
+    assert not user_verification_service.token_cache.get("token")
+
+
+def test_verified_token_cache_evicts_least_recently_used():
+    # GIVEN a full token cache
+    cache = VerifiedTokenCache(max_size=2)
+    claims: dict = {"exp": time.time() + 3600}
+    cache.add(jwt_token="first", claims=claims, user_id=1)
+    cache.add(jwt_token="second", claims=claims, user_id=2)
+    cache.get("first")
+
+    # WHEN adding another token
+    cache.add(jwt_token="third", claims=claims, user_id=3)
+
+    # THEN the least recently used token is evicted
+    assert cache.get("first")
+    assert not cache.get("second")
+    assert cache.get("third")
@@ -3,7 +3,14 @@ from pathlib import Path
 import pytest
 from sqlalchemy.orm import Session
 
-from trailblazer.clients.tower.models import TaskWrapper, TowerTask, TowerTasksResponse
+from trailblazer.clients.tower.models import (
+    TaskWrapper,
+    TowerProgress,
+    TowerTask,
+    TowerTasksResponse,
+    TowerWorkflow,
+    TowerWorkflowResponse,
+)
 from trailblazer.constants import (
     PRIORITY_OPTIONS,
     TYPES,
@@ -56,3 +63,13 @@ def tower_tasks_response():
 
     task_wrapper = TaskWrapper(task=task)
     return TowerTasksResponse(tasks=[task_wrapper], total=1)
+
+
+@pytest.fixture
+def tower_completed_workflow_response() -> TowerWorkflowResponse:
+    workflow = TowerWorkflow(status="SUCCEEDED")
+    progress = TowerProgress(
+        workflowProgress={},
+        processesProgress=[{"process": "example_process", "succeeded": 1}],
+    )
+    return TowerWorkflowResponse(workflow=workflow, progress=progress)
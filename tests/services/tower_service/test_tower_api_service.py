@@ -1,20 +1,271 @@
-from trailblazer.clients.tower.models import TowerTasksResponse
+from datetime import datetime
+
+from pytest_mock import MockerFixture
+from sqlalchemy.orm import Session
+
+from tests.mocks.fake_tower_server import FakeTowerServer
+from trailblazer.clients.tower.tower_client import TowerAPIClient
+
+from trailblazer.clients.tower.models import TowerTasksResponse, TowerWorkflowResponse
+from trailblazer.constants import TrailblazerStatus
 from trailblazer.services.tower.tower_api_service import TowerAPIService
+from trailblazer.store.database import get_session
 from trailblazer.store.models import Analysis
+from trailblazer.store.store import Store
 
 
 def test_update_jobs(
     tower_service: TowerAPIService,
     tower_analysis: Analysis,
     tower_tasks_response: TowerTasksResponse,
+    tower_workflow_response: TowerWorkflowResponse,
 ):
     # GIVEN an analysis started in tower without any jobs
 
     # GIVEN that some tasks for it have started running
-    tower_service.client.get_tasks.return_value = tower_tasks_response
+    tower_service.client.get_workflow.return_value = tower_workflow_response
+    tower_service.client.get_all_tasks.return_value = tower_tasks_response.get_tasks()
 
     # WHEN updating the jobs
     tower_service.update_jobs(tower_analysis.id)
 
     # THEN the jobs should be updated
     assert tower_analysis.jobs
+
+
+def test_update_jobs_skips_unchanged_workflow(
+    tower_service: TowerAPIService,
+    tower_analysis: Analysis,
+    tower_workflow_response: TowerWorkflowResponse,
+    mocker: MockerFixture,
+):
+    # GIVEN a running workflow not updated since the jobs of the analysis were stored
+    last_updated = datetime(2023, 3, 30, 8, 8, 14)
+    tower_analysis.tower_workflow_updated_at = last_updated
+    tower_workflow_response.workflow.lastUpdated = last_updated
+    tower_service.client.get_workflow.return_value = tower_workflow_response
+    replace_jobs = mocker.spy(tower_service.store, "replace_jobs")
+
+    # WHEN updating the jobs
+    tower_service.update_jobs(tower_analysis.id)
+
+    # THEN the tasks are not fetched and the jobs are not written
+    tower_service.client.get_all_tasks.assert_not_called()
+    replace_jobs.assert_not_called()
+
+
+def test_get_jobs_for_analyses(
+    tower_service: TowerAPIService,
+    tower_analysis: Analysis,
+    tower_tasks_response: TowerTasksResponse,
+    tower_completed_workflow_response: TowerWorkflowResponse,
+):
+    # GIVEN an analysis started in tower without any jobs
+
+    # GIVEN that its workflow has completed
+    tower_service.client.get_workflow.return_value = tower_completed_workflow_response
+    tower_service.client.get_all_tasks.return_value = tower_tasks_response.get_tasks()
+
+    # WHEN getting the jobs of the analyses concurrently
+    jobs_per_analysis, errors = tower_service.get_jobs_for_analyses(
+        analysis_ids=[tower_analysis.id], max_workers=2
+    )
+
+    # THEN the jobs of the tasks are returned without errors
+    jobs, _ = jobs_per_analysis[tower_analysis.id]
+    assert len(jobs) == len(tower_tasks_response.get_tasks())
+    assert not errors
+
+    # THEN the jobs are not written
+    assert not tower_analysis.jobs
+
+
+def test_get_jobs_for_analyses_returns_workflow_update_time(
+    tower_service: TowerAPIService,
+    tower_analysis: Analysis,
+    tower_tasks_response: TowerTasksResponse,
+    tower_completed_workflow_response: TowerWorkflowResponse,
+):
+    # GIVEN a completed workflow updated since the analysis was last scanned
+    last_updated = datetime(2023, 3, 30, 8, 8, 14)
+    tower_completed_workflow_response.workflow.lastUpdated = last_updated
+    tower_service.client.get_workflow.return_value = tower_completed_workflow_response
+    tower_service.client.get_all_tasks.return_value = tower_tasks_response.get_tasks()
+
+    # WHEN getting the jobs of the analyses
+    jobs_per_analysis, _ = tower_service.get_jobs_for_analyses(
+        analysis_ids=[tower_analysis.id], max_workers=1
+    )
+
+    # THEN the tasks are fetched and the update time of the workflow is returned with the jobs
+    tower_service.client.get_all_tasks.assert_called_once()
+    _, workflow_updated_at = jobs_per_analysis[tower_analysis.id]
+    assert workflow_updated_at == last_updated
+
+
+def test_store_jobs_stores_workflow_update_time(
+    tower_service: TowerAPIService, tower_analysis: Analysis
+):
+    # GIVEN the update time of the workflow of an analysis
+    last_updated = datetime(2023, 3, 30, 8, 8, 14)
+
+    # WHEN storing the jobs of the analysis
+    tower_service.store_jobs(
+        analysis_id=tower_analysis.id, jobs=[], workflow_updated_at=last_updated
+    )
+
+    # THEN the update time of the workflow is stored
+    assert tower_analysis.tower_workflow_updated_at == last_updated
+
+
+def test_get_jobs_for_analyses_skips_unchanged_workflows(
+    tower_service: TowerAPIService,
+    tower_analysis: Analysis,
+    tower_completed_workflow_response: TowerWorkflowResponse,
+):
+    # GIVEN a completed workflow not updated since the jobs of the analysis were stored
+    last_updated = datetime(2023, 3, 30, 8, 8, 14)
+    tower_analysis.tower_workflow_updated_at = last_updated
+    tower_completed_workflow_response.workflow.lastUpdated = last_updated
+    tower_service.client.get_workflow.return_value = tower_completed_workflow_response
+
+    # WHEN getting the jobs and the statuses of the analyses in a scan
+    with tower_service.keep_workflows():
+        jobs_per_analysis, errors = tower_service.get_jobs_for_analyses(
+            analysis_ids=[tower_analysis.id], max_workers=1
+        )
+        statuses, _ = tower_service.get_statuses(analysis_ids=[tower_analysis.id], max_workers=1)
+
+    # THEN the analysis is left out and the tasks are not fetched
+    assert not jobs_per_analysis
+    assert not errors
+    tower_service.client.get_all_tasks.assert_not_called()
+
+    # THEN the status is taken from the workflow fetched when updating the jobs
+    tower_service.client.get_workflow.assert_called_once()
+    assert statuses[tower_analysis.id] == TrailblazerStatus.QC
+
+
+def test_get_jobs_for_analyses_skips_tasks_of_running_workflows(
+    tower_service: TowerAPIService,
+    tower_analysis: Analysis,
+    tower_workflow_response: TowerWorkflowResponse,
+):
+    # GIVEN a running workflow with one of two tasks succeeded
+    tower_service.client.get_workflow.return_value = tower_workflow_response
+
+    # WHEN getting the jobs and the progress of the analyses in a scan
+    with tower_service.keep_workflows():
+        jobs_per_analysis, errors = tower_service.get_jobs_for_analyses(
+            analysis_ids=[tower_analysis.id], max_workers=1
+        )
+        progress: float = tower_service.get_progress(tower_analysis.id)
+
+    # THEN no jobs are returned and the tasks are not fetched
+    assert not jobs_per_analysis
+    assert not errors
+    tower_service.client.get_all_tasks.assert_not_called()
+
+    # THEN the progress is derived from the processes of the workflow fetched once
+    assert progress == 0.5
+    tower_service.client.get_workflow.assert_called_once()
+
+
+def test_get_jobs_for_analyses_fetches_tasks_of_running_workflows_with_failed_tasks(
+    tower_service: TowerAPIService,
+    tower_analysis: Analysis,
+    tower_tasks_response: TowerTasksResponse,
+    tower_workflow_response: TowerWorkflowResponse,
+):
+    # GIVEN a running workflow with a failed task
+    tower_workflow_response.progress.processes_progress[0]["failed"] = 1
+    tower_service.client.get_workflow.return_value = tower_workflow_response
+    tower_service.client.get_all_tasks.return_value = tower_tasks_response.get_tasks()
+
+    # WHEN getting the jobs of the analyses
+    jobs_per_analysis, errors = tower_service.get_jobs_for_analyses(
+        analysis_ids=[tower_analysis.id], max_workers=1
+    )
+
+    # THEN the tasks are fetched to record the failed jobs
+    assert not errors
+    tower_service.client.get_all_tasks.assert_called_once()
+    jobs, _ = jobs_per_analysis[tower_analysis.id]
+    assert jobs
+
+
+def test_workflows_are_forgotten_after_a_scan(
+    tower_service: TowerAPIService,
+    tower_analysis: Analysis,
+    tower_tasks_response: TowerTasksResponse,
+    tower_workflow_response: TowerWorkflowResponse,
+):
+    # GIVEN a running workflow
+    tower_service.client.get_workflow.return_value = tower_workflow_response
+    tower_service.client.get_all_tasks.return_value = tower_tasks_response.get_tasks()
+
+    # GIVEN that the analysis has been scanned and its jobs updated outside a scan
+    with tower_service.keep_workflows():
+        tower_service.get_jobs_for_analyses(analysis_ids=[tower_analysis.id], max_workers=1)
+    tower_service.update_jobs(tower_analysis.id)
+
+    # WHEN getting the progress of the analysis
+    tower_service.get_progress(tower_analysis.id)
+
+    # THEN no workflow is kept and the workflow is fetched again
+    assert tower_service.workflows is None
+    assert tower_service.client.get_workflow.call_count == 3
+
+
+def test_get_statuses_of_many_analyses_in_one_request(
+    store: Store, tower_analysis: Analysis, fake_tower_server: FakeTowerServer
+):
+    # GIVEN two analyses with running workflows on a Tower server
+    other_analysis = Analysis(
+        case_id="other_case_id",
+        workflow_manager=tower_analysis.workflow_manager,
+        status=tower_analysis.status,
+        tower_workflow_id="workflow_2",
+    )
+    tower_analysis.tower_workflow_id = "workflow_1"
+    session: Session = get_session()
+    session.add(other_analysis)
+    session.commit()
+    analysis_ids: list[int] = [tower_analysis.id, other_analysis.id]
+    client = TowerAPIClient(
+        base_url=fake_tower_server.base_url, access_token="token", workspace_id="workspace_id"
+    )
+    service = TowerAPIService(client=client, store=store)
+
+    # WHEN getting the jobs and the statuses of the analyses in a scan
+    with service.keep_workflows():
+        _, errors = service.get_jobs_for_analyses(analysis_ids=analysis_ids, max_workers=2)
+        statuses, status_errors = service.get_statuses(analysis_ids=analysis_ids, max_workers=2)
+
+    # THEN the status of both analyses is resolved
+    assert not errors and not status_errors
+    assert statuses == {analysis_id: TrailblazerStatus.RUNNING for analysis_id in analysis_ids}
+
+    # THEN the workflows are resolved with a single request
+    assert fake_tower_server.requests == ["/workflow"]
+
+
+def test_get_workflows_falls_back_to_fetching_each_workflow(
+    store: Store, tower_analysis: Analysis, fake_tower_server: FakeTowerServer
+):
+    # GIVEN a Tower server which does not list the progress of workflows
+    fake_tower_server.supports_workflow_list = False
+    client = TowerAPIClient(
+        base_url=fake_tower_server.base_url, access_token="token", workspace_id="workspace_id"
+    )
+    service = TowerAPIService(client=client, store=store)
+
+    # WHEN getting the workflows of analyses
+    workflows, errors = service.get_workflows(
+        workflow_ids={tower_analysis.id: "workflow_1"}, max_workers=2
+    )
+
+    # THEN the workflow is fetched on its own after listing the workflows
+    assert not errors
+    assert workflows[tower_analysis.id].workflow.status == "RUNNING"
+    assert fake_tower_server.requests == ["/workflow", "/workflow/workflow_1"]
@@ -1,10 +1,13 @@
 from sqlalchemy import inspect
+from sqlalchemy.orm import Session
 
 from tests.mocks.store_mock import MockStore
-from trailblazer.constants import TrailblazerPriority, TrailblazerTypes
+from tests.store.utils.store_helper import StoreHelpers
+from trailblazer.constants import JobType, SlurmJobStatus, TrailblazerPriority, TrailblazerTypes
 from trailblazer.dto.create_analysis_request import CreateAnalysisRequest
+from trailblazer.store.database import get_session
 from trailblazer.store.filters.user_filters import UserFilter, apply_user_filter
-from trailblazer.store.models import Analysis, User
+from trailblazer.store.models import Analysis, Job, User
 
 
 def test_add_user(store: MockStore, user_email: str, username: str):
@@ -39,3 +42,70 @@ def test_add_pending_analysis(store: MockStore):
 
     # THEN an analysis has been created and persisted to the database
     assert inspect(analysis).persistent
+
+
+def test_replace_jobs(analysis_store: MockStore):
+    # GIVEN an analysis with a running, a pending and an upload job
+    analysis: Analysis = analysis_store.get_query(table=Analysis).first()
+    running_job: Job = StoreHelpers.add_job(
+        analysis_id=analysis.id, name="running", slurm_id=1, status=SlurmJobStatus.RUNNING
+    )
+    StoreHelpers.add_job(
+        analysis_id=analysis.id, name="pending", slurm_id=2, status=SlurmJobStatus.PENDING
+    )
+    upload_job = Job(analysis_id=analysis.id, slurm_id=3, job_type=JobType.UPLOAD)
+    session: Session = get_session()
+    session.add(upload_job)
+    session.commit()
+    running_job_id: int = running_job.id
+
+    # WHEN replacing the jobs with the running job completed and a new job
+    analysis_store.replace_jobs(
+        analysis_id=analysis.id,
+        jobs=[
+            Job(slurm_id=1, name="running", status=SlurmJobStatus.COMPLETED, elapsed=10),
+            Job(slurm_id=4, name="new", status=SlurmJobStatus.RUNNING),
+        ],
+    )
+
+    # THEN the existing job is updated in place
+    analysis_jobs: dict[int, Job] = {job.slurm_id: job for job in analysis.analysis_jobs}
+    assert analysis_jobs[1].id == running_job_id
+    assert analysis_jobs[1].status == SlurmJobStatus.COMPLETED
+    assert analysis_jobs[1].elapsed == 10
+
+    # THEN the new job is added and the vanished job is deleted
+    assert set(analysis_jobs) == {1, 4}
+
+    # THEN the upload job is kept
+    assert analysis.upload_jobs == [upload_job]
+
+
+def test_replace_jobs_with_duplicate_jobs(analysis_store: MockStore):
+    # GIVEN an analysis with two stored jobs sharing a SLURM id
+    analysis: Analysis = analysis_store.get_query(table=Analysis).first()
+    first_job: Job = StoreHelpers.add_job(
+        analysis_id=analysis.id, name="job", slurm_id=1, status=SlurmJobStatus.PENDING
+    )
+    StoreHelpers.add_job(
+        analysis_id=analysis.id, name="job", slurm_id=1, status=SlurmJobStatus.PENDING
+    )
+    session: Session = get_session()
+    session.commit()
+    first_job_id: int = first_job.id
+
+    # WHEN replacing the jobs with jobs in which the SLURM id is also given twice
+    analysis_store.replace_jobs(
+        analysis_id=analysis.id,
+        jobs=[
+            Job(slurm_id=1, name="job", status=SlurmJobStatus.RUNNING),
+            Job(slurm_id=1, name="job", status=SlurmJobStatus.COMPLETED),
+        ],
+    )
+
+    # THEN a single job is kept for the SLURM id, updated to the last given state
+    session.expire_all()
+    assert [(job.id, job.status) for job in analysis.analysis_jobs] == [
+        (first_job_id, SlurmJobStatus.COMPLETED)
+    ]
+    assert session.query(Job).filter(Job.slurm_id == 1).count() == 1
@@ -1,13 +1,15 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 import pytest
 
 from tests.mocks.store_mock import MockStore
 from tests.store.utils.store_helper import StoreHelpers
-from trailblazer.constants import TrailblazerStatus
+from trailblazer.constants import TrailblazerStatus, Workflow
+from trailblazer.dto.analyses_request import AnalysesRequest, AnalysisSortField
+from trailblazer.dto.common import SortOrder
 from trailblazer.exc import MissingAnalysis, UserNotFoundError
 from trailblazer.store.database import get_session
-from trailblazer.store.models import Analysis, Job, User
+from trailblazer.store.models import Analysis, Delivery, Job, User
 from trailblazer.store.store import Store
 
 
@@ -304,6 +306,25 @@ def test_get_latest_failed_job_when_none_failed(job_store: MockStore):
     assert not job
 
 
+def test_get_latest_failed_jobs_for_analyses(job_store: MockStore, timestamp_yesterday: datetime):
+    """Test getting the latest failed job for several analyses at once."""
+    # GIVEN a database where one analysis has an older failed job as well
+    StoreHelpers.add_job(
+        analysis_id=1,
+        name="older",
+        slurm_id=2,
+        status=TrailblazerStatus.FAILED,
+        started_at=timestamp_yesterday,
+    )
+
+    # WHEN getting the latest failed jobs for analyses with and without failed jobs
+    jobs: dict[int, Job] = job_store.get_latest_failed_jobs_for_analyses([0, 1])
+
+    # THEN only the latest failed job of the analysis with failed jobs is returned
+    assert list(jobs) == [1]
+    assert jobs[1].name == "1"
+
+
 def test_get_user_by_signature_strict(store: Store):
     # GIVEN a store with several users
     user = User(
@@ -337,3 +358,128 @@ def test_get_user_by_signature_strict_no_user(store: Store):
     # THEN a UserNotFoundError is raised
     with pytest.raises(UserNotFoundError):
         store.get_user_by_signature_strict("CG")
+
+
+@pytest.mark.parametrize(
+    "sort_field",
+    [AnalysisSortField.STARTED_AT, AnalysisSortField.UPLOADED_AT, AnalysisSortField.STATUS],
+)
+@pytest.mark.parametrize("sort_order", [SortOrder.ASC, SortOrder.DESC])
+def test_get_paginated_analyses_with_cursor(
+    analysis_store: MockStore, sort_field: AnalysisSortField, sort_order: SortOrder
+):
+    # GIVEN a store with analyses
+    request_data: dict = {
+        "sortField": sort_field,
+        "sortOrder": sort_order,
+        "includeHidden": True,
+    }
+    all_analyses, total_count, _ = analysis_store.get_paginated_analyses(
+        AnalysesRequest.model_validate(request_data | {"pageSize": 1000})
+    )
+
+    # WHEN paging through the analyses with the returned cursors
+    paged_analyses: list[Analysis] = []
+    next_cursor: str | None = None
+    while True:
+        page, _, next_cursor = analysis_store.get_paginated_analyses(
+            AnalysesRequest.model_validate(request_data | {"pageSize": 3, "cursor": next_cursor})
+        )
+        paged_analyses.extend(page)
+        if not next_cursor:
+            break
+
+    # THEN all analyses are returned once in the same order as without pagination
+    assert len(all_analyses) == total_count
+    assert paged_analyses == all_analyses
+
+
+def test_get_paginated_analyses_sorts_statuses_alphabetically(analysis_store: MockStore):
+    # GIVEN analyses with statuses in another order than the enum values
+    for analysis, status in zip(
+        analysis_store.get_query(table=Analysis).all(),
+        [TrailblazerStatus.RUNNING, TrailblazerStatus.COMPLETED, TrailblazerStatus.ERROR],
+    ):
+        analysis.status = status
+
+    # GIVEN a request for analyses sorted on the status
+    request = AnalysesRequest.model_validate(
+        {
+            "sortField": AnalysisSortField.STATUS,
+            "sortOrder": SortOrder.ASC,
+            "includeHidden": True,
+            "pageSize": 1000,
+        }
+    )
+
+    # WHEN getting the analyses
+    analyses, _, _ = analysis_store.get_paginated_analyses(request)
+
+    # THEN the analyses are sorted alphabetically on the status
+    statuses: list[str] = [analysis.status for analysis in analyses]
+    assert len(set(statuses)) > 1
+    assert statuses == sorted(statuses)
+
+
+def test_get_paginated_analyses_without_total_count(analysis_store: MockStore):
+    # GIVEN a request for analyses without the total count
+    request = AnalysesRequest.model_validate({"includeTotalCount": False, "pageSize": 1})
+
+    # WHEN getting a page of analyses
+    analyses, total_count, next_cursor = analysis_store.get_paginated_analyses(request)
+
+    # THEN the page is returned without the total count
+    assert len(analyses) == 1
+    assert total_count is None
+
+    # THEN the cursor of the next page is returned
+    assert next_cursor
+
+
+def test_get_latest_analysis_statuses_for_orders(store: MockStore, user_email: str):
+    # GIVEN an order with a re-run case and a delivered case and an order with an rsync analysis
+    user: User = store.add_user(name="user", email=user_email, abbreviation="USR")
+    now = datetime.now()
+    rerun_analysis = Analysis(
+        case_id="rerun", order_id=1, started_at=now, status="running", workflow=Workflow.MIP_DNA
+    )
+    delivered_analysis = Analysis(
+        case_id="delivered", order_id=1, started_at=now, status="qc", workflow=Workflow.MIP_DNA
+    )
+    session = get_session()
+    session.add_all(
+        [
+            Analysis(
+                case_id="rerun",
+                order_id=1,
+                started_at=now - timedelta(days=1),
+                status="failed",
+                workflow=Workflow.MIP_DNA,
+            ),
+            rerun_analysis,
+            delivered_analysis,
+            Analysis(
+                case_id="rsync",
+                order_id=2,
+                started_at=now,
+                status="completed",
+                workflow=Workflow.RSYNC,
+            ),
+        ]
+    )
+    session.flush()
+    session.add(
+        Delivery(
+            analysis_id=delivered_analysis.id, delivered_by=user.id, delivered_date=date.today()
+        )
+    )
+    session.commit()
+
+    # WHEN getting the latest analysis statuses for both orders
+    statuses = store.get_latest_analysis_statuses_for_orders([1, 2])
+
+    # THEN only the latest analysis per case, excluding rsync analyses, is returned
+    assert sorted(tuple(row) for row in statuses) == [
+        (1, "delivered", "qc", True),
+        (1, "rerun", "running", False),
+    ]
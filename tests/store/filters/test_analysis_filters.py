@@ -356,3 +356,48 @@ def test_filter_analyses_by_statuses(analysis_store: MockStore):
 
     # THEN the analysis should match the original
     assert existing_analysis == analysis.first()
+
+
+def test_filter_analyses_by_search_term_in_middle_of_comment(analysis_store: MockStore):
+    """Test return analysis when search term is part of a word in the comment."""
+    # GIVEN a store containing an analysis with a committed comment
+    existing_analysis: Analysis = analysis_store.get_query(table=Analysis).first()
+    analysis_store.update_latest_analysis_comment(
+        case_id=existing_analysis.case_id, comment="resequenced sample"
+    )
+
+    # WHEN retrieving analyses by a search term in the middle of a word
+    analyses: Query = filter_analyses_by_search_term(
+        analyses=analysis_store.get_query(table=Analysis), search_term="sequence"
+    )
+
+    # THEN only the analysis with the comment is returned
+    assert analyses.all() == [existing_analysis]
+
+
+def test_filter_analyses_by_search_term_prefix_of_case(analysis_store: MockStore):
+    """Test return analysis when search term is the prefix of the case id."""
+    # GIVEN a store containing analyses
+    existing_analysis: Analysis = analysis_store.get_query(table=Analysis).first()
+
+    # WHEN retrieving analyses by the first characters of the case id
+    analyses: Query = filter_analyses_by_search_term(
+        analyses=analysis_store.get_query(table=Analysis),
+        search_term=existing_analysis.case_id[:4],
+    )
+
+    # THEN the analysis is returned
+    assert existing_analysis in analyses.all()
+
+
+def test_filter_analyses_by_search_term_escapes_wildcards(analysis_store: MockStore):
+    """Test that wildcards in the search term are matched literally."""
+    # GIVEN a store containing analyses
+
+    # WHEN retrieving analyses by a search term consisting of a wildcard
+    analyses: Query = filter_analyses_by_search_term(
+        analyses=analysis_store.get_query(table=Analysis), search_term="%"
+    )
+
+    # THEN no analyses are returned
+    assert not analyses.all()
@@ -6,6 +6,7 @@ from tests.mocks.store_mock import MockStore
 from trailblazer.constants import TrailblazerStatus
 from trailblazer.store.filters.job_filters import (
     filter_jobs_by_analysis_id,
+    filter_jobs_by_analysis_ids,
     filter_jobs_by_status,
     filter_jobs_by_since_when,
 )
@@ -74,3 +75,17 @@ def test_filter_jobs_by_analysis_id(job_store: MockStore):
 
     # THEN the jobs attribute analysis id should match the original
     assert jobs[0].analysis_id == analysis_id
+
+
+def test_filter_jobs_by_analysis_ids(job_store: MockStore):
+    """Test return jobs by analysis ids."""
+    # GIVEN a store containing jobs for two analyses
+
+    # WHEN retrieving the jobs of one of the analyses
+    jobs: Query = filter_jobs_by_analysis_ids(jobs=job_store.get_query(table=Job), analysis_ids=[1])
+
+    # ASSERT that the jobs is a query
+    assert isinstance(jobs, Query)
+
+    # THEN only the jobs of that analysis should be returned
+    assert [job.analysis_id for job in jobs] == [1]
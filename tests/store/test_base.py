@@ -1,9 +1,12 @@
 from datetime import datetime
 
+import pytest
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Query
 
 from tests.mocks.store_mock import MockStore
 from trailblazer.constants import TrailblazerStatus, Workflow
+from trailblazer.store.database import get_session
 from trailblazer.store.models import Analysis, Info, Job
 
 
@@ -37,3 +40,73 @@ def test_get_job_query_with_name_and_count_labels(job_store: MockStore):
     assert category.name == "0"
 
     assert category.count == job_store.get_query(table=Job).count()
+
+
+def test_scan_context_commits_once(analysis_store: MockStore, mocker):
+    """Test that store updates within a scan context are committed once when it exits."""
+
+    # GIVEN an analysis
+    analysis: Analysis = analysis_store.get_query(table=Analysis).first()
+    commit = mocker.spy(get_session()(), "commit")
+
+    # WHEN updating the status and progress of the analysis in a scan context
+    with analysis_store.scan_context():
+        analysis_store.update_analysis_progress(analysis_id=analysis.id, progress=0.5)
+        analysis_store.update_analysis_status(
+            analysis_id=analysis.id, status=TrailblazerStatus.RUNNING
+        )
+
+        # THEN nothing is committed before the context exits
+        assert commit.call_count == 0
+
+    # THEN the updates are committed once
+    assert commit.call_count == 1
+    assert analysis.progress == 0.5
+
+
+def test_scan_context_rolls_back_on_error(analysis_store: MockStore):
+    """Test that store updates within a scan context are rolled back if it raises."""
+
+    # GIVEN an analysis with a status
+    analysis: Analysis = analysis_store.get_query(table=Analysis).first()
+    get_session().commit()
+    original_status: str = analysis.status
+
+    # WHEN a scan context raises after updating the status of the analysis
+    with pytest.raises(ValueError):
+        with analysis_store.scan_context():
+            analysis_store.update_analysis_status(
+                analysis_id=analysis.id, status=TrailblazerStatus.CANCELLED
+            )
+            raise ValueError
+
+    # THEN the update is rolled back
+    assert analysis.status == original_status
+
+
+def test_analysis_transaction_rolls_back_only_failing_analysis(analysis_store: MockStore):
+    """Test that a failing analysis transaction does not roll back the other analyses."""
+
+    # GIVEN two analyses
+    first_analysis, second_analysis = analysis_store.get_query(table=Analysis).limit(2).all()
+    get_session().commit()
+    first_analysis_id: int = first_analysis.id
+    second_analysis_id: int = second_analysis.id
+
+    # WHEN the update of the second analysis fails to flush within a scan context
+    with analysis_store.scan_context():
+        with analysis_store.analysis_transaction():
+            analysis_store.update_analysis_progress(analysis_id=first_analysis_id, progress=0.5)
+        with pytest.raises(IntegrityError):
+            with analysis_store.analysis_transaction():
+                second_analysis.case_id = None
+                analysis_store.update_analysis_progress(
+                    analysis_id=second_analysis_id, progress=0.5
+                )
+
+    # THEN the update of the first analysis is stored
+    get_session().expunge_all()
+    assert analysis_store.get_analysis_with_id(first_analysis_id).progress == 0.5
+
+    # THEN the update of the second analysis is rolled back
+    assert analysis_store.get_analysis_with_id(second_analysis_id).case_id
@@ -0,0 +1,94 @@
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from trailblazer.constants import PrePingStrategy
+from trailblazer.models import DatabaseSettings
+from trailblazer.server.ext import get_database_settings
+from trailblazer.store.database import (
+    CHECKED_IN_AT,
+    get_engine_options,
+    get_pool_statistics,
+    initialize_database,
+    ping_idle_connections,
+)
+
+
+def test_get_engine_options_for_mysql():
+    # GIVEN database settings pinging idle connections
+    settings = DatabaseSettings(pool_size=20, isolation_level="READ COMMITTED")
+
+    # WHEN getting the engine options for a MySQL database
+    options: dict = get_engine_options(db_uri="mysql+pymysql://user@host/db", settings=settings)
+
+    # THEN the pool is configured without pinging on every checkout
+    assert options["pool_size"] == 20
+    assert options["pool_recycle"] == settings.pool_recycle
+    assert options["isolation_level"] == "READ COMMITTED"
+    assert not options["pool_pre_ping"]
+
+
+def test_get_engine_options_for_sqlite():
+    # GIVEN database settings always pinging connections
+    settings = DatabaseSettings(pool_pre_ping=PrePingStrategy.ALWAYS)
+
+    # WHEN getting the engine options for a SQLite database
+    options: dict = get_engine_options(db_uri="sqlite:///:memory:", settings=settings)
+
+    # THEN no pool size options are given
+    assert options == {"pool_pre_ping": True}
+
+
+def test_ping_idle_connections_only_pings_idle_connections(tmp_path: Path):
+    # GIVEN an engine pinging connections idle for more than an hour
+    engine = create_engine(f"sqlite:///{Path(tmp_path, 'trailblazer.db')}", poolclass=QueuePool)
+    ping_idle_connections(engine=engine, idle_time=3600)
+    statements: list[str] = []
+
+    # GIVEN a connection returned to the pool
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 2"))
+
+    # WHEN checking out the recently returned connection
+    with engine.connect() as connection:
+        dbapi_connection = connection.connection.dbapi_connection
+        dbapi_connection.set_trace_callback(statements.append)
+
+    # THEN it is not pinged
+    assert statements == []
+
+    # WHEN checking out the connection after it has been idle for longer than the idle time
+    connection_record = engine.pool._pool.queue[0]
+    connection_record.info[CHECKED_IN_AT] = time.monotonic() - 7200
+    with engine.connect():
+        pass
+
+    # THEN it is pinged
+    assert statements == ["SELECT 1"]
+
+
+def test_get_pool_statistics(tmp_path: Path):
+    # GIVEN a database with a connection pool
+    initialize_database(f"sqlite:///{Path(tmp_path, 'trailblazer.db')}")
+
+    # WHEN getting the pool statistics
+    statistics: dict[str, int] = get_pool_statistics()
+
+    # THEN the connections are counted per state
+    assert set(statistics) == {"size", "checked_in", "checked_out", "overflow"}
+    assert statistics["checked_out"] == 0
+
+
+def test_get_database_settings_from_app_config():
+    # GIVEN an app config with some database settings from the environment
+    config = {"SQLALCHEMY_POOL_SIZE": "20", "SQLALCHEMY_POOL_PRE_PING": "always"}
+
+    # WHEN getting the database settings
+    settings: DatabaseSettings = get_database_settings(config)
+
+    # THEN the given settings are parsed and the rest are defaults
+    assert settings.pool_size == 20
+    assert settings.pool_pre_ping == PrePingStrategy.ALWAYS
+    assert settings.max_overflow == DatabaseSettings().max_overflow
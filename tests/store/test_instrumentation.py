@@ -0,0 +1,129 @@
+import logging
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from tests.mocks.store_mock import MockStore
+from trailblazer.models import DatabaseSettings
+from trailblazer.store.database import (
+    create_all_tables,
+    drop_all_tables,
+    get_session,
+    initialize_database,
+)
+from trailblazer.store.instrumentation import (
+    MAX_SLOWEST_QUERIES,
+    QueryStats,
+    instrument_engine,
+    observe_pool_checkout_wait,
+    start_query_tracking,
+    stop_query_tracking,
+)
+from trailblazer.store.models import Analysis
+from trailblazer.store.store import Store
+from trailblazer.utils.metrics import DB_POOL_CHECKOUT_WAIT
+
+
+def test_query_tracking(analysis_store: MockStore):
+    # GIVEN a store with analyses
+    get_session().commit()
+
+    # WHEN tracking the queries of getting all analyses
+    query_tracking = start_query_tracking()
+    analysis_ids: list[int] = [analysis.id for analysis in analysis_store.get_query(Analysis)]
+    query_stats: QueryStats = stop_query_tracking(query_tracking)
+
+    # THEN the query is counted and timed
+    assert analysis_ids
+    assert query_stats.count == 1
+    assert query_stats.total_time > 0
+    assert "FROM analysis" in query_stats.slowest[0][1]
+
+
+def test_query_stats_keeps_slowest_queries():
+    # GIVEN query stats
+    query_stats = QueryStats()
+
+    # WHEN adding more queries than the number of slowest queries kept
+    for duration in range(MAX_SLOWEST_QUERIES * 2):
+        query_stats.add(statement=f"SELECT {duration}", duration=duration)
+
+    # THEN all queries are counted
+    assert query_stats.count == MAX_SLOWEST_QUERIES * 2
+
+    # THEN only the slowest queries are kept, slowest first
+    assert [duration for duration, _ in query_stats.slowest] == list(
+        range(MAX_SLOWEST_QUERIES * 2 - 1, MAX_SLOWEST_QUERIES - 1, -1)
+    )
+
+
+@pytest.fixture
+def slow_query_store() -> Store:
+    """Return a store logging all queries as slow."""
+    initialize_database("sqlite:///:memory:", settings=DatabaseSettings(slow_query_threshold=0))
+    create_all_tables()
+    yield Store()
+    drop_all_tables()
+
+
+def test_slow_query_log(slow_query_store: Store, caplog):
+    # GIVEN a store where every query is slow
+    caplog.set_level(logging.WARNING)
+
+    # WHEN getting the latest analysis of a case
+    slow_query_store.get_latest_analysis_for_case("a_case")
+
+    # THEN the query is logged with the store method and the bound parameters
+    assert "Slow query" in caplog.text
+    assert "Store.get_latest_analysis_for_case" in caplog.text
+    assert "a_case" in caplog.text
+
+
+def get_checkout_wait_count() -> int:
+    return sum(
+        bucket_counts[-1] for bucket_counts, _ in DB_POOL_CHECKOUT_WAIT.get_series().values()
+    )
+
+
+def test_observe_pool_checkout_wait(tmp_path: Path):
+    # GIVEN an engine whose pool checkout wait is observed
+    engine = create_engine(f"sqlite:///{Path(tmp_path, 'trailblazer.db')}", poolclass=QueuePool)
+    observe_pool_checkout_wait(engine.pool)
+    checkout_count: int = get_checkout_wait_count()
+
+    # WHEN checking out a connection
+    with engine.connect():
+        pass
+
+    # THEN the wait for the connection is observed
+    assert get_checkout_wait_count() == checkout_count + 1
+
+
+def test_observe_pool_checkout_wait_after_engine_dispose(tmp_path: Path):
+    # GIVEN an instrumented engine whose pool has been replaced by disposing the engine
+    engine = create_engine(f"sqlite:///{Path(tmp_path, 'trailblazer.db')}", poolclass=QueuePool)
+    instrument_engine(engine)
+    engine.dispose()
+    checkout_count: int = get_checkout_wait_count()
+
+    # WHEN checking out a connection from the new pool
+    with engine.connect():
+        pass
+
+    # THEN the wait for the connection is still observed
+    assert get_checkout_wait_count() == checkout_count + 1
+
+
+def test_observe_pool_checkout_wait_without_internal_checkout(caplog):
+    # GIVEN a pool without the internal checkout method wrapped to observe the wait
+    class PoolWithoutCheckout:
+        pass
+
+    # WHEN observing the pool checkout wait
+    with caplog.at_level(logging.WARNING):
+        observe_pool_checkout_wait(PoolWithoutCheckout())
+
+    # THEN a warning is logged instead of failing
+    assert "Pool checkout wait is not observed" in caplog.text
@@ -0,0 +1,52 @@
+from sqlalchemy.orm import Session
+
+from tests.mocks.store_mock import MockStore
+from tests.store.utils.query_counter import count_queries
+from tests.store.utils.store_helper import StoreHelpers
+from trailblazer.constants import SlurmJobStatus
+from trailblazer.services.analysis_service.utils import create_analysis_response
+from trailblazer.store.database import get_session
+from trailblazer.store.loading_profiles import AnalysisLoadingProfile
+from trailblazer.store.models import Analysis
+
+
+def test_detail_profile_loads_serialized_relationships(analysis_store: MockStore):
+    # GIVEN an analysis with jobs which is not loaded in the session
+    analysis_id: int = analysis_store.get_query(table=Analysis).first().id
+    for slurm_id in [1, 2, 3]:
+        StoreHelpers.add_job(
+            analysis_id=analysis_id, name="job", slurm_id=slurm_id, status=SlurmJobStatus.RUNNING
+        )
+    session: Session = get_session()
+    session.commit()
+    session.expunge_all()
+
+    # WHEN getting the analysis with the detail profile and serializing it
+    with count_queries(session) as statements:
+        analysis: Analysis = analysis_store.get_analysis_with_id(
+            analysis_id=analysis_id, loading_profile=AnalysisLoadingProfile.DETAIL
+        )
+        queries_to_load: int = len(statements)
+        create_analysis_response(analysis)
+
+    # THEN the relationships are loaded with the analysis
+    assert len(analysis.jobs) == 3
+
+    # THEN serializing the analysis does not issue any further queries
+    assert len(statements) == queries_to_load
+
+
+def test_scan_profile_loads_jobs_of_all_analyses(analysis_store: MockStore):
+    # GIVEN several ongoing analyses which are not loaded in the session
+    session: Session = get_session()
+    session.expunge_all()
+
+    # WHEN getting the ongoing analyses and reading their jobs
+    with count_queries(session) as statements:
+        analyses: list[Analysis] = analysis_store.get_ongoing_analyses()
+        for analysis in analyses:
+            analysis.analysis_jobs
+
+    # THEN the jobs of all analyses were loaded with one additional query
+    assert len(analyses) > 2
+    assert len(statements) == 2
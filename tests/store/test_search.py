@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy.dialects import mysql
+
+from trailblazer.store.search import get_comment_search_condition, get_mysql_boolean_query
+
+
+@pytest.mark.parametrize(
+    "search_term, boolean_query",
+    [
+        ("failed sample", "+failed* +sample*"),
+        ("re-run (urgent)", "+run* +urgent*"),
+        ("a", ""),
+    ],
+)
+def test_get_mysql_boolean_query(search_term: str, boolean_query: str):
+    # GIVEN a search term
+
+    # WHEN creating the boolean mode query
+    # THEN operators and words too short to be indexed are left out
+    assert get_mysql_boolean_query(search_term) == boolean_query
+
+
+def test_get_comment_search_condition_mysql():
+    # GIVEN a MySQL database
+
+    # WHEN getting the comment search condition
+    condition = get_comment_search_condition(dialect_name="mysql", search_term="failed")
+
+    # THEN the full-text index is used
+    assert "MATCH (analysis.comment) AGAINST" in str(condition.compile(dialect=mysql.dialect()))
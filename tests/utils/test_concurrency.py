@@ -0,0 +1,18 @@
+from trailblazer.utils.concurrency import run_concurrently
+
+
+def test_run_concurrently():
+    # GIVEN a function that fails for some arguments
+    def invert(number: int) -> float:
+        return 1 / number
+
+    # WHEN running the function concurrently for several arguments
+    results, errors = run_concurrently(
+        function=invert, arguments={"one": 1, "two": 2, "zero": 0}, max_workers=2
+    )
+
+    # THEN the results are keyed like the arguments
+    assert results == {"one": 1.0, "two": 0.5}
+
+    # THEN the raised error is returned for the failing argument
+    assert isinstance(errors["zero"], ZeroDivisionError)
@@ -0,0 +1,199 @@
+import json
+from pathlib import Path
+
+from trailblazer.utils.metrics import (
+    EXITED_SNAPSHOT_NAME,
+    SNAPSHOT_PREFIX,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    remove_snapshots,
+    timed,
+)
+
+
+def test_histogram_render():
+    # GIVEN a histogram with a label
+    histogram = Histogram(
+        name="duration_seconds",
+        documentation="A duration.",
+        label_names=("client",),
+        buckets=(1, 5),
+    )
+
+    # WHEN observing values
+    for value in [0.5, 2, 10]:
+        histogram.observe(value, client="tower")
+
+    # THEN the cumulative bucket counts, the sum and the count are rendered
+    lines: list[str] = histogram.render()
+    assert "# TYPE duration_seconds histogram" in lines
+    assert 'duration_seconds_bucket{client="tower",le="1.0"} 1' in lines
+    assert 'duration_seconds_bucket{client="tower",le="5.0"} 2' in lines
+    assert 'duration_seconds_bucket{client="tower",le="+Inf"} 3' in lines
+    assert 'duration_seconds_sum{client="tower"} 12.5' in lines
+    assert 'duration_seconds_count{client="tower"} 3' in lines
+
+
+def test_gauge_render_reads_callback():
+    # GIVEN a gauge reading its values from a callback
+    gauge = Gauge(
+        name="pool_connections",
+        documentation="Connections.",
+        label_name="state",
+        callback=lambda: {"checked_out": 2, "checked_in": 3},
+    )
+
+    # WHEN rendering the gauge
+    lines: list[str] = gauge.render()
+
+    # THEN the current value of each label is rendered
+    assert "# TYPE pool_connections gauge" in lines
+    assert 'pool_connections{state="checked_in"} 3' in lines
+    assert 'pool_connections{state="checked_out"} 2' in lines
+
+
+def test_timed_uses_function_name_as_operation():
+    # GIVEN a histogram with client and operation labels
+    histogram = Histogram(
+        name="request_seconds", documentation="A request.", label_names=("client", "operation")
+    )
+
+    # GIVEN a function timed with the histogram
+    @timed(histogram, client="tower")
+    def get_tasks() -> str:
+        return "tasks"
+
+    # WHEN calling the function
+    result: str = get_tasks()
+
+    # THEN the result is returned and the call is observed with the function name as operation
+    assert result == "tasks"
+    assert 'request_seconds_count{client="tower",operation="get_tasks"} 1' in histogram.render()
+
+
+def test_write_text_file(tmp_path: Path):
+    # GIVEN a registry with an observed histogram
+    registry = MetricsRegistry()
+    histogram: Histogram = registry.histogram(name="scan_seconds", documentation="A scan.")
+    histogram.observe(3)
+
+    # WHEN writing the metrics to a file
+    metrics_file = Path(tmp_path, "trailblazer.prom")
+    registry.write_text_file(metrics_file)
+
+    # THEN the file contains the rendered metrics
+    assert metrics_file.read_text() == registry.render()
+    assert "scan_seconds_count 1" in metrics_file.read_text()
+
+
+def test_render_snapshots_sums_processes(tmp_path: Path, mocker):
+    # GIVEN a registry with a histogram and a gauge
+    registry = MetricsRegistry()
+    histogram: Histogram = registry.histogram(
+        name="request_seconds", documentation="A request.", label_names=("endpoint",)
+    )
+    registry.gauge(
+        name="pool_connections",
+        documentation="Connections.",
+        label_name="state",
+        callback=lambda: {"checked_out": 1},
+    )
+
+    # GIVEN that two worker processes have written snapshots of their metrics
+    for process_id in [100, 101]:
+        mocker.patch("os.getpid", return_value=process_id)
+        histogram.observe(0.5, endpoint="analyses")
+        registry.write_snapshot(tmp_path)
+
+    # WHEN rendering the snapshots
+    rendered: str = registry.render_snapshots(tmp_path)
+
+    # THEN the metrics of both processes are summed
+    assert 'request_seconds_count{endpoint="analyses"} 3' in rendered
+    assert 'pool_connections{state="checked_out"} 2' in rendered
+
+
+def test_render_snapshots_skips_unreadable_snapshots(tmp_path: Path):
+    # GIVEN a snapshot which is not valid JSON next to a valid snapshot
+    registry = MetricsRegistry()
+    histogram: Histogram = registry.histogram(name="scan_seconds", documentation="A scan.")
+    histogram.observe(3)
+    registry.write_snapshot(tmp_path)
+    Path(tmp_path, f"{SNAPSHOT_PREFIX}0.json").write_text("{")
+
+    # WHEN rendering the snapshots
+    rendered: str = registry.render_snapshots(tmp_path)
+
+    # THEN the valid snapshot is rendered
+    assert "scan_seconds_count 1" in rendered
+
+
+def test_write_snapshot_with_minimum_interval(tmp_path: Path, mocker):
+    # GIVEN a registry which has just written a snapshot of its metrics
+    registry = MetricsRegistry()
+    histogram: Histogram = registry.histogram(name="scan_seconds", documentation="A scan.")
+    histogram.observe(3)
+    mocker.patch("time.monotonic", return_value=100)
+    registry.write_snapshot(tmp_path, min_interval=5)
+
+    # WHEN writing a snapshot again within the minimum interval
+    histogram.observe(3)
+    registry.write_snapshot(tmp_path, min_interval=5)
+
+    # THEN the snapshot is not written
+    assert "scan_seconds_count 1" in registry.render_snapshots(tmp_path)
+
+    # WHEN writing a snapshot again after the minimum interval
+    mocker.patch("time.monotonic", return_value=105)
+    registry.write_snapshot(tmp_path, min_interval=5)
+
+    # THEN the snapshot is written
+    assert "scan_seconds_count 2" in registry.render_snapshots(tmp_path)
+
+
+def test_render_snapshots_ignores_other_files(tmp_path: Path):
+    # GIVEN a metrics directory with a snapshot and another JSON file
+    registry = MetricsRegistry()
+    histogram: Histogram = registry.histogram(name="scan_seconds", documentation="A scan.")
+    histogram.observe(3)
+    registry.write_snapshot(tmp_path)
+    other_file = Path(tmp_path, "other.json")
+    other_file.write_text(json.dumps({"scan_seconds": [[[], [1] * 12, 3.0]]}))
+
+    # WHEN rendering the snapshots and removing them
+    rendered: str = registry.render_snapshots(tmp_path)
+    remove_snapshots(tmp_path)
+
+    # THEN only the snapshot is rendered and removed
+    assert "scan_seconds_count 1" in rendered
+    assert list(tmp_path.iterdir()) == [other_file]
+
+
+def test_retire_snapshot_keeps_the_counts_of_exited_processes(tmp_path: Path, mocker):
+    # GIVEN a registry with a histogram and a gauge
+    registry = MetricsRegistry()
+    histogram: Histogram = registry.histogram(name="scan_seconds", documentation="A scan.")
+    registry.gauge(
+        name="pool_connections",
+        documentation="Connections.",
+        label_name="state",
+        callback=lambda: {"checked_out": 1},
+    )
+
+    # GIVEN that two worker processes have written snapshots of their metrics and exited
+    for process_id in [100, 101]:
+        mocker.patch("os.getpid", return_value=process_id)
+        histogram.observe(3)
+        registry.write_snapshot(tmp_path)
+        registry.retire_snapshot(directory=tmp_path, process_id=process_id)
+
+    # WHEN rendering the snapshots
+    rendered: str = registry.render_snapshots(tmp_path)
+
+    # THEN the snapshots of the workers are replaced by one snapshot of the exited processes
+    assert [file.name for file in tmp_path.iterdir()] == [EXITED_SNAPSHOT_NAME]
+
+    # THEN the histogram counts of both processes are kept and their gauges are dropped
+    assert "scan_seconds_count 3" in rendered
+    assert "pool_connections{" not in rendered
@@ -1,5 +1,6 @@
 import logging
 import sys
+from contextvars import Token
 from datetime import datetime
 from pathlib import Path
 
@@ -11,16 +12,23 @@ from dependency_injector.wiring import inject, Provide
 import trailblazer
 from trailblazer.cli.utils.ls_helper import _get_ls_analysis_message
 from trailblazer.cli.utils.user_helper import is_existing_user, is_user_archived
-from trailblazer.constants import TRAILBLAZER_TIME_STAMP, FileFormat, TrailblazerStatus
+from trailblazer.constants import (
+    DEFAULT_SCAN_WORKERS,
+    TRAILBLAZER_TIME_STAMP,
+    FileFormat,
+    TrailblazerStatus,
+)
 from trailblazer.containers import Container
 from trailblazer.environ import environ_email
 from trailblazer.io.controller import ReadFile
-from trailblazer.models import Config
+from trailblazer.models import Config, DatabaseSettings
 from trailblazer.server.wiring import setup_dependency_injection
 from trailblazer.services.analysis_service.analysis_service import AnalysisService
 from trailblazer.store.database import get_session, initialize_database
+from trailblazer.store.instrumentation import start_query_tracking, stop_query_tracking
 from trailblazer.store.models import Analysis, User
 from trailblazer.store.store import Store
+from trailblazer.utils.metrics import REGISTRY
 
 LOG = logging.getLogger(__name__)
 LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
@@ -28,19 +36,27 @@ LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
 
 class DatabaseResource:
     """
-    Setup the database and ensure resources are released when the
-    CLI command has been processed.
+    Setup the database and ensure resources, such as the database session and the SSH
+    connection to the analysis host, are released when the CLI command has been processed.
+    The queries of the command are tracked and summarised in the debug log.
     """
 
-    def __init__(self, db_uri: str):
+    def __init__(self, db_uri: str, container: Container, settings: DatabaseSettings):
         self.db_uri = db_uri
+        self.container = container
+        self.settings = settings
+        self.query_tracking: Token | None = None
 
     def __enter__(self):
-        initialize_database(self.db_uri)
+        initialize_database(self.db_uri, settings=self.settings)
+        self.query_tracking = start_query_tracking()
 
     def __exit__(self, _, __, ___):
         session: scoped_session = get_session()
         session.remove()
+        self.container.shutdown_resources()
+        if query_stats := stop_query_tracking(self.query_tracking):
+            LOG.debug(f"Database: {query_stats.get_summary()}")
 
 
 @click.group()
@@ -64,13 +80,19 @@ def base(
         log_format = "%(message)s" if sys.stdout.isatty() else None
 
     coloredlogs.install(level=log_level, fmt=log_format)
-    setup_dependency_injection()
+    container: Container = setup_dependency_injection()
 
     validated_config = Config(
         **ReadFile.get_content_from_file(file_format=FileFormat.YAML, file_path=Path(config.name))
     )
     context.obj = dict(validated_config)
-    context.with_resource(DatabaseResource(validated_config.database_url))
+    context.with_resource(
+        DatabaseResource(
+            db_uri=validated_config.database_url,
+            container=container,
+            settings=validated_config,
+        )
+    )
     context.obj["trailblazer_db"] = Store()
 
 
@@ -95,11 +117,29 @@ def init(context, reset, force):
 
 @base.command()
 @inject
-def scan(analysis_service: AnalysisService = Provide[Container.analysis_service]):
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SCAN_WORKERS,
+    show_default=True,
+    help="Number of concurrent workflow manager lookups",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write scan metrics in the Prometheus text format to this file",
+)
+def scan(
+    workers: int,
+    metrics_file: Path | None,
+    analysis_service: AnalysisService = Provide[Container.analysis_service],
+):
     """Scan ongoing analyses in SLURM"""
-    analysis_service.update_ongoing_analyses()
+    analysis_service.update_ongoing_analyses(max_workers=workers)
     analysis_service.update_uploading_analyses()
     LOG.info("All analyses updated!")
+    if metrics_file:
+        REGISTRY.write_text_file(metrics_file)
 
 
 @base.command("update-analysis")
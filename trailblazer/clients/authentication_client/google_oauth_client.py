@@ -6,6 +6,7 @@ from trailblazer.clients.authentication_client.dtos.refresh_token_request import
 from trailblazer.clients.authentication_client.dtos.tokens_request import GetTokensRequest
 from trailblazer.clients.authentication_client.dtos.tokens_response import TokensResponse
 from trailblazer.clients.authentication_client.exceptions import GoogleOAuthClientError
+from trailblazer.utils.metrics import EXTERNAL_REQUEST_DURATION, timed
 
 
 class GoogleOAuthClient:
@@ -15,6 +16,7 @@ class GoogleOAuthClient:
         self.oauth_base_url = oauth_base_url
         self.redirect_uri = redirect_uri
 
+    @timed(EXTERNAL_REQUEST_DURATION, client="google")
     def get_tokens(self, authorization_code: str) -> TokensResponse:
         """Exchange the authorization code for an access token and refresh token."""
         request = GetTokensRequest(
@@ -32,6 +34,7 @@ class GoogleOAuthClient:
 
         return TokensResponse.model_validate(response.json())
 
+    @timed(EXTERNAL_REQUEST_DURATION, client="google")
     def get_id_token(self, refresh_token: str) -> str:
         """Use refresh token to get a new id token."""
         request = RefreshAccessTokenRequest(
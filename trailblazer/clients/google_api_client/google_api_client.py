@@ -1,6 +1,7 @@
 import requests
 
 from trailblazer.clients.google_api_client.exceptions import GoogleAPIClientError
+from trailblazer.utils.metrics import EXTERNAL_REQUEST_DURATION, timed
 
 
 class GoogleAPIClient:
@@ -10,6 +11,7 @@ class GoogleAPIClient:
     def _get_headers(self, access_token: str) -> dict:
         return {"Authorization": f"Bearer {access_token}"}
 
+    @timed(EXTERNAL_REQUEST_DURATION, client="google")
     def get_user_email(self, access_token: str) -> str:
         """Get the user email for the given access token."""
         endpoint: str = f"{self.base_url}/oauth2/v1/userinfo"
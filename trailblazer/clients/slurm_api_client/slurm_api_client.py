@@ -1,23 +1,46 @@
 import requests
+from requests.adapters import HTTPAdapter
 
-from trailblazer.clients.slurm_api_client.dto import SlurmJobResponse
+from trailblazer.clients.slurm_api_client.dto import SlurmJobResponse, SlurmJobsResponse
 from trailblazer.clients.slurm_api_client.error_handler import handle_errors
+from trailblazer.constants import SLURM_API_POOL_SIZE
+from trailblazer.utils.metrics import EXTERNAL_REQUEST_DURATION, timed
 
 
 class SlurmAPIClient:
-    def __init__(self, base_url: str, access_token: str, user_name: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        access_token: str,
+        user_name: str,
+        pool_size: int = SLURM_API_POOL_SIZE,
+    ) -> None:
         self.base_url = base_url
         self.headers = {"X-SLURM-USER-NAME": user_name, "X-SLURM-USER-TOKEN": access_token}
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(base_url, HTTPAdapter(pool_maxsize=pool_size))
 
     @handle_errors
+    @timed(EXTERNAL_REQUEST_DURATION, client="slurm")
     def get_job(self, job_id: str) -> SlurmJobResponse:
         endpoint: str = f"{self.base_url}/slurm/v0.0.40/job/{job_id}"
-        response = requests.get(endpoint, headers=self.headers)
+        response = self.session.get(endpoint)
         response.raise_for_status()
         return SlurmJobResponse.model_validate(response.json())
 
     @handle_errors
+    @timed(EXTERNAL_REQUEST_DURATION, client="slurm")
+    def get_jobs(self) -> SlurmJobsResponse:
+        """Return all jobs known to the SLURM controller in a single request."""
+        endpoint: str = f"{self.base_url}/slurm/v0.0.40/jobs"
+        response = self.session.get(endpoint)
+        response.raise_for_status()
+        return SlurmJobsResponse.model_validate(response.json())
+
+    @handle_errors
+    @timed(EXTERNAL_REQUEST_DURATION, client="slurm")
     def cancel_job(self, job_id: str) -> None:
         endpoint: str = f"{self.base_url}/slurm/v0.0.40/job/{job_id}"
-        response = requests.delete(endpoint, headers=self.headers)
+        response = self.session.delete(endpoint)
         response.raise_for_status()
@@ -1,13 +1,26 @@
-from trailblazer.clients.slurm_cli_client.utils import cancel_slurm_job, get_slurm_queue
-from trailblazer.clients.slurm_cli_client.models import SqueueResult
+from pydantic import ValidationError
+
+from trailblazer.clients.slurm_cli_client.ssh_connection import SSHConnection
+from trailblazer.clients.slurm_cli_client.utils import (
+    cancel_slurm_jobs,
+    get_slurm_jobs,
+    get_slurm_queue,
+)
+from trailblazer.clients.slurm_cli_client.models import SqueueJob, SqueueResult
 
 
 class SlurmCLIClient:
-    def __init__(self, host: str):
+    def __init__(self, host: str | None, ssh_connection: SSHConnection | None = None):
         self.host = host
+        self.ssh_connection = ssh_connection or (SSHConnection(host) if host else None)
 
     def get_slurm_queue(self, job_ids: list[int]) -> SqueueResult:
-        return get_slurm_queue(job_ids=job_ids, analysis_host=self.host)
+        return get_slurm_queue(job_ids=job_ids, ssh_connection=self.ssh_connection)
+
+    def get_slurm_jobs(
+        self, job_ids: list[int]
+    ) -> tuple[list[SqueueJob], dict[int, ValidationError]]:
+        return get_slurm_jobs(job_ids=job_ids, ssh_connection=self.ssh_connection)
 
-    def cancel_job(self, job_id: int) -> None:
-        cancel_slurm_job(slurm_id=job_id, analysis_host=self.host)
+    def cancel_jobs(self, job_ids: list[int]) -> dict[int, str]:
+        return cancel_slurm_jobs(job_ids=job_ids, ssh_connection=self.ssh_connection)
@@ -0,0 +1,68 @@
+import logging
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+from trailblazer.constants import SSH_CONTROL_PERSIST
+
+LOG = logging.getLogger(__name__)
+
+
+class SSHConnection:
+    """Multiplexed SSH connection to the analysis host.
+
+    The first command opens a master connection which later commands reuse, so that only one
+    SSH handshake is made as long as the connection is in use."""
+
+    def __init__(self, host: str, control_persist: int = SSH_CONTROL_PERSIST):
+        self.host = host
+        self.control_persist = control_persist
+        self._control_dir: Path | None = None
+
+    @property
+    def control_path(self) -> Path:
+        if not self._control_dir:
+            self._control_dir = Path(tempfile.mkdtemp(prefix="trailblazer-ssh-"))
+        return Path(self._control_dir, "%C")
+
+    def get_command(self, commands: list[str]) -> list[str]:
+        """Return the command running the given commands on the host."""
+        return [
+            "ssh",
+            "-o",
+            "ControlMaster=auto",
+            "-o",
+            f"ControlPath={self.control_path}",
+            "-o",
+            f"ControlPersist={self.control_persist}",
+            self.host,
+        ] + commands
+
+    def close(self) -> None:
+        """Stop the master connection, if one has been opened."""
+        if not self._control_dir:
+            return
+        exit_command: list[str] = [
+            "ssh",
+            "-o",
+            f"ControlPath={self.control_path}",
+            "-O",
+            "exit",
+            self.host,
+        ]
+        result = subprocess.run(exit_command, capture_output=True, text=True)
+        if result.returncode:
+            LOG.debug(f"No SSH master connection to stop: {result.stderr.strip()}")
+        shutil.rmtree(self._control_dir, ignore_errors=True)
+        self._control_dir = None
+
+
+def open_ssh_connection(host: str | None) -> Iterator[SSHConnection | None]:
+    """Yield an SSH connection to the host, or None to run commands locally, and close it
+    when the resource is shut down."""
+    connection: SSHConnection | None = SSHConnection(host) if host else None
+    yield connection
+    if connection:
+        connection.close()
@@ -1,27 +1,87 @@
+import logging
+import re
 import subprocess
 
-from trailblazer.constants import CharacterFormat, FileFormat
+from pydantic import ValidationError
+
+from trailblazer.clients.slurm_cli_client.ssh_connection import SSHConnection
+from trailblazer.constants import SQUEUE_MAX_JOB_IDS, FileFormat, SlurmSqueueHeader
 from trailblazer.exc import EmptySqueueError
 from trailblazer.io.controller import ReadStream
-from trailblazer.clients.slurm_cli_client.models import SqueueResult
+from trailblazer.clients.slurm_cli_client.models import SqueueJob, SqueueResult
+
+LOG = logging.getLogger(__name__)
+
+SCANCEL_JOB_ERROR_PATTERN = re.compile(r"job(?: id)? (\d+)", re.IGNORECASE)
+
+
+def get_command(commands: list[str], ssh_connection: SSHConnection | None = None) -> list[str]:
+    """Return the command running the given commands on the analysis host, if connected to one."""
+    return ssh_connection.get_command(commands) if ssh_connection else commands
 
 
-def cancel_slurm_job(slurm_id: int, analysis_host: str | None = None) -> None:
-    """Cancel SLURM job by SLURM job id."""
-    scancel_commands: list[str] = ["scancel", str(slurm_id)]
-    if analysis_host:
-        scancel_commands = ["ssh", analysis_host] + scancel_commands
-    subprocess.Popen(scancel_commands)
+def cancel_slurm_jobs(
+    job_ids: list[int], ssh_connection: SSHConnection | None = None
+) -> dict[int, str]:
+    """Cancel SLURM jobs with one scancel call per chunk of job ids.
+    Returns the scancel error message for each job which could not be cancelled."""
+    errors: dict[int, str] = {}
+    for start in range(0, len(job_ids), SQUEUE_MAX_JOB_IDS):
+        chunk: list[int] = job_ids[start : start + SQUEUE_MAX_JOB_IDS]
+        scancel_commands: list[str] = ["scancel"] + [str(job_id) for job_id in chunk]
+        result = subprocess.run(
+            get_command(commands=scancel_commands, ssh_connection=ssh_connection),
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            errors.update(get_scancel_errors(stderr=result.stderr, job_ids=chunk))
+    return errors
+
+
+def get_scancel_errors(stderr: str, job_ids: list[int]) -> dict[int, str]:
+    """Return the error message per job id in the scancel output.
+    Errors which can not be attributed to a job are reported for all jobs."""
+    errors: dict[int, str] = {}
+    unattributed_errors: list[str] = []
+    for line in stderr.strip().splitlines():
+        match: re.Match | None = SCANCEL_JOB_ERROR_PATTERN.search(line)
+        if match and int(match.group(1)) in job_ids:
+            errors[int(match.group(1))] = line
+        else:
+            unattributed_errors.append(line)
+    if unattributed_errors or not errors:
+        message: str = " ".join(unattributed_errors) or "scancel failed"
+        errors = {job_id: message for job_id in job_ids} | errors
+    return errors
 
 
-def get_slurm_queue(job_ids: list[int], analysis_host: str | None = None) -> SqueueResult:
+def get_slurm_queue(
+    job_ids: list[int], ssh_connection: SSHConnection | None = None
+) -> SqueueResult:
     """Return squeue output from ongoing analyses in SLURM."""
     job_ids: str = ",".join(map(str, job_ids))
-    queue_output: str = get_slurm_queue_output(job_ids=job_ids, analysis_host=analysis_host)
+    queue_output: str = get_slurm_queue_output(job_ids=job_ids, ssh_connection=ssh_connection)
     return get_squeue_result(queue_output)
 
 
-def get_slurm_queue_output(job_ids: str, analysis_host: str | None = None) -> str:
+def get_slurm_jobs(
+    job_ids: list[int], ssh_connection: SSHConnection | None = None
+) -> tuple[list[SqueueJob], dict[int, ValidationError]]:
+    """Return squeue jobs for the given job ids, querying SLURM once per chunk of job ids.
+    Also returns the validation error of each job which could not be parsed."""
+    jobs: list[SqueueJob] = []
+    errors: dict[int, ValidationError] = {}
+    for start in range(0, len(job_ids), SQUEUE_MAX_JOB_IDS):
+        chunk: str = ",".join(map(str, job_ids[start : start + SQUEUE_MAX_JOB_IDS]))
+        queue_output: str = get_slurm_queue_output(job_ids=chunk, ssh_connection=ssh_connection)
+        chunk_jobs, chunk_errors = get_squeue_jobs(queue_output)
+        jobs.extend(chunk_jobs)
+        errors.update(chunk_errors)
+    return jobs, errors
+
+
+def get_slurm_queue_output(job_ids: str, ssh_connection: SSHConnection | None = None) -> str:
     """Return squeue output from ongoing analyses in SLURM."""
     squeue_commands: list[str] = [
         "squeue",
@@ -31,20 +91,9 @@ def get_slurm_queue_output(job_ids: str, analysis_host: str | None = None) -> st
         "--format",
         "%A,%j,%T,%l,%M,%S",
     ]
-    if analysis_host:
-        squeue_commands = ["ssh", analysis_host] + squeue_commands
-        return (
-            subprocess.check_output(
-                squeue_commands,
-                universal_newlines=True,
-            )
-            .decode(CharacterFormat.UNICODE_TRANSFORMATION_FORMAT_8)
-            .strip()
-            .replace("//n", "/n")
-        )
-    return subprocess.check_output(squeue_commands).decode(
-        CharacterFormat.UNICODE_TRANSFORMATION_FORMAT_8
-    )
+    return subprocess.check_output(
+        get_command(commands=squeue_commands, ssh_connection=ssh_connection), text=True
+    ).strip()
 
 
 def get_squeue_result(squeue_response: str) -> SqueueResult:
@@ -60,3 +109,26 @@ def get_squeue_result(squeue_response: str) -> SqueueResult:
         read_to_dict=True,
     )
     return SqueueResult(jobs=squeue_response_content)
+
+
+def get_squeue_jobs(squeue_response: str) -> tuple[list[SqueueJob], dict[int, ValidationError]]:
+    """Return the jobs in a squeue response, which may be empty.
+    Each row is validated on its own, so that a job in an unknown state only fails itself.
+    Returns the validation errors by job id, rows without a valid job id are logged."""
+    squeue_response_content: list[dict] = ReadStream.get_content_from_stream(
+        file_format=FileFormat.CSV,
+        stream=squeue_response,
+        read_to_dict=True,
+    )
+    jobs: list[SqueueJob] = []
+    errors: dict[int, ValidationError] = {}
+    for row in squeue_response_content:
+        try:
+            jobs.append(SqueueJob.model_validate(row))
+        except ValidationError as error:
+            job_id: str = str(row.get(SlurmSqueueHeader.JOBID, ""))
+            if job_id.isdigit():
+                errors[int(job_id)] = error
+            else:
+                LOG.warning(f"Invalid squeue row {row}: {error}")
+    return jobs, errors
@@ -13,17 +13,50 @@ from trailblazer.utils.datetime import tower_datetime_converter
 SCALE_TO_MILLISEC: int = 1000
 
 
-class TowerTask(BaseModel):
-    """NF Tower task model."""
+class TowerTaskSummary(BaseModel):
+    """NF Tower task model with only the attributes of a job.
+    Other attributes of the task, such as the script and environment, are skipped when decoding."""
 
     process: str
-    name: str
     status: str
     nativeId: str
-    dateCreated: str | datetime | None = None
-    lastUpdated: str | datetime | None = None
     start: str | datetime | None = None
     duration: int | None = None
+    model_config = ConfigDict(validate_default=True)
+
+    @field_validator("duration")
+    @classmethod
+    def set_duration(cls, raw_duration: int | None) -> int:
+        """Convert milliseconds to seconds or return 0 if empty."""
+        return round(raw_duration / SCALE_TO_MILLISEC) if raw_duration else 0
+
+    @field_validator("status")
+    @classmethod
+    def set_status(cls, raw_status) -> str:
+        return TOWER_TASK_STATUS.get(raw_status)
+
+    @field_validator("start")
+    @classmethod
+    def set_start(cls, raw_time) -> str | datetime | None:
+        if isinstance(raw_time, str):
+            return tower_datetime_converter(datetime_stamp=raw_time)
+        elif isinstance(raw_time, datetime):
+            return raw_time
+        else:
+            return None
+
+    @property
+    def is_complete(cls) -> bool:
+        """Returns if the process succeded."""
+        return cls.status == SlurmJobStatus.COMPLETED
+
+
+class TowerTask(TowerTaskSummary):
+    """NF Tower task model."""
+
+    name: str
+    dateCreated: str | datetime | None = None
+    lastUpdated: str | datetime | None = None
     hash: str | None = None
     tag: str | None = None
     submit: str | None = None
@@ -65,20 +98,8 @@ class TowerTask(BaseModel):
     exit: int | None = None
     id: int | None = None
     taskId: int | None = None
-    model_config = ConfigDict(validate_default=True)
 
-    @field_validator("duration")
-    @classmethod
-    def set_duration(cls, raw_duration: int | None) -> int:
-        """Convert milliseconds to seconds or return 0 if empty."""
-        return round(raw_duration / SCALE_TO_MILLISEC) if raw_duration else 0
-
-    @field_validator("status")
-    @classmethod
-    def set_status(cls, raw_status) -> str:
-        return TOWER_TASK_STATUS.get(raw_status)
-
-    @field_validator("start", "dateCreated", "lastUpdated")
+    @field_validator("dateCreated", "lastUpdated")
     @classmethod
     def set_datetime(cls, raw_time) -> str | datetime | None:
         if isinstance(raw_time, str):
@@ -88,16 +109,15 @@ class TowerTask(BaseModel):
         else:
             return None
 
-    @property
-    def is_complete(cls) -> bool:
-        """Returns if the process succeded."""
-        return cls.status == SlurmJobStatus.COMPLETED
-
 
 class TaskWrapper(BaseModel):
     task: TowerTask
 
 
+class TaskSummaryWrapper(BaseModel):
+    task: TowerTaskSummary
+
+
 class TowerProcess(BaseModel):
     """NF Tower task model."""
 
@@ -145,7 +165,16 @@ class TowerProcess(BaseModel):
 class TowerWorkflow(BaseModel):
     """NF Tower workflow model."""
 
+    id: str | None = None
     status: str
+    lastUpdated: datetime | None = None
+
+    @field_validator("lastUpdated", mode="before")
+    @classmethod
+    def set_last_updated(cls, raw_time) -> datetime | None:
+        if isinstance(raw_time, str):
+            return tower_datetime_converter(datetime_stamp=raw_time)
+        return raw_time
 
 
 class TowerProgress(BaseModel):
@@ -165,8 +194,42 @@ class TowerTasksResponse(BaseModel):
         return [task.task for task in self.tasks] if self.tasks else []
 
 
+class TowerTaskSummariesResponse(BaseModel):
+    """NF Tower task response model decoding only the attributes of a job from each task."""
+
+    tasks: list[TaskSummaryWrapper] | None = None
+    total: int
+
+    def get_tasks(self) -> list[TowerTaskSummary]:
+        return [task.task for task in self.tasks] if self.tasks else []
+
+
 class TowerWorkflowResponse(BaseModel):
     """NF Tower task model."""
 
     workflow: TowerWorkflow
     progress: TowerProgress
+
+
+class TowerWorkflowsElement(BaseModel):
+    """NF Tower workflow list element model. The progress is not listed by all Tower versions."""
+
+    workflow: TowerWorkflow
+    progress: TowerProgress | None = None
+
+
+class TowerWorkflowsResponse(BaseModel):
+    """NF Tower workflow list response model."""
+
+    workflows: list[TowerWorkflowsElement] = []
+    totalSize: int | None = None
+
+    def get_workflows(self) -> dict[str, TowerWorkflowResponse]:
+        """Return the listed workflows with their progress by workflow id."""
+        return {
+            element.workflow.id: TowerWorkflowResponse(
+                workflow=element.workflow, progress=element.progress
+            )
+            for element in self.workflows
+            if element.workflow.id and element.progress
+        }
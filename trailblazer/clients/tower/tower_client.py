@@ -1,41 +1,137 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Iterator
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from trailblazer.clients.tower.models import (
+    TowerTaskSummariesResponse,
+    TowerTaskSummary,
     TowerTasksResponse,
     TowerWorkflowResponse,
+    TowerWorkflowsResponse,
 )
 from trailblazer.clients.tower.utils import handle_client_errors
+from trailblazer.constants import (
+    TOWER_API_POOL_SIZE,
+    TOWER_CONCURRENT_PAGES,
+    TOWER_TASKS_PAGE_SIZE,
+    TOWER_WORKFLOWS_PER_SEARCH,
+)
+from trailblazer.utils.metrics import EXTERNAL_REQUEST_DURATION, timed
 
 
 class TowerAPIClient:
     """A client consuming the Tower API. Endpoints are defined in https://tower.nf/openapi/."""
 
-    def __init__(self, base_url: str, access_token: str, workspace_id: str):
+    def __init__(
+        self,
+        base_url: str,
+        access_token: str,
+        workspace_id: str,
+        page_size: int = TOWER_TASKS_PAGE_SIZE,
+        concurrent_pages: int = TOWER_CONCURRENT_PAGES,
+        pool_size: int = TOWER_API_POOL_SIZE,
+        workflows_per_search: int = TOWER_WORKFLOWS_PER_SEARCH,
+    ):
         self.base_url = base_url
+        self.page_size = page_size
+        self.workflows_per_search = workflows_per_search
+        self.concurrent_pages = concurrent_pages
         self.request_params = [("workspaceId", workspace_id)]
         self.headers = {
             "Accept": "application/json",
             "Authorization": f"Bearer {access_token}",
         }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            base_url or "https://", HTTPAdapter(pool_maxsize=pool_size, pool_block=True)
+        )
 
     @handle_client_errors
-    def get_tasks(self, workflow_id: str) -> TowerTasksResponse:
-        url = f"{self.base_url}workflow/{workflow_id}/tasks"
-        response = requests.get(url=url, headers=self.headers, params=self.request_params)
-        response.raise_for_status()
+    @timed(EXTERNAL_REQUEST_DURATION, client="tower")
+    def get_tasks(self, workflow_id: str, offset: int = 0) -> TowerTasksResponse:
+        """Return a page of the tasks of a workflow, starting at the offset."""
+        response = self._get_tasks_page(workflow_id=workflow_id, offset=offset)
         json = response.json()
         return TowerTasksResponse.model_validate(json)
 
     @handle_client_errors
+    @timed(EXTERNAL_REQUEST_DURATION, client="tower")
+    def get_task_summaries(self, workflow_id: str, offset: int = 0) -> TowerTaskSummariesResponse:
+        """Return a page of the tasks of a workflow with only the attributes of a job.
+        The response is decoded directly from the raw JSON, without building Python objects
+        for the other attributes of the tasks."""
+        response = self._get_tasks_page(workflow_id=workflow_id, offset=offset)
+        return TowerTaskSummariesResponse.model_validate_json(response.content)
+
+    def _get_tasks_page(self, workflow_id: str, offset: int) -> requests.Response:
+        url = f"{self.base_url}workflow/{workflow_id}/tasks"
+        params = self.request_params + [("max", self.page_size), ("offset", offset)]
+        response = self.session.get(url=url, params=params)
+        response.raise_for_status()
+        return response
+
+    def get_all_tasks(self, workflow_id: str) -> Iterator[TowerTaskSummary]:
+        """Yield the summaries of all tasks of a workflow, page by page.
+        The first page gives the total number of tasks. The remaining pages are fetched
+        concurrently, at most the number of concurrent pages ahead of the consumer."""
+        first_page: TowerTaskSummariesResponse = self.get_task_summaries(workflow_id=workflow_id)
+        offsets: Iterator[int] = iter(range(self.page_size, first_page.total, self.page_size))
+        with ThreadPoolExecutor(max_workers=self.concurrent_pages) as executor:
+            pages: deque[Future] = deque(
+                executor.submit(self.get_task_summaries, workflow_id, offset)
+                for offset in islice(offsets, self.concurrent_pages)
+            )
+            try:
+                yield from first_page.get_tasks()
+                while pages:
+                    page: TowerTaskSummariesResponse = pages.popleft().result()
+                    if (offset := next(offsets, None)) is not None:
+                        pages.append(executor.submit(self.get_task_summaries, workflow_id, offset))
+                    yield from page.get_tasks()
+            finally:
+                for page in pages:
+                    page.cancel()
+
+    @handle_client_errors
+    @timed(EXTERNAL_REQUEST_DURATION, client="tower")
     def get_workflow(self, workflow_id: str) -> TowerWorkflowResponse:
         url = f"{self.base_url}workflow/{workflow_id}"
-        response = requests.get(url=url, headers=self.headers, params=self.request_params)
+        response = self.session.get(url=url, params=self.request_params)
         response.raise_for_status()
         json = response.json()
         return TowerWorkflowResponse.model_validate(json)
 
     @handle_client_errors
+    @timed(EXTERNAL_REQUEST_DURATION, client="tower")
+    def get_workflows(self, workflow_ids: list[str]) -> dict[str, TowerWorkflowResponse]:
+        """Return the workflows with the given ids from the workflow list of the workspace, in one
+        search request per chunk of ids. Workflows not listed with their progress are left out."""
+        url = f"{self.base_url}workflow"
+        workflows: dict[str, TowerWorkflowResponse] = {}
+        for start in range(0, len(workflow_ids), self.workflows_per_search):
+            page_ids: list[str] = workflow_ids[start : start + self.workflows_per_search]
+            search: str = " ".join(f"workflowId:{workflow_id}" for workflow_id in page_ids)
+            params = self.request_params + [("search", search), ("max", len(page_ids))]
+            response = self.session.get(url=url, params=params)
+            response.raise_for_status()
+            listed_workflows = TowerWorkflowsResponse.model_validate_json(response.content)
+            workflows.update(
+                {
+                    workflow_id: workflow
+                    for workflow_id, workflow in listed_workflows.get_workflows().items()
+                    if workflow_id in page_ids
+                }
+            )
+        return workflows
+
+    @handle_client_errors
+    @timed(EXTERNAL_REQUEST_DURATION, client="tower")
     def cancel_workflow(self, workflow_id: str) -> None:
         url = f"{self.base_url}workflow/{workflow_id}/cancel"
-        response = requests.post(url=url, headers=self.headers, params=self.request_params, json={})
+        response = self.session.post(url=url, params=self.request_params, json={})
         response.raise_for_status()
@@ -1,9 +1,33 @@
+from datetime import timedelta
 from enum import StrEnum
 
 ONE_MONTH_IN_DAYS: int = 31
 HOURS_IN_DAY: int = 24
 MINUTES_PER_HOUR: int = 60
 SECONDS_PER_MINUTE: int = 60
+SQUEUE_MAX_JOB_IDS: int = 500
+DEFAULT_SCAN_WORKERS: int = 8
+SLURM_API_POOL_SIZE: int = 10
+TOWER_API_POOL_SIZE: int = 10
+TOWER_TASKS_PAGE_SIZE: int = 100
+TOWER_CONCURRENT_PAGES: int = 4
+TOWER_WORKFLOWS_PER_SEARCH: int = 50
+SSH_CONTROL_PERSIST: int = 600
+SLURM_CANCEL_POLL_INTERVAL: int = 5
+SLURM_CANCEL_TIMEOUT: int = 120
+JOB_ID_FILE_CACHE_SIZE: int = 4096
+DB_POOL_SIZE: int = 5
+DB_MAX_OVERFLOW: int = 10
+DB_POOL_TIMEOUT: int = 30
+DB_POOL_RECYCLE: int = 7200
+DB_PRE_PING_IDLE_TIME: int = 60
+DEFAULT_SLOW_QUERY_THRESHOLD: float = 1.0
+METRICS_SNAPSHOT_INTERVAL: int = 5
+PENDING_SCAN_BACKOFF: list[tuple[timedelta, timedelta]] = [
+    (timedelta(hours=24), timedelta(hours=1)),
+    (timedelta(hours=6), timedelta(minutes=30)),
+    (timedelta(hours=1), timedelta(minutes=10)),
+]
 PRIORITY_OPTIONS: tuple = ("low", "normal", "high", "express", "maintenance")
 TRAILBLAZER_TIME_STAMP: str = "%Y-%m-%d"
 TOWER_TIMESTAMP_FORMAT: str = "%Y-%m-%dT%H:%M:%SZ"
@@ -11,6 +35,14 @@ TOWER_TIMESTAMP_FORMAT_EXTENDED: str = "%Y-%m-%dT%H:%M:%S.%fZ"
 TYPES: tuple = ("other", "rna", "tgs", "wes", "wgs", "wts")
 
 
+class PrePingStrategy(StrEnum):
+    """When connections are checked for liveness before being handed out by the pool."""
+
+    ALWAYS: str = "always"
+    IDLE: str = "idle"
+    NEVER: str = "never"
+
+
 class FileFormat(StrEnum):
     CSV: str = "csv"
     JSON: str = "json"
@@ -5,7 +5,9 @@ from trailblazer.clients.authentication_client.google_oauth_client import Google
 from trailblazer.clients.google_api_client.google_api_client import GoogleAPIClient
 from trailblazer.clients.slurm_api_client.slurm_api_client import SlurmAPIClient
 from trailblazer.clients.slurm_cli_client.slurm_cli_client import SlurmCLIClient
+from trailblazer.clients.slurm_cli_client.ssh_connection import open_ssh_connection
 from trailblazer.clients.tower.tower_client import TowerAPIClient
+from trailblazer.constants import TOWER_TASKS_PAGE_SIZE
 from trailblazer.services.analysis_service.analysis_service import AnalysisService
 from trailblazer.services.authentication_service.authentication_service import AuthenticationService
 from trailblazer.services.encryption_service.encryption_service import EncryptionService
@@ -13,9 +15,13 @@ from trailblazer.services.job_service import JobService
 from trailblazer.services.slurm.slurm_api_service.slurm_api_service import SlurmAPIService
 from trailblazer.services.slurm.slurm_cli_service.slurm_cli_service import SlurmCLIService
 from trailblazer.services.tower.tower_api_service import TowerAPIService
+from trailblazer.services.user_verification_service.google_certs_cache import GoogleCertsCache
 from trailblazer.services.user_verification_service.user_verification_service import (
     UserVerificationService,
 )
+from trailblazer.services.user_verification_service.verified_token_cache import (
+    VerifiedTokenCache,
+)
 from trailblazer.store.store import Store
 
 
@@ -33,6 +39,7 @@ class Container(containers.DeclarativeContainer):
     tower_base_url: str | None = os.environ.get("TOWER_API_ENDPOINT")
     tower_access_token: str | None = os.environ.get("TOWER_ACCESS_TOKEN")
     tower_workspace_id: str | None = os.environ.get("TOWER_WORKSPACE_ID")
+    tower_tasks_page_size: int = int(os.environ.get("TOWER_TASKS_PAGE_SIZE", TOWER_TASKS_PAGE_SIZE))
 
     google_api_client = GoogleAPIClient(google_api_base_url)
 
@@ -53,9 +60,12 @@ class Container(containers.DeclarativeContainer):
             access_token=slurm_jwt_token,
             user_name=slurm_user_name,
         )
-        slurm_service = providers.Singleton(SlurmAPIService, client=slurm_client)
+        slurm_service = providers.Singleton(SlurmAPIService, client=slurm_client, store=store)
     else:
-        slurm_client = providers.Singleton(SlurmCLIClient, host=slurm_host)
+        slurm_ssh_connection = providers.Resource(open_ssh_connection, host=slurm_host)
+        slurm_client = providers.Singleton(
+            SlurmCLIClient, host=slurm_host, ssh_connection=slurm_ssh_connection
+        )
         slurm_service = providers.Singleton(SlurmCLIService, client=slurm_client, store=store)
 
     tower_client = providers.Singleton(
@@ -63,6 +73,7 @@ class Container(containers.DeclarativeContainer):
         base_url=tower_base_url,
         access_token=tower_access_token,
         workspace_id=tower_workspace_id,
+        page_size=tower_tasks_page_size,
     )
 
     tower_service = providers.Singleton(
@@ -81,10 +92,15 @@ class Container(containers.DeclarativeContainer):
 
     encryption_service = providers.Singleton(EncryptionService, secret_key=encryption_key)
 
+    google_certs_cache = providers.Singleton(GoogleCertsCache)
+    verified_token_cache = providers.Singleton(VerifiedTokenCache)
+
     user_verification_service = providers.Singleton(
         UserVerificationService,
         store=store,
         oauth_client_id=oauth_client_id,
+        certs_cache=google_certs_cache,
+        token_cache=verified_token_cache,
     )
 
     auth_service = providers.Singleton(
@@ -1,5 +1,8 @@
+import base64
+import binascii
+from datetime import datetime
 from enum import StrEnum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from trailblazer.constants import (
     TrailblazerPriority,
@@ -16,6 +19,36 @@ class AnalysisSortField(StrEnum):
     STATUS: str = "status"
     UPLOADED_AT: str = "uploaded_at"
 
+    @classmethod
+    def datetime_fields(cls) -> tuple:
+        return cls.STARTED_AT, cls.UPLOADED_AT
+
+
+class AnalysesCursor(BaseModel):
+    """Position after the last analysis of a page, given by its sort field value and id, in the
+    sorting the page was requested with."""
+
+    sort_field: AnalysisSortField
+    sort_order: SortOrder
+    value: str | None = None
+    id: int
+
+    @model_validator(mode="after")
+    def validate_value(self) -> "AnalysesCursor":
+        if self.value is not None and self.sort_field in AnalysisSortField.datetime_fields():
+            datetime.fromisoformat(self.value)
+        return self
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def decode(cls, cursor: str) -> "AnalysesCursor":
+        try:
+            return cls.model_validate_json(base64.urlsafe_b64decode(cursor.encode()))
+        except binascii.Error as error:
+            raise ValueError("Invalid cursor") from error
+
 
 class AnalysesRequest(BaseModel):
     workflow: str = ""
@@ -33,3 +66,21 @@ class AnalysesRequest(BaseModel):
     case_id: str | None = None
     delivered: bool | None = None
     include_hidden: bool | None = Field(alias="includeHidden", default=None)
+    cursor: AnalysesCursor | None = None
+    include_total_count: bool = Field(alias="includeTotalCount", default=True)
+
+    @field_validator("cursor", mode="before")
+    @classmethod
+    def decode_cursor(cls, cursor: str | AnalysesCursor | None) -> AnalysesCursor | None:
+        if isinstance(cursor, str):
+            return AnalysesCursor.decode(cursor) if cursor else None
+        return cursor
+
+    @model_validator(mode="after")
+    def validate_cursor_sorting(self) -> "AnalysesRequest":
+        """Reject cursors created for another sorting, which would page from the wrong position."""
+        if self.cursor and (
+            self.cursor.sort_field != self.sort_field or self.cursor.sort_order != self.sort_order
+        ):
+            raise ValueError("The cursor was created for a different sort field or order")
+        return self
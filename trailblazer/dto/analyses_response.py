@@ -44,7 +44,8 @@ class Analysis(BaseModel):
 
 class AnalysesResponse(BaseModel):
     analyses: list[Analysis]
-    total_count: int
+    total_count: int | None = None
+    next_cursor: str | None = None
 
 
 class UpdateAnalysesResponse(BaseModel):
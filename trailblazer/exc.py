@@ -19,6 +19,10 @@ class CancelSlurmAnalysisNotSupportedError(TrailblazerError):
         self.message = "Cancelling SLURM analysis via the web app is not supported"
 
 
+class CancelSlurmJobsError(TrailblazerError):
+    """Raised when SLURM jobs could not be cancelled."""
+
+
 class MissingFileError(TrailblazerError):
     pass
 
@@ -8,8 +8,9 @@ from trailblazer.constants import FileExtension
 from trailblazer.io.validate_path import validate_file_suffix
 
 
-def read_yaml(file_path: Path) -> Any:
-    """Read content in a YAML file."""
+def read_yaml(file_path: Path, pure: bool = True) -> Any:
+    """Read content in a YAML file.
+    Unless pure is set, the C loader is used if ruamel.yaml.clib is installed."""
     validate_file_suffix(path_to_validate=file_path, target_suffix=FileExtension.YAML)
-    yaml: YAML = YAML(typ="safe", pure=True)
+    yaml: YAML = YAML(typ="safe", pure=pure)
     return yaml.load(file_path)
@@ -1,7 +1,31 @@
 from pydantic import BaseModel, Field
 
+from trailblazer.constants import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_PRE_PING_IDLE_TIME,
+    DEFAULT_SLOW_QUERY_THRESHOLD,
+    PrePingStrategy,
+)
 
-class Config(BaseModel):
+
+class DatabaseSettings(BaseModel):
+    """Settings of the database engine and its connection pool.
+    The pool size, overflow, timeout and recycle only apply to pooled databases, not to SQLite."""
+
+    slow_query_threshold: float = Field(DEFAULT_SLOW_QUERY_THRESHOLD)
+    pool_size: int = Field(DB_POOL_SIZE)
+    max_overflow: int = Field(DB_MAX_OVERFLOW)
+    pool_timeout: int = Field(DB_POOL_TIMEOUT)
+    pool_recycle: int = Field(DB_POOL_RECYCLE)
+    pool_pre_ping: PrePingStrategy = Field(PrePingStrategy.IDLE)
+    pre_ping_idle_time: int = Field(DB_PRE_PING_IDLE_TIME)
+    isolation_level: str | None = None
+
+
+class Config(DatabaseSettings):
     """Initialize base settings."""
 
     database_url: str = Field("sqlite:///:memory:")
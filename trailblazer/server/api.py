@@ -36,6 +36,7 @@ from trailblazer.services.user_verification_service.user_verification_service im
     UserVerificationService,
 )
 from trailblazer.store.models import Info, User
+from trailblazer.utils.metrics import AUTH_VERIFICATION_DURATION
 
 blueprint = Blueprint("api", __name__, url_prefix="/api/v1")
 
@@ -55,15 +56,16 @@ def before_request(
     if os.environ.get("SCOPE") == "DEVELOPMENT":
         return
     try:
-        if request.headers.get("X-On-Behalf-Of"):
-            user_verification_service.verify_user(request.headers.get("Authorization"))
-            g.current_user = user_verification_service.verify_user(
-                request.headers.get("X-On-Behalf-Of")
-            )
-        else:
-            g.current_user = user_verification_service.verify_user(
-                request.headers.get("Authorization")
-            )
+        with AUTH_VERIFICATION_DURATION.time():
+            if request.headers.get("X-On-Behalf-Of"):
+                user_verification_service.verify_user(request.headers.get("Authorization"))
+                g.current_user = user_verification_service.verify_user(
+                    request.headers.get("X-On-Behalf-Of")
+                )
+            else:
+                g.current_user = user_verification_service.verify_user(
+                    request.headers.get("Authorization")
+                )
     except (UserTokenVerificationError, ValueError) as error:
         abort(HTTPStatus.UNAUTHORIZED, str(error))
 
@@ -1,17 +1,32 @@
+import atexit
 import logging
 import os
 
-from flask import Flask
+import time
+from pathlib import Path
+
+from flask import Flask, Response, g, request
 from flask_cors import CORS
 from flask_reverse_proxy import FlaskReverseProxied
 from sqlalchemy.orm import scoped_session
 
+from trailblazer.constants import METRICS_SNAPSHOT_INTERVAL
+from trailblazer.containers import Container
 from trailblazer.server import api, ext
 from trailblazer.server.wiring import setup_dependency_injection
 from trailblazer.store.database import get_session
+from trailblazer.store.instrumentation import (
+    QueryStats,
+    get_query_stats,
+    start_query_tracking,
+    stop_query_tracking,
+)
+from trailblazer.utils.metrics import CONTENT_TYPE, REGISTRY, REQUEST_DURATION
 
 app = Flask(__name__)
-setup_dependency_injection()
+container: Container = setup_dependency_injection()
+# Release resources, such as the SSH connection to the analysis host, when the worker exits
+atexit.register(container.shutdown_resources)
 
 LOG = logging.getLogger(__name__)
 
@@ -19,8 +34,16 @@ LOG = logging.getLogger(__name__)
 SECRET_KEY = "unsafe!!!"
 TEMPLATES_AUTO_RELOAD = True
 SQLALCHEMY_DATABASE_URI = os.environ.get("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+SQLALCHEMY_POOL_SIZE = os.environ.get("SQLALCHEMY_POOL_SIZE")
+SQLALCHEMY_MAX_OVERFLOW = os.environ.get("SQLALCHEMY_MAX_OVERFLOW")
+SQLALCHEMY_POOL_TIMEOUT = os.environ.get("SQLALCHEMY_POOL_TIMEOUT")
 SQLALCHEMY_POOL_RECYCLE = os.environ.get("SQLALCHEMY_POOL_RECYCLE", 7200)
+SQLALCHEMY_POOL_PRE_PING = os.environ.get("SQLALCHEMY_POOL_PRE_PING")
+SQLALCHEMY_PRE_PING_IDLE_TIME = os.environ.get("SQLALCHEMY_PRE_PING_IDLE_TIME")
+SQLALCHEMY_ISOLATION_LEVEL = os.environ.get("SQLALCHEMY_ISOLATION_LEVEL")
 SQLALCHEMY_TRACK_MODIFICATIONS = os.environ.get("FLASK_DEBUG", False)
+SLOW_QUERY_THRESHOLD = os.environ.get("SLOW_QUERY_THRESHOLD")
+METRICS_DIRECTORY = os.environ.get("METRICS_DIRECTORY")
 
 app.config.from_object(__name__)
 
@@ -38,6 +61,50 @@ def index():
     return "Welcome to Trailblazer REST API"
 
 
+@app.route("/metrics")
+def metrics():
+    """Serve the metrics of this worker, or of all workers if they share a metrics directory."""
+    if metrics_directory := app.config.get("METRICS_DIRECTORY"):
+        REGISTRY.write_snapshot(Path(metrics_directory))
+        return Response(
+            REGISTRY.render_snapshots(Path(metrics_directory)), content_type=CONTENT_TYPE
+        )
+    return Response(REGISTRY.render(), content_type=CONTENT_TYPE)
+
+
+@app.before_request
+def track_queries():
+    g.request_started_at = time.perf_counter()
+    g.query_tracking = start_query_tracking()
+
+
+@app.after_request
+def add_query_stats_headers(response: Response) -> Response:
+    """Observe the request duration and expose the number of queries and the database time of the
+    request in development."""
+    if started_at := g.get("request_started_at"):
+        REQUEST_DURATION.observe(
+            time.perf_counter() - started_at,
+            endpoint=request.endpoint or "unknown",
+            method=request.method,
+            status=response.status_code,
+        )
+    if metrics_directory := app.config.get("METRICS_DIRECTORY"):
+        REGISTRY.write_snapshot(Path(metrics_directory), min_interval=METRICS_SNAPSHOT_INTERVAL)
+    query_stats: QueryStats | None = get_query_stats()
+    if query_stats and os.environ.get("SCOPE") == "DEVELOPMENT":
+        response.headers["X-Query-Count"] = str(query_stats.count)
+        response.headers["X-Query-Time"] = f"{query_stats.total_time * 1000:.1f}ms"
+    return response
+
+
+@app.teardown_request
+def stop_tracking_queries(_):
+    if query_tracking := g.pop("query_tracking", None):
+        if query_stats := stop_query_tracking(query_tracking):
+            LOG.debug(f"Database: {query_stats.get_summary()}")
+
+
 @app.teardown_appcontext
 def teardown_session(_):
     """
@@ -1,7 +1,27 @@
 from flask import Flask
+from trailblazer.models import DatabaseSettings
 from trailblazer.store.database import initialize_database
 from trailblazer.store.store import Store
 
+DATABASE_SETTINGS_KEYS: dict[str, str] = {
+    "slow_query_threshold": "SLOW_QUERY_THRESHOLD",
+    "pool_size": "SQLALCHEMY_POOL_SIZE",
+    "max_overflow": "SQLALCHEMY_MAX_OVERFLOW",
+    "pool_timeout": "SQLALCHEMY_POOL_TIMEOUT",
+    "pool_recycle": "SQLALCHEMY_POOL_RECYCLE",
+    "pool_pre_ping": "SQLALCHEMY_POOL_PRE_PING",
+    "pre_ping_idle_time": "SQLALCHEMY_PRE_PING_IDLE_TIME",
+    "isolation_level": "SQLALCHEMY_ISOLATION_LEVEL",
+}
+
+
+def get_database_settings(config: dict) -> DatabaseSettings:
+    """Return the database settings given in the app config, using the defaults for the rest."""
+    settings: dict = {
+        field: config[key] for field, key in DATABASE_SETTINGS_KEYS.items() if config.get(key)
+    }
+    return DatabaseSettings(**settings)
+
 
 class FlaskStore(Store):
     def __init__(self, app=None):
@@ -10,7 +30,7 @@ class FlaskStore(Store):
 
     def init_app(self, app: Flask):
         uri = app.config["SQLALCHEMY_DATABASE_URI"]
-        initialize_database(uri)
+        initialize_database(uri, settings=get_database_settings(app.config))
         super(FlaskStore, self).__init__()
 
 
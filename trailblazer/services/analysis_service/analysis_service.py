@@ -1,4 +1,7 @@
 import logging
+from datetime import datetime
+
+from sqlalchemy import Row
 
 from trailblazer.constants import TrailblazerStatus, Workflow, WorkflowManager
 from trailblazer.dto import (
@@ -13,16 +16,21 @@ from trailblazer.dto.summaries_request import SummariesRequest
 from trailblazer.dto.summaries_response import SummariesResponse, Summary
 from trailblazer.dto.update_analyses import UpdateAnalyses
 from trailblazer.exc import CancelSlurmAnalysisNotSupportedError, MissingAnalysis
+from trailblazer.exceptions import JobServiceError
 from trailblazer.services.analysis_service.utils import (
     create_analysis_response,
-    create_summary,
+    create_summaries,
     create_update_analyses_response,
+    get_scan_interval,
     get_upload_date,
+    is_due_for_scan,
 )
 from trailblazer.services.job_service.job_service import JobService
 from trailblazer.store.database import get_session
+from trailblazer.store.loading_profiles import AnalysisLoadingProfile
 from trailblazer.store.models import Analysis, Job, User
 from trailblazer.store.store import Store
+from trailblazer.utils.metrics import SCAN_DURATION
 
 LOG = logging.getLogger(__name__)
 
@@ -44,7 +52,9 @@ class AnalysisService:
         )
 
     def cancel_analysis_from_web(self, analysis_id: int) -> AnalysisResponse:
-        analysis: Analysis = self.store.get_analysis_with_id(analysis_id)
+        analysis: Analysis = self.store.get_analysis_with_id(
+            analysis_id=analysis_id, loading_profile=AnalysisLoadingProfile.DETAIL
+        )
 
         if analysis.workflow_manager == WorkflowManager.SLURM:
             raise CancelSlurmAnalysisNotSupportedError()
@@ -53,14 +63,34 @@ class AnalysisService:
         return create_analysis_response(analysis)
 
     def get_analyses(self, request: AnalysesRequest) -> AnalysesResponse:
-        analyses, total_count = self.store.get_paginated_analyses(request)
-        return self.create_analyses_response(analyses=analyses, total_count=total_count)
+        analyses, total_count, next_cursor = self.store.get_paginated_analyses(request)
+        return self.create_analyses_response(
+            analyses=analyses, total_count=total_count, next_cursor=next_cursor
+        )
 
     def get_analysis(self, analysis_id: int) -> AnalysisResponse:
-        if not (analysis := self.store.get_analysis_with_id(analysis_id)):
+        if not (
+            analysis := self.store.get_analysis_with_id(
+                analysis_id=analysis_id, loading_profile=AnalysisLoadingProfile.DETAIL
+            )
+        ):
             raise MissingAnalysis(f"Analysis with id: {analysis_id} not found")
+        if (
+            analysis.workflow_manager == WorkflowManager.TOWER
+            and analysis.status in TrailblazerStatus.ongoing_statuses()
+        ):
+            self._refresh_tower_jobs(analysis.id)
         return create_analysis_response(analysis)
 
+    def _refresh_tower_jobs(self, analysis_id: int) -> None:
+        """Fetch the tasks of an ongoing Tower analysis whose workflow has changed, as they are not
+        fetched by the scans while its workflow is running, falling back to the stored jobs if
+        Tower is unavailable."""
+        try:
+            self.job_service.update_jobs(analysis_id)
+        except JobServiceError as error:
+            LOG.warning(f"Failed to fetch the Tower tasks of analysis {analysis_id}: {error}")
+
     def update_analysis(
         self, analysis_id: int, update: AnalysisUpdateRequest, user: User
     ) -> AnalysisResponse:
@@ -88,15 +118,20 @@ class AnalysisService:
         return create_analysis_response(analysis)
 
     def create_analyses_response(
-        self, analyses: list[Analysis], total_count: int
+        self, analyses: list[Analysis], total_count: int | None, next_cursor: str | None = None
     ) -> AnalysesResponse:
         response_data: list[dict] = []
+        failed_jobs: dict[int, Job] = self.store.get_latest_failed_jobs_for_analyses(
+            [analysis.id for analysis in analyses]
+        )
         for analysis in analyses:
             analysis_data = analysis.to_dict()
-            failed_job: Job = self.store.get_latest_failed_job_for_analysis(analysis.id)
+            failed_job: Job | None = failed_jobs.get(analysis.id)
             analysis_data["failed_job"] = failed_job.to_dict() if failed_job else None
             response_data.append(analysis_data)
-        return AnalysesResponse(analyses=response_data, total_count=total_count)
+        return AnalysesResponse(
+            analyses=response_data, total_count=total_count, next_cursor=next_cursor
+        )
 
     def update_uploading_analyses(self):
         self.job_service.update_upload_jobs()
@@ -107,20 +142,72 @@ class AnalysisService:
                     analysis_id=analysis.id, uploaded_at=upload_date
                 )
 
-    def update_ongoing_analyses(self) -> None:
-        analyses: list[Analysis] = self.store.get_ongoing_analyses()
+    def update_ongoing_analyses(self, max_workers: int = 1) -> None:
+        """Update the jobs, progress and status of all ongoing analyses.
+        Remote lookups are run concurrently and finished before the database is written, which is
+        only done from this thread. The analyses and their jobs are loaded once and the updates
+        of each analysis are committed on their own.
+        Analyses which have been pending for long are backed off and scanned less often."""
+        with SCAN_DURATION.time(), self.store.scan_context(), self.job_service.scan_context():
+            self._update_ongoing_analyses(max_workers)
+
+    def _update_ongoing_analyses(self, max_workers: int) -> None:
+        now = datetime.now()
+        analyses: list[Analysis] = [
+            analysis
+            for analysis in self.store.get_ongoing_analyses()
+            if is_due_for_scan(analysis=analysis, now=now)
+        ]
+        errors: dict[int, Exception] = self.job_service.update_jobs_for_analyses(
+            analyses=analyses, max_workers=max_workers
+        )
+        updated_analyses: list[Analysis] = [
+            analysis for analysis in analyses if analysis.id not in errors
+        ]
+        statuses, status_errors = self.job_service.get_analysis_statuses(
+            analyses=updated_analyses, max_workers=max_workers
+        )
+        errors.update(status_errors)
         for analysis in analyses:
             try:
-                self.update_analysis_meta_data(analysis.id)
+                with self.store.analysis_transaction():
+                    self._update_scanned_analysis(
+                        analysis=analysis,
+                        now=now,
+                        status=statuses.get(analysis.id),
+                        error=errors.get(analysis.id),
+                    )
             except Exception as error:
-                self.store.update_analysis_status(analysis.id, TrailblazerStatus.ERROR)
-                LOG.error(f"Failed to update analysis {analysis.id}: {error}")
+                LOG.error(f"Failed to store the update of analysis {analysis.id}: {error}")
+
+    def _update_scanned_analysis(
+        self,
+        analysis: Analysis,
+        now: datetime,
+        status: TrailblazerStatus | None,
+        error: Exception | None,
+    ) -> None:
+        if get_scan_interval(analysis=analysis, now=now):
+            self.store.update_analysis_scanned_at(analysis_id=analysis.id, scanned_at=now)
+        try:
+            if error:
+                raise error
+            self._update_progress(analysis.id)
+            self.store.update_analysis_status(analysis_id=analysis.id, status=status)
+        except Exception as error:
+            self.store.update_analysis_status(analysis.id, TrailblazerStatus.ERROR)
+            LOG.error(f"Failed to update analysis {analysis.id}: {error}")
 
     def update_analysis_meta_data(self, analysis_id: int) -> None:
-        """Update the jobs, progress and status of an analysis."""
-        self.job_service.update_jobs(analysis_id)
-        self._update_progress(analysis_id)
-        self._update_status(analysis_id)
+        """Update the jobs, progress and status of an analysis.
+        The analysis and its jobs are loaded once and all updates are committed together."""
+        with self.store.scan_context(), self.job_service.scan_context():
+            analysis: Analysis = self.store.get_analysis_with_id(
+                analysis_id=analysis_id, loading_profile=AnalysisLoadingProfile.SCAN
+            )
+            self.job_service.update_jobs(analysis.id)
+            self._update_progress(analysis.id)
+            self._update_status(analysis.id)
 
     def _update_status(self, analysis_id: int) -> None:
         status: TrailblazerStatus = self.job_service.get_analysis_status(analysis_id)
@@ -131,9 +218,10 @@ class AnalysisService:
         self.store.update_analysis_progress(analysis_id=analysis_id, progress=progress)
 
     def get_summaries(self, request_data: SummariesRequest) -> SummariesResponse:
-        summaries: list[Summary] = []
-        for order_id in request_data.order_ids:
-            analyses: list[Analysis] = self.store.get_latest_analyses_for_order(order_id)
-            summary: Summary = create_summary(analyses=analyses, order_id=order_id)
-            summaries.append(summary)
+        analyses: list[Row] = self.store.get_latest_analysis_statuses_for_orders(
+            request_data.order_ids
+        )
+        summaries: list[Summary] = create_summaries(
+            analyses=analyses, order_ids=request_data.order_ids
+        )
         return SummariesResponse(summaries=summaries)
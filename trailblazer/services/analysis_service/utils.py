@@ -1,5 +1,13 @@
 from datetime import datetime, timedelta
-from trailblazer.constants import SlurmJobStatus, TrailblazerStatus, Workflow
+
+from sqlalchemy import Row
+
+from trailblazer.constants import (
+    PENDING_SCAN_BACKOFF,
+    SlurmJobStatus,
+    TrailblazerStatus,
+    Workflow,
+)
 from trailblazer.dto.analyses_response import UpdateAnalysesResponse
 from trailblazer.dto.analysis_response import AnalysisResponse
 from trailblazer.dto.summaries_response import StatusSummary, Summary
@@ -7,13 +15,13 @@ from trailblazer.store.models import Analysis
 from trailblazer.store.models import Job
 
 
-def get_status_counts(analyses: list[Analysis]) -> dict[TrailblazerStatus, StatusSummary]:
+def get_status_counts(analyses: list[Row]) -> dict[TrailblazerStatus, StatusSummary]:
     """Returns the number of analyses with each status."""
     delivered: int = 0
     delivered_cases: list[str] = []
     status_counts: dict = {status: StatusSummary() for status in TrailblazerStatus}
     for analysis in analyses:
-        if analysis.delivery:
+        if analysis.is_delivered:
             delivered += 1
             delivered_cases.append(analysis.case_id)
         else:
@@ -23,12 +31,23 @@ def get_status_counts(analyses: list[Analysis]) -> dict[TrailblazerStatus, Statu
     return status_counts
 
 
-def create_summary(analyses: list[Analysis], order_id: int) -> Summary:
+def create_summary(analyses: list[Row], order_id: int) -> Summary:
     total: int = len(analyses)
     status_counts: dict[TrailblazerStatus, StatusSummary] = get_status_counts(analyses)
     return Summary(order_id=order_id, total=total, **status_counts)
 
 
+def create_summaries(analyses: list[Row], order_ids: list[int]) -> list[Summary]:
+    """Create a summary per order from the latest analysis statuses of all orders."""
+    analyses_per_order: dict[int, list[Row]] = {order_id: [] for order_id in order_ids}
+    for analysis in analyses:
+        analyses_per_order[analysis.order_id].append(analysis)
+    return [
+        create_summary(analyses=analyses_per_order[order_id], order_id=order_id)
+        for order_id in order_ids
+    ]
+
+
 def create_analysis_response(analysis: Analysis) -> AnalysisResponse:
     analysis_data: dict = analysis.to_dict()
     analysis_data["jobs"] = [job.to_dict() for job in analysis.analysis_jobs]
@@ -45,6 +64,24 @@ def create_update_analyses_response(analyses: list[Analysis]) -> UpdateAnalysesR
     return UpdateAnalysesResponse(analyses=response_data)
 
 
+def get_scan_interval(analysis: Analysis, now: datetime) -> timedelta:
+    """Return the minimum time between scans of an analysis.
+    Analyses which have been pending for long are backed off, other analyses are always scanned."""
+    if analysis.status != TrailblazerStatus.PENDING or not analysis.started_at:
+        return timedelta(0)
+    pending_for: timedelta = now - analysis.started_at
+    for pending_time, interval in PENDING_SCAN_BACKOFF:
+        if pending_for >= pending_time:
+            return interval
+    return timedelta(0)
+
+
+def is_due_for_scan(analysis: Analysis, now: datetime) -> bool:
+    if not analysis.scanned_at:
+        return True
+    return now - analysis.scanned_at >= get_scan_interval(analysis=analysis, now=now)
+
+
 def get_upload_date(analysis: Analysis) -> datetime | None:
     completed_job: Job | None = _get_completed_job(analysis.upload_jobs)
     if not completed_job:
@@ -1,5 +1,8 @@
+from contextlib import contextmanager
 from datetime import datetime
+from functools import partial
 import logging
+from typing import Callable, Iterator
 
 from trailblazer.constants import TrailblazerStatus, WorkflowManager
 from trailblazer.dto import CreateJobRequest, FailedJobsRequest, FailedJobsResponse, JobResponse
@@ -55,6 +58,81 @@ class JobService:
             LOG.error(f"Failed to update jobs {analysis.case_id} - {analysis.id}: {error}")
             raise JobServiceError from error
 
+    @contextmanager
+    def scan_context(self) -> Iterator[None]:
+        """Keep the Tower workflows fetched within a scan for its progress and status lookups."""
+        with self.tower_service.keep_workflows():
+            yield
+
+    def update_jobs_for_analyses(
+        self, analyses: list[Analysis], max_workers: int = 1
+    ) -> dict[int, Exception]:
+        """Update the jobs of the analyses, batching the SLURM lookups into one queue query and
+        fetching the Tower tasks concurrently.
+        All remote lookups are finished before any jobs are written, and the jobs of each analysis
+        are written in their own transaction so that a failing analysis does not fail the others.
+        Returns the errors of the analyses whose jobs could not be updated."""
+        slurm_analysis_ids: list[int] = self._get_analysis_ids(analyses, WorkflowManager.SLURM)
+        tower_analysis_ids: list[int] = self._get_analysis_ids(analyses, WorkflowManager.TOWER)
+        slurm_jobs, slurm_errors = self.slurm_service.get_jobs_for_analyses(slurm_analysis_ids)
+        tower_jobs, tower_errors = self.tower_service.get_jobs_for_analyses(
+            analysis_ids=tower_analysis_ids, max_workers=max_workers
+        )
+        errors: dict[int, Exception] = slurm_errors | tower_errors
+        job_writes: dict[int, Callable[[], None]] = {
+            analysis_id: partial(
+                self.store.replace_jobs, analysis_id=analysis_id, jobs=jobs, fingerprint=fingerprint
+            )
+            for analysis_id, (jobs, fingerprint) in slurm_jobs.items()
+        } | {
+            analysis_id: partial(
+                self.tower_service.store_jobs,
+                analysis_id=analysis_id,
+                jobs=jobs,
+                workflow_updated_at=workflow_updated_at,
+            )
+            for analysis_id, (jobs, workflow_updated_at) in tower_jobs.items()
+        }
+        for analysis_id, write_jobs in job_writes.items():
+            try:
+                with self.store.analysis_transaction():
+                    write_jobs()
+            except Exception as error:
+                errors[analysis_id] = error
+        for analysis_id, error in errors.items():
+            LOG.error(f"Failed to update jobs for analysis {analysis_id}: {error}")
+        return {analysis_id: JobServiceError(error) for analysis_id, error in errors.items()}
+
+    def get_analysis_statuses(
+        self, analyses: list[Analysis], max_workers: int = 1
+    ) -> tuple[dict[int, TrailblazerStatus], dict[int, Exception]]:
+        """Return the status of the analyses, fetching the Tower workflow statuses concurrently.
+        Returns the statuses and the errors of the analyses whose status could not be determined.
+        """
+        tower_analysis_ids: list[int] = [
+            analysis.id
+            for analysis in analyses
+            if analysis.workflow_manager == WorkflowManager.TOWER
+            and analysis.status != TrailblazerStatus.CANCELLED
+        ]
+        statuses, errors = self.tower_service.get_statuses(
+            analysis_ids=tower_analysis_ids, max_workers=max_workers
+        )
+        for analysis in analyses:
+            if analysis.id in tower_analysis_ids:
+                continue
+            try:
+                statuses[analysis.id] = self.get_analysis_status(analysis.id)
+            except Exception as error:
+                errors[analysis.id] = error
+        return statuses, errors
+
+    @staticmethod
+    def _get_analysis_ids(analyses: list[Analysis], workflow_manager: WorkflowManager) -> list[int]:
+        return [
+            analysis.id for analysis in analyses if analysis.workflow_manager == workflow_manager
+        ]
+
     def get_analysis_status(self, analysis_id: int) -> TrailblazerStatus:
         analysis: Analysis = self.store.get_analysis_with_id(analysis_id)
 
@@ -71,6 +149,8 @@ class JobService:
 
     def get_analysis_progression(self, analysis_id: int) -> float:
         analysis: Analysis = self.store.get_analysis_with_id(analysis_id)
+        if analysis.workflow_manager == WorkflowManager.TOWER:
+            return self.tower_service.get_progress(analysis_id)
         return get_progress(analysis.jobs)
 
     def cancel_jobs(self, analysis_id: int) -> None:
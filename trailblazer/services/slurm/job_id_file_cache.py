@@ -0,0 +1,79 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+
+from trailblazer.constants import JOB_ID_FILE_CACHE_SIZE, FileExtension
+from trailblazer.io.validate_path import validate_file_suffix
+from trailblazer.io.yaml import read_yaml
+
+JOB_ID_LINE = re.compile(r"""^\s*-\s*(['"]?)(\d+)\1\s*$""")
+KEY_LINE = re.compile(r"""^[^\s#'"-][^:#]*:\s*$""")
+
+
+class FileVersion(NamedTuple):
+    modified_at: int
+    size: int
+
+
+class JobIdFileCache:
+    """Bounded LRU cache of the job ids in SLURM job id files.
+    Entries are keyed by the path of the file and only reused while the modification time and size
+    of the file are unchanged, so unchanged files are only stat:ed and never re-read."""
+
+    def __init__(self, max_size: int = JOB_ID_FILE_CACHE_SIZE):
+        self.max_size = max_size
+        self._job_ids: OrderedDict[Path, tuple[FileVersion, list[int]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_job_ids(self, file_path: Path) -> list[int]:
+        validate_file_suffix(path_to_validate=file_path, target_suffix=FileExtension.YAML)
+        version: FileVersion = get_file_version(file_path)
+        with self._lock:
+            if cached := self._job_ids.get(file_path):
+                cached_version, job_ids = cached
+                if cached_version == version:
+                    self._job_ids.move_to_end(file_path)
+                    return list(job_ids)
+        job_ids: list[int] = read_job_ids(file_path)
+        with self._lock:
+            self._job_ids[file_path] = (version, job_ids)
+            self._job_ids.move_to_end(file_path)
+            while len(self._job_ids) > self.max_size:
+                self._job_ids.popitem(last=False)
+        return list(job_ids)
+
+
+def get_file_version(file_path: Path) -> FileVersion:
+    stat: os.stat_result = file_path.stat()
+    return FileVersion(modified_at=stat.st_mtime_ns, size=stat.st_size)
+
+
+def read_job_ids(file_path: Path) -> list[int]:
+    """Read the job ids of a job id file, falling back to a YAML loader for files which are not
+    plain lists of job ids per key."""
+    job_ids: list[int] | None = parse_job_ids(file_path.read_text())
+    if job_ids is not None:
+        return job_ids
+    content: dict = read_yaml(file_path=file_path, pure=False)
+    return [int(job_id) for row in content.values() for job_id in row]
+
+
+def parse_job_ids(content: str) -> list[int] | None:
+    """Parse job ids in the known job id file format, with block lists of ids under each key.
+    Returns None if the content is not in that format."""
+    job_ids: list[int] = []
+    has_keys: bool = False
+    for line in content.splitlines():
+        stripped_line: str = line.strip()
+        if not stripped_line or stripped_line == "---" or stripped_line.startswith("#"):
+            continue
+        if match := JOB_ID_LINE.match(line):
+            job_ids.append(int(match.group(2)))
+        elif KEY_LINE.match(line):
+            has_keys = True
+        else:
+            return None
+    return job_ids if has_keys else None
@@ -10,3 +10,13 @@ def create_job(job_dto: SlurmJobInfo) -> Job:
         started_at=job_dto.started_at,
         elapsed=job_dto.elapsed,
     )
+
+
+def create_job_info(job: Job) -> SlurmJobInfo:
+    return SlurmJobInfo(
+        slurm_id=job.slurm_id,
+        status=job.status,
+        name=job.name,
+        started_at=job.started_at,
+        elapsed=job.elapsed,
+    )
@@ -1,10 +1,16 @@
+from trailblazer.clients.slurm_api_client.dto.common import SlurmAPIJobInfo
 from trailblazer.clients.slurm_api_client.dto.job_response import SlurmJobResponse
+from trailblazer.clients.slurm_api_client.dto.jobs_response import SlurmJobsResponse
 from trailblazer.clients.slurm_api_client.slurm_api_client import SlurmAPIClient
+from trailblazer.exc import MissingJob
 from trailblazer.services.slurm.dtos import SlurmJobInfo
-from trailblazer.services.slurm.slurm_api_service.mappers import create_job
-from trailblazer.services.slurm.slurm_api_service.utils import create_job_info_dto
+from trailblazer.services.slurm.slurm_api_service.mappers import create_job, create_job_info
+from trailblazer.services.slurm.slurm_api_service.utils import (
+    create_job_info_dto,
+    create_job_info_dto_from_job,
+)
 from trailblazer.services.slurm.slurm_service import SlurmService
-from trailblazer.services.slurm.utils import get_slurm_job_ids
+from trailblazer.services.slurm.utils import get_jobs_fingerprint, get_slurm_job_ids
 from trailblazer.store.models import Analysis, Job
 from trailblazer.store.store import Store
 
@@ -28,7 +34,59 @@ class SlurmAPIService(SlurmService):
                 dtos.append(job)
 
         jobs: list[Job] = [create_job(dto) for dto in dtos]
-        self.store.replace_jobs(analysis_id=analysis_id, jobs=jobs)
+        self.store.replace_jobs(
+            analysis_id=analysis_id, jobs=jobs, fingerprint=get_jobs_fingerprint(dtos)
+        )
+
+    def get_jobs_for_analyses(
+        self, analysis_ids: list[int]
+    ) -> tuple[dict[int, tuple[list[Job], str]], dict[int, Exception]]:
+        """Return the jobs of all given analyses from a single request to the jobs endpoint.
+        Only the jobs of the analyses are converted, and a job failure is returned for the
+        analysis it belongs to. Stored jobs which have aged out of the controller are kept as
+        stored."""
+        jobs_per_analysis: dict[int, tuple[list[Job], str]] = {}
+        errors: dict[int, Exception] = {}
+        job_ids_per_analysis: dict[int, list[int]] = {}
+        stored_jobs_per_analysis: dict[int, dict[int, Job]] = {}
+        fingerprints: dict[int, str | None] = {}
+        for analysis_id in analysis_ids:
+            try:
+                analysis: Analysis = self.store.get_analysis_with_id(analysis_id)
+                job_ids_per_analysis[analysis_id] = get_slurm_job_ids(analysis.config_path)
+                stored_jobs_per_analysis[analysis_id] = {
+                    job.slurm_id: job for job in analysis.analysis_jobs
+                }
+                fingerprints[analysis_id] = analysis.job_fingerprint
+            except Exception as error:
+                errors[analysis_id] = error
+
+        if not job_ids_per_analysis:
+            return jobs_per_analysis, errors
+        try:
+            jobs_response: SlurmJobsResponse = self.client.get_jobs()
+        except Exception as error:
+            return {}, errors | {analysis_id: error for analysis_id in job_ids_per_analysis}
+        jobs_by_id: dict[int, SlurmAPIJobInfo] = {job.job_id: job for job in jobs_response.jobs}
+
+        for analysis_id, analysis_job_ids in job_ids_per_analysis.items():
+            try:
+                stored_jobs: dict[int, Job] = stored_jobs_per_analysis[analysis_id]
+                dtos: list[SlurmJobInfo] = []
+                for job_id in analysis_job_ids:
+                    if job_id in jobs_by_id:
+                        dtos.append(create_job_info_dto_from_job(jobs_by_id[job_id]))
+                    elif job_id in stored_jobs:
+                        dtos.append(create_job_info(stored_jobs[job_id]))
+                if not dtos:
+                    raise MissingJob("No SLURM jobs found for analysis")
+                fingerprint: str = get_jobs_fingerprint(dtos)
+                if fingerprint == fingerprints[analysis_id]:
+                    continue
+                jobs_per_analysis[analysis_id] = ([create_job(dto) for dto in dtos], fingerprint)
+            except Exception as error:
+                errors[analysis_id] = error
+        return jobs_per_analysis, errors
 
     def cancel_jobs(self, analysis_id: int) -> None:
         analysis: Analysis = self.store.get_analysis_with_id(analysis_id)
@@ -6,7 +6,10 @@ from trailblazer.services.slurm.dtos import SlurmJobInfo
 
 
 def create_job_info_dto(job_response: SlurmJobResponse) -> SlurmJobInfo:
-    job: SlurmAPIJobInfo = job_response.jobs[0]
+    return create_job_info_dto_from_job(job_response.jobs[0])
+
+
+def create_job_info_dto_from_job(job: SlurmAPIJobInfo) -> SlurmJobInfo:
     elapsed: int | None = get_job_elapsed_time(job)
     start_time: datetime | None = get_job_start_time(job)
     status: TrailblazerStatus | None = get_job_state(job)
@@ -1,13 +1,24 @@
+import logging
+import time
+
 from trailblazer.clients.slurm_cli_client.models import SqueueJob, SqueueResult
 from trailblazer.clients.slurm_cli_client.slurm_cli_client import SlurmCLIClient
 from trailblazer.clients.slurm_cli_client.mapper import create_job_info_dto
+from trailblazer.constants import (
+    SLURM_CANCEL_POLL_INTERVAL,
+    SLURM_CANCEL_TIMEOUT,
+    SlurmJobStatus,
+)
+from trailblazer.exc import CancelSlurmJobsError, MissingSqueueOutput
 from trailblazer.services.slurm.dtos import SlurmJobInfo
 from trailblazer.services.slurm.slurm_api_service.mappers import create_job
 from trailblazer.services.slurm.slurm_service import SlurmService
-from trailblazer.services.slurm.utils import get_slurm_job_ids
-from trailblazer.store.models import Analysis
+from trailblazer.services.slurm.utils import get_jobs_fingerprint, get_slurm_job_ids
+from trailblazer.store.models import Analysis, Job
 from trailblazer.store.store import Store
 
+LOG = logging.getLogger(__name__)
+
 
 class SlurmCLIService(SlurmService):
     def __init__(self, client: SlurmCLIClient, store: Store):
@@ -25,11 +36,91 @@ class SlurmCLIService(SlurmService):
         queue: SqueueResult = self.client.get_slurm_queue(job_ids)
         dtos = [create_job_info_dto(job) for job in queue.jobs]
         jobs = [create_job(dto) for dto in dtos]
-        self.store.replace_jobs(analysis_id=analysis_id, jobs=jobs)
+        self.store.replace_jobs(
+            analysis_id=analysis_id, jobs=jobs, fingerprint=get_jobs_fingerprint(dtos)
+        )
+
+    def get_jobs_for_analyses(
+        self, analysis_ids: list[int]
+    ) -> tuple[dict[int, tuple[list[Job], str]], dict[int, Exception]]:
+        """Return the jobs of all given analyses from a single, chunked, squeue lookup.
+        A job which could not be parsed only fails the analysis it belongs to."""
+        jobs_per_analysis: dict[int, tuple[list[Job], str]] = {}
+        errors: dict[int, Exception] = {}
+        job_ids_per_analysis: dict[int, list[int]] = {}
+        fingerprints: dict[int, str | None] = {}
+        for analysis_id in analysis_ids:
+            try:
+                analysis: Analysis = self.store.get_analysis_with_id(analysis_id)
+                job_ids_per_analysis[analysis_id] = get_slurm_job_ids(analysis.config_path)
+                fingerprints[analysis_id] = analysis.job_fingerprint
+            except Exception as error:
+                errors[analysis_id] = error
+
+        job_ids: list[int] = [
+            job_id
+            for analysis_job_ids in job_ids_per_analysis.values()
+            for job_id in analysis_job_ids
+        ]
+        try:
+            queue_jobs, job_errors = self.client.get_slurm_jobs(job_ids) if job_ids else ([], {})
+        except Exception as error:
+            return {}, errors | {analysis_id: error for analysis_id in job_ids_per_analysis}
+        queue_jobs_by_id: dict[int, SqueueJob] = {job.id: job for job in queue_jobs}
+
+        for analysis_id, analysis_job_ids in job_ids_per_analysis.items():
+            try:
+                for job_id in analysis_job_ids:
+                    if job_error := job_errors.get(job_id):
+                        raise job_error
+                dtos: list[SlurmJobInfo] = [
+                    create_job_info_dto(queue_jobs_by_id[job_id])
+                    for job_id in analysis_job_ids
+                    if job_id in queue_jobs_by_id
+                ]
+                if not dtos:
+                    raise MissingSqueueOutput("No squeue output")
+                fingerprint: str = get_jobs_fingerprint(dtos)
+                if fingerprint == fingerprints[analysis_id]:
+                    continue
+                jobs_per_analysis[analysis_id] = ([create_job(dto) for dto in dtos], fingerprint)
+            except Exception as error:
+                errors[analysis_id] = error
+        return jobs_per_analysis, errors
 
     def cancel_jobs(self, analysis_id: int) -> None:
+        """Cancel all jobs of the analysis with a single scancel call and wait for the jobs to
+        stop before updating them.
+        Raises:
+            CancelSlurmJobsError: if any job is still ongoing after cancelling.
+        """
         analysis: Analysis = self.store.get_analysis_with_id(analysis_id)
         job_ids: list[int] = get_slurm_job_ids(analysis.config_path)
-        for job_id in job_ids:
-            self.client.cancel_job(job_id)
+        cancel_errors: dict[int, str] = self.client.cancel_jobs(job_ids)
+        ongoing_job_ids: list[int] = self._wait_for_jobs_to_stop(job_ids)
         self.update_jobs(analysis_id)
+        if ongoing_job_ids:
+            failures: list[str] = [
+                f"{job_id}: {cancel_errors.get(job_id, 'still ongoing')}"
+                for job_id in ongoing_job_ids
+            ]
+            raise CancelSlurmJobsError(f"Could not cancel jobs {', '.join(failures)}")
+
+    def _wait_for_jobs_to_stop(
+        self,
+        job_ids: list[int],
+        timeout: int = SLURM_CANCEL_TIMEOUT,
+        poll_interval: int = SLURM_CANCEL_POLL_INTERVAL,
+    ) -> list[int]:
+        """Poll the queue until none of the jobs are ongoing and return the ids of the jobs
+        still ongoing when the timeout is reached."""
+        deadline: float = time.monotonic() + timeout
+        while True:
+            jobs, _ = self.client.get_slurm_jobs(job_ids)
+            ongoing_job_ids: list[int] = [
+                job.id for job in jobs if job.status in SlurmJobStatus.ongoing_statuses()
+            ]
+            if not ongoing_job_ids or time.monotonic() >= deadline:
+                return ongoing_job_ids
+            LOG.info(f"Waiting for {len(ongoing_job_ids)} jobs to be cancelled")
+            time.sleep(poll_interval)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from trailblazer.services.slurm.dtos import SlurmJobInfo
+from trailblazer.store.models import Job
 
 
 class SlurmService(ABC):
@@ -12,6 +13,15 @@ class SlurmService(ABC):
     def update_jobs(self, analysis_id: int) -> None:
         pass
 
+    @abstractmethod
+    def get_jobs_for_analyses(
+        self, analysis_ids: list[int]
+    ) -> tuple[dict[int, tuple[list[Job], str]], dict[int, Exception]]:
+        """Return the jobs and their fingerprint per analysis, without writing them, and the
+        errors per failed analysis.
+        Analyses whose job states are unchanged since the last update are left out."""
+        pass
+
     @abstractmethod
     def cancel_jobs(self, analysis_id: int) -> None:
         pass
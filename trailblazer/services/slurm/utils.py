@@ -1,15 +1,17 @@
+import hashlib
 from pathlib import Path
 
-from trailblazer.constants import FileFormat
-from trailblazer.io.controller import ReadFile
+from trailblazer.services.slurm.dtos import SlurmJobInfo
+from trailblazer.services.slurm.job_id_file_cache import JobIdFileCache
+
+JOB_ID_FILE_CACHE = JobIdFileCache()
 
 
 def get_slurm_job_ids(job_id_file: str) -> list[int]:
-    job_id_file_path = Path(job_id_file)
-    content: dict = ReadFile.get_content_from_file(
-        file_format=FileFormat.YAML, file_path=job_id_file_path
-    )
-    job_ids: list[int] = []
-    for row in content.values():
-        [job_ids.append(int(job_id)) for job_id in row]
-    return job_ids
+    return JOB_ID_FILE_CACHE.get_job_ids(Path(job_id_file))
+
+
+def get_jobs_fingerprint(jobs: list[SlurmJobInfo]) -> str:
+    """Return a fingerprint of the observed state of the jobs, independent of their order."""
+    job_states: list[str] = sorted(job.model_dump_json() for job in jobs)
+    return hashlib.sha256("\n".join(job_states).encode()).hexdigest()
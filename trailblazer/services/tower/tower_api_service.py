@@ -1,25 +1,145 @@
-from trailblazer.clients.tower.models import TowerTasksResponse
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+
+from trailblazer.clients.tower.models import TowerWorkflowResponse
 from trailblazer.clients.tower.tower_client import TowerAPIClient
-from trailblazer.constants import TOWER_WORKFLOW_STATUS, TrailblazerStatus
+from trailblazer.constants import TrailblazerStatus
+from trailblazer.exc import TowerAPIClientError
 from trailblazer.services.tower.error_handler import handle_errors
-from trailblazer.services.tower.utils import create_job_from_tower_task
+from trailblazer.services.tower.utils import (
+    create_job_from_tower_task,
+    get_workflow_progress,
+    get_workflow_status,
+    has_failed_tasks,
+    has_workflow_changed,
+    has_workflow_finished,
+)
 from trailblazer.store.models import Analysis, Job
 from trailblazer.store.store import Store
+from trailblazer.utils.concurrency import run_concurrently
+
+LOG = logging.getLogger(__name__)
 
 
 class TowerAPIService:
-    """Class communicating with NF tower regarding a given analysis (workflow)."""
+    """Class communicating with NF tower regarding a given analysis (workflow).
+
+    Within a scan, the workflows fetched when updating jobs are kept per analysis, so that the
+    progress and status of the analyses are derived from them without requesting the workflows
+    again."""
 
     def __init__(self, client: TowerAPIClient, store: Store) -> None:
         self.client = client
         self.store = store
+        self.workflows: dict[int, TowerWorkflowResponse] | None = None
+
+    @contextmanager
+    def keep_workflows(self) -> Iterator[None]:
+        """Keep the workflows fetched within the block and forget them when it exits, so that
+        they are never reused by a later scan or by updates outside a scan."""
+        self.workflows = {}
+        try:
+            yield
+        finally:
+            self.workflows = None
+
+    @handle_errors
+    def get_jobs(self, workflow_id: str) -> list[Job]:
+        return [create_job_from_tower_task(task) for task in self.client.get_all_tasks(workflow_id)]
 
     @handle_errors
-    def update_jobs(self, analysis_id: int) -> list[Job]:
+    def get_workflow(self, workflow_id: str) -> TowerWorkflowResponse:
+        return self.client.get_workflow(workflow_id)
+
+    @handle_errors
+    def get_workflow_status(self, workflow_id: str) -> TrailblazerStatus:
+        response: TowerWorkflowResponse = self.client.get_workflow(workflow_id)
+        return get_workflow_status(response)
+
+    @handle_errors
+    def update_jobs(self, analysis_id: int) -> None:
+        """Update all jobs of the analysis from the tasks of its workflow, unless the workflow is
+        unchanged since the jobs were stored."""
         analysis: Analysis = self.store.get_analysis_with_id(analysis_id)
-        response: TowerTasksResponse = self.client.get_tasks(analysis.tower_workflow_id)
-        jobs: list[Job] = [create_job_from_tower_task(task) for task in response.get_tasks()]
+        response: TowerWorkflowResponse = self.get_workflow(analysis.tower_workflow_id)
+        self._keep_workflows({analysis_id: response})
+        if not has_workflow_changed(analysis=analysis, response=response):
+            return
+        jobs: list[Job] = self.get_jobs(analysis.tower_workflow_id)
+        self.store_jobs(
+            analysis_id=analysis_id, jobs=jobs, workflow_updated_at=response.workflow.lastUpdated
+        )
+
+    def get_jobs_for_analyses(
+        self, analysis_ids: list[int], max_workers: int
+    ) -> tuple[dict[int, tuple[list[Job], datetime | None]], dict[int, Exception]]:
+        """Return the jobs, without writing them, and the update time of the workflow of the
+        analyses whose workflow has changed since the previous scan, and the errors per failed
+        analysis.
+        The workflows are listed in bulk first and kept for the progress and status lookups of
+        the same scan. Tasks are only fetched, concurrently, for workflows which have finished,
+        to record the final and failed jobs, or which are running with failed tasks, to record
+        the failed jobs early."""
+        workflow_ids: dict[int, str] = self._get_workflow_ids(analysis_ids)
+        workflows, errors = self.get_workflows(workflow_ids=workflow_ids, max_workers=max_workers)
+        self._keep_workflows(workflows)
+        task_workflow_ids: dict[int, str] = {
+            analysis_id: workflow_ids[analysis_id]
+            for analysis_id, response in workflows.items()
+            if (has_workflow_finished(response) or has_failed_tasks(response))
+            and has_workflow_changed(
+                analysis=self.store.get_analysis_with_id(analysis_id), response=response
+            )
+        }
+        jobs_per_analysis, job_errors = run_concurrently(
+            function=self.get_jobs, arguments=task_workflow_ids, max_workers=max_workers
+        )
+        errors.update(job_errors)
+        return {
+            analysis_id: (jobs, workflows[analysis_id].workflow.lastUpdated)
+            for analysis_id, jobs in jobs_per_analysis.items()
+        }, errors
+
+    def get_workflows(
+        self, workflow_ids: dict[int, str], max_workers: int
+    ) -> tuple[dict[int, TowerWorkflowResponse], dict[int, Exception]]:
+        """Return the workflows of the analyses, listing them in bulk and fetching the workflows
+        missing from the listing concurrently."""
+        try:
+            listed_workflows: dict[str, TowerWorkflowResponse] = self.client.get_workflows(
+                list(set(workflow_ids.values()))
+            )
+        except TowerAPIClientError as error:
+            LOG.warning(f"Failed to list Tower workflows, fetching them one by one: {error}")
+            listed_workflows = {}
+        workflows: dict[int, TowerWorkflowResponse] = {
+            analysis_id: listed_workflows[workflow_id]
+            for analysis_id, workflow_id in workflow_ids.items()
+            if workflow_id in listed_workflows
+        }
+        missing_workflow_ids: dict[int, str] = {
+            analysis_id: workflow_id
+            for analysis_id, workflow_id in workflow_ids.items()
+            if analysis_id not in workflows
+        }
+        fetched_workflows, errors = run_concurrently(
+            function=self.get_workflow, arguments=missing_workflow_ids, max_workers=max_workers
+        )
+        return workflows | fetched_workflows, errors
+
+    def store_jobs(
+        self, analysis_id: int, jobs: list[Job], workflow_updated_at: datetime | None
+    ) -> None:
         self.store.replace_jobs(analysis_id=analysis_id, jobs=jobs)
+        self.store.update_analysis_tower_workflow_updated_at(
+            analysis_id=analysis_id, workflow_updated_at=workflow_updated_at
+        )
+
+    def _keep_workflows(self, workflows: dict[int, TowerWorkflowResponse]) -> None:
+        if self.workflows is not None:
+            self.workflows.update(workflows)
 
     @handle_errors
     def cancel_jobs(self, analysis_id: int) -> None:
@@ -29,11 +149,40 @@ class TowerAPIService:
 
     @handle_errors
     def get_status(self, analysis_id: int) -> TrailblazerStatus:
+        return get_workflow_status(self._get_analysis_workflow(analysis_id))
+
+    @handle_errors
+    def get_progress(self, analysis_id: int) -> float:
+        """Return the progress of the analysis from the process counts of its workflow."""
+        return get_workflow_progress(self._get_analysis_workflow(analysis_id))
+
+    def _get_analysis_workflow(self, analysis_id: int) -> TowerWorkflowResponse:
+        if self.workflows and (response := self.workflows.get(analysis_id)):
+            return response
         analysis: Analysis = self.store.get_analysis_with_id(analysis_id)
-        response = self.client.get_workflow(analysis.tower_workflow_id)
-        status: TrailblazerStatus = TOWER_WORKFLOW_STATUS.get(
-            response.workflow.status, TrailblazerStatus.ERROR
+        return self.get_workflow(analysis.tower_workflow_id)
+
+    def get_statuses(
+        self, analysis_ids: list[int], max_workers: int
+    ) -> tuple[dict[int, TrailblazerStatus], dict[int, Exception]]:
+        """Return the status of the analyses, reusing the workflows fetched when updating the jobs
+        and fetching the other workflows concurrently."""
+        workflows: dict[int, TowerWorkflowResponse] = self.workflows or {}
+        statuses: dict[int, TrailblazerStatus] = {
+            analysis_id: get_workflow_status(workflows[analysis_id])
+            for analysis_id in analysis_ids
+            if analysis_id in workflows
+        }
+        workflow_ids: dict[int, str] = self._get_workflow_ids(
+            [analysis_id for analysis_id in analysis_ids if analysis_id not in statuses]
+        )
+        fetched_statuses, errors = run_concurrently(
+            function=self.get_workflow_status, arguments=workflow_ids, max_workers=max_workers
         )
-        if status == TrailblazerStatus.COMPLETED:
-            return TrailblazerStatus.QC
-        return status
+        return statuses | fetched_statuses, errors
+
+    def _get_workflow_ids(self, analysis_ids: list[int]) -> dict[int, str]:
+        return {
+            analysis_id: self.store.get_analysis_with_id(analysis_id).tower_workflow_id
+            for analysis_id in analysis_ids
+        }
@@ -1,8 +1,15 @@
-from trailblazer.clients.tower.models import TowerTask
-from trailblazer.store.models import Job
+from datetime import datetime
 
+from trailblazer.clients.tower.models import (
+    TowerProcess,
+    TowerTaskSummary,
+    TowerWorkflowResponse,
+)
+from trailblazer.constants import TOWER_PROCESS_STATUS, TOWER_WORKFLOW_STATUS, TrailblazerStatus
+from trailblazer.store.models import Analysis, Job
 
-def create_job_from_tower_task(task: TowerTask) -> Job:
+
+def create_job_from_tower_task(task: TowerTaskSummary) -> Job:
     return Job(
         slurm_id=task.nativeId,
         name=task.process,
@@ -10,3 +17,53 @@ def create_job_from_tower_task(task: TowerTask) -> Job:
         started_at=task.start,
         elapsed=int(task.duration / 60),
     )
+
+
+def get_workflow_status(response: TowerWorkflowResponse) -> TrailblazerStatus:
+    status: TrailblazerStatus = TOWER_WORKFLOW_STATUS.get(
+        response.workflow.status, TrailblazerStatus.ERROR
+    )
+    if status == TrailblazerStatus.COMPLETED:
+        return TrailblazerStatus.QC
+    return status
+
+
+def has_workflow_finished(response: TowerWorkflowResponse) -> bool:
+    return get_workflow_status(response) not in [
+        TrailblazerStatus.PENDING,
+        TrailblazerStatus.RUNNING,
+    ]
+
+
+def has_failed_tasks(response: TowerWorkflowResponse) -> bool:
+    return any(
+        TowerProcess.model_validate(process).failed
+        for process in response.progress.processes_progress
+    )
+
+
+def get_workflow_progress(response: TowerWorkflowResponse) -> float:
+    """Return the fraction of the tasks of the workflow which have succeeded or been cached."""
+    processes: list[TowerProcess] = [
+        TowerProcess.model_validate(process) for process in response.progress.processes_progress
+    ]
+    total_count: int = sum(get_task_count(process) for process in processes)
+    completed_count: int = sum(
+        (process.succeeded or 0) + (process.cached or 0) for process in processes
+    )
+    return 0.0 if total_count == 0 else completed_count / total_count
+
+
+def get_task_count(process: TowerProcess) -> int:
+    return sum(getattr(process, status_flag) or 0 for status_flag in TOWER_PROCESS_STATUS.keys())
+
+
+def has_workflow_changed(analysis: Analysis, response: TowerWorkflowResponse) -> bool:
+    """Return whether the workflow has been updated since the jobs of the analysis were stored.
+    Timestamps are compared to the second, as the database may not store fractions of seconds."""
+    last_updated: datetime | None = response.workflow.lastUpdated
+    if not last_updated or not analysis.tower_workflow_updated_at:
+        return True
+    return last_updated.replace(microsecond=0) != analysis.tower_workflow_updated_at.replace(
+        microsecond=0
+    )
@@ -0,0 +1,98 @@
+import logging
+import re
+import threading
+import time
+from typing import Mapping
+
+import requests
+
+from trailblazer.services.user_verification_service.exc import GoogleCertsError
+from trailblazer.utils.metrics import EXTERNAL_REQUEST_DURATION
+
+LOG = logging.getLogger(__name__)
+
+GOOGLE_CERTS_URL: str = "https://www.googleapis.com/oauth2/v1/certs"
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+class GoogleCertsCache:
+    """Process-wide cache of the Google signing certificates.
+
+    Certificates are kept for the max-age given in the Cache-Control header of the response and
+    refreshed in a background thread when they are about to expire."""
+
+    def __init__(
+        self,
+        certs_url: str = GOOGLE_CERTS_URL,
+        refresh_margin: int = 300,
+        min_forced_refresh_interval: int = 30,
+    ):
+        self.certs_url = certs_url
+        self.refresh_margin = refresh_margin
+        self.min_forced_refresh_interval = min_forced_refresh_interval
+        self._certs: Mapping = {}
+        self._expires_at: float = 0.0
+        self._fetched_at: float = 0.0
+        self._lock = threading.Lock()
+        self._refresh_thread_lock = threading.Lock()
+        self._refresh_thread: threading.Thread | None = None
+
+    def get_certs(self) -> Mapping:
+        """Return the cached certificates, fetching them if they have expired."""
+        now: float = time.monotonic()
+        if now >= self._expires_at:
+            with self._lock:
+                if time.monotonic() >= self._expires_at:
+                    self._fetch()
+        elif now >= self._expires_at - self.refresh_margin:
+            self._refresh_in_background()
+        return self._certs
+
+    def get_certs_with_key_id(self, key_id: str | None) -> Mapping:
+        """Return the certificates, refreshing them once if the key id is unknown.
+        Google rotates its keys, so a token may be signed by a key issued after the last fetch."""
+        certs: Mapping = self.get_certs()
+        if key_id is None or key_id in certs:
+            return certs
+        with self._lock:
+            if key_id not in self._certs and self._may_force_refresh():
+                LOG.info(f"Unknown Google certificate key id {key_id}, refreshing certificates")
+                self._fetch()
+        return self._certs
+
+    def _may_force_refresh(self) -> bool:
+        return time.monotonic() - self._fetched_at >= self.min_forced_refresh_interval
+
+    def _refresh_in_background(self) -> None:
+        with self._refresh_thread_lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(target=self._background_refresh, daemon=True)
+            self._refresh_thread.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._lock:
+                self._fetch()
+        except GoogleCertsError as error:
+            LOG.warning(f"Background refresh of Google certificates failed: {error}")
+
+    def _fetch(self) -> None:
+        """Fetch the certificates. Must be called while holding the lock."""
+        try:
+            with EXTERNAL_REQUEST_DURATION.time(client="google", operation="get_certs"):
+                response = requests.get(self.certs_url)
+            response.raise_for_status()
+            certs: Mapping = response.json()
+        except requests.RequestException as e:
+            raise GoogleCertsError("Failed to fetch Google certs") from e
+        now: float = time.monotonic()
+        self._certs = certs
+        self._fetched_at = now
+        self._expires_at = now + get_max_age(response.headers.get("Cache-Control", ""))
+
+
+def get_max_age(cache_control: str) -> int:
+    """Return the max-age in seconds of a Cache-Control header, or 0 if it is not set."""
+    match: re.Match | None = MAX_AGE_PATTERN.search(cache_control)
+    return int(match.group(1)) if match else 0
@@ -1,11 +1,12 @@
 from typing import Mapping
 
 from google.auth import jwt
-import requests
 
-from trailblazer.services.user_verification_service.exc import (
-    GoogleCertsError,
-    UserTokenVerificationError,
+from trailblazer.services.user_verification_service.exc import UserTokenVerificationError
+from trailblazer.services.user_verification_service.google_certs_cache import GoogleCertsCache
+from trailblazer.services.user_verification_service.verified_token_cache import (
+    VerifiedToken,
+    VerifiedTokenCache,
 )
 from trailblazer.store.models import User
 from trailblazer.store.store import Store
@@ -14,14 +15,24 @@ from trailblazer.store.store import Store
 class UserVerificationService:
     """Service to verify the user."""
 
-    def __init__(self, store: Store, oauth_client_id: str):
+    def __init__(
+        self,
+        store: Store,
+        oauth_client_id: str,
+        certs_cache: GoogleCertsCache,
+        token_cache: VerifiedTokenCache,
+    ):
         self.store: Store = store
         self.oauth_client_id: str = oauth_client_id
+        self.certs_cache: GoogleCertsCache = certs_cache
+        self.token_cache: VerifiedTokenCache = token_cache
 
     def verify_user(self, authorization_header: str) -> User:
         """Verify the user by checking if the JWT token provided is valid."""
         jwt_token: str = self._extract_token_from_header(authorization_header)
-        google_certs: Mapping = self._get_google_certs()
+        if verified_token := self.token_cache.get(jwt_token):
+            return self._get_cached_user(verified_token)
+        google_certs: Mapping = self._get_google_certs(jwt_token)
         try:
             payload: Mapping = jwt.decode(
                 token=jwt_token,
@@ -31,8 +42,9 @@ class UserVerificationService:
             )
         except Exception as error:
             raise UserTokenVerificationError(f"{error}") from error
-        user_email: str = payload["email"]
-        return self._get_user(user_email)
+        user: User = self._get_user(payload["email"])
+        self.token_cache.add(jwt_token=jwt_token, claims=payload, user_id=user.id)
+        return user
 
     @staticmethod
     def _extract_token_from_header(authorization_header: str) -> str:
@@ -45,18 +57,24 @@ class UserVerificationService:
             return jwt_token
         raise ValueError("No authorization header provided with request")
 
-    @staticmethod
-    def _get_google_certs() -> Mapping:
-        """Get the Google certificates."""
+    def _get_google_certs(self, jwt_token: str) -> Mapping:
+        """Get the Google certificates needed to verify the token."""
         try:
-            response = requests.get("https://www.googleapis.com/oauth2/v1/certs")
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            raise GoogleCertsError("Failed to fetch Google certs") from e
+            key_id: str | None = jwt.decode_header(jwt_token).get("kid")
+        except Exception as error:
+            raise UserTokenVerificationError(f"{error}") from error
+        return self.certs_cache.get_certs_with_key_id(key_id)
 
     def _get_user(self, user_email: str) -> User:
         """Check if the user is known."""
         if user := self.store.get_user(email=user_email, exclude_archived=True):
             return user
         raise ValueError("User not found in the database")
+
+    def _get_cached_user(self, verified_token: VerifiedToken) -> User:
+        """Return the user of a cached token, invalidating its tokens if it has been archived."""
+        user: User | None = self.store.get_user_by_id(verified_token.user_id)
+        if user and not user.is_archived:
+            return user
+        self.token_cache.invalidate_user(verified_token.user_id)
+        raise ValueError("User not found in the database")
@@ -0,0 +1,61 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Mapping
+
+
+@dataclass(frozen=True)
+class VerifiedToken:
+    """Claims of a verified token and the id of the user it resolved to."""
+
+    claims: Mapping
+    user_id: int
+    expires_at: float
+
+
+class VerifiedTokenCache:
+    """Bounded LRU cache of verified tokens, each kept until the expiry of the token."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._tokens: OrderedDict[str, VerifiedToken] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, jwt_token: str) -> VerifiedToken | None:
+        """Return the verified token if it is cached and has not expired."""
+        key: str = get_token_hash(jwt_token)
+        with self._lock:
+            verified_token: VerifiedToken | None = self._tokens.get(key)
+            if not verified_token:
+                return None
+            if time.time() >= verified_token.expires_at:
+                del self._tokens[key]
+                return None
+            self._tokens.move_to_end(key)
+            return verified_token
+
+    def add(self, jwt_token: str, claims: Mapping, user_id: int) -> None:
+        """Cache a verified token until the expiry given in its claims."""
+        expires_at: float | None = claims.get("exp")
+        if not expires_at:
+            return
+        key: str = get_token_hash(jwt_token)
+        with self._lock:
+            self._tokens[key] = VerifiedToken(
+                claims=claims, user_id=user_id, expires_at=float(expires_at)
+            )
+            self._tokens.move_to_end(key)
+            while len(self._tokens) > self.max_size:
+                self._tokens.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Remove all cached tokens of a user."""
+        with self._lock:
+            for key in [key for key, token in self._tokens.items() if token.user_id == user_id]:
+                del self._tokens[key]
+
+
+def get_token_hash(jwt_token: str) -> str:
+    return hashlib.sha256(jwt_token.encode()).hexdigest()
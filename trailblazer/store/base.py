@@ -1,5 +1,6 @@
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Type
+from typing import Iterator, Type
 
 from sqlalchemy import func
 from sqlalchemy.orm import Query, Session
@@ -7,6 +8,8 @@ from sqlalchemy.orm import Query, Session
 from trailblazer.store.database import get_session
 from trailblazer.store.models import Job, Model
 
+DEFER_COMMIT: str = "defer_commit"
+
 
 @dataclass
 class BaseHandler:
@@ -17,6 +20,56 @@ class BaseHandler:
         session: Session = get_session()
         return session.query(table)
 
+    @contextmanager
+    def scan_context(self) -> Iterator[None]:
+        """Keep the working set of a scan in the session while it is updated.
+        Within the context, store updates are flushed instead of committed, until they are
+        committed per analysis with an analysis transaction, and committed objects are not expired
+        so that loaded analyses and jobs can be reused. Remaining changes are committed when the
+        context exits and rolled back if it raises."""
+        session: Session = get_session()
+        if session.info.get(DEFER_COMMIT):
+            yield
+            return
+        session.info[DEFER_COMMIT] = True
+        current_session: Session = session()
+        expire_on_commit: bool = current_session.expire_on_commit
+        current_session.expire_on_commit = False
+        try:
+            yield
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            current_session.expire_on_commit = expire_on_commit
+            session.info.pop(DEFER_COMMIT, None)
+
+    @contextmanager
+    def analysis_transaction(self) -> Iterator[None]:
+        """Commit the store updates made within a scan context for one analysis on their own.
+        If the block raises, only its updates are rolled back and the loaded objects are expired,
+        so that a failing analysis does not fail the rest of the scan. Outside a scan context,
+        each store update is committed by itself already."""
+        session: Session = get_session()
+        if not session.info.get(DEFER_COMMIT):
+            yield
+            return
+        try:
+            yield
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+    def commit(self) -> None:
+        """Commit the session, or only flush it when inside a scan context."""
+        session: Session = get_session()
+        if session.info.get(DEFER_COMMIT):
+            session.flush()
+        else:
+            session.commit()
+
     def get_job_query_with_name_and_count_labels(self) -> Query:
         """Return a Job query with a name label and a count with a label."""
         session: Session = get_session()
@@ -24,3 +77,13 @@ class BaseHandler:
             Job.name.label("name"),
             func.count(Job.id).label("count"),
         )
+
+    def get_job_query_with_rank_per_analysis_label(self) -> Query:
+        """Return a Job id query ranking the jobs of each analysis with the latest started first."""
+        session: Session = get_session()
+        return session.query(
+            Job.id.label("id"),
+            func.row_number()
+            .over(partition_by=Job.analysis_id, order_by=Job.started_at.desc())
+            .label("rank"),
+        )
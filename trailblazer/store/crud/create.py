@@ -2,12 +2,13 @@ from datetime import datetime
 
 from sqlalchemy.orm import Session
 
-from trailblazer.constants import SlurmJobStatus, TrailblazerStatus
+from trailblazer.constants import JobType, SlurmJobStatus, TrailblazerStatus
 from trailblazer.dto.create_analysis_request import CreateAnalysisRequest
 from trailblazer.dto.create_job_request import CreateJobRequest
 from trailblazer.store.base import BaseHandler
 from trailblazer.store.database import get_session
 from trailblazer.store.models import Analysis, Job, User
+from trailblazer.store.utils import get_job_key, update_job_fields
 
 
 class CreateHandler(BaseHandler):
@@ -61,10 +62,33 @@ class CreateHandler(BaseHandler):
         session.commit()
         return job
 
-    def replace_jobs(self, analysis_id: int, jobs: list[Job]):
+    def replace_jobs(self, analysis_id: int, jobs: list[Job], fingerprint: str | None = None):
+        """Replace the analysis jobs of an analysis in one transaction.
+        Existing jobs are matched on their SLURM id and only updated if they have changed, new
+        jobs are added and jobs which are no longer present are deleted. Jobs sharing an id are
+        stored once, keeping the last given job and the first existing job. The fingerprint of the
+        observed job states is stored with the analysis if given."""
         analysis: Analysis = self.get_analysis_with_id(analysis_id)
-        self.delete_analysis_jobs(analysis)
-        for job in jobs:
-            analysis.jobs.append(job)
+        if fingerprint:
+            analysis.job_fingerprint = fingerprint
         session: Session = get_session()
-        session.commit()
+        existing_jobs: dict[int | str, Job] = {}
+        removed_jobs: list[Job] = []
+        for job in analysis.jobs:
+            if job.job_type != JobType.ANALYSIS:
+                continue
+            if get_job_key(job) in existing_jobs:
+                removed_jobs.append(job)
+            else:
+                existing_jobs[get_job_key(job)] = job
+        incoming_jobs: dict[int | str, Job] = {get_job_key(job): job for job in jobs}
+        for job_key, job in incoming_jobs.items():
+            if existing_job := existing_jobs.pop(job_key, None):
+                update_job_fields(job=existing_job, updated_job=job)
+            else:
+                analysis.jobs.append(job)
+        removed_jobs.extend(existing_jobs.values())
+        for removed_job in removed_jobs:
+            analysis.jobs.remove(removed_job)
+            session.delete(removed_job)
+        self.commit()
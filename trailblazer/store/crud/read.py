@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Callable
 
-from sqlalchemy import desc
+from sqlalchemy import Row, Subquery, and_, desc, func
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import Query
 
@@ -9,10 +9,13 @@ from trailblazer.constants import JobType, TrailblazerStatus, Workflow
 from trailblazer.dto.analyses_request import AnalysesRequest
 from trailblazer.exc import MissingAnalysis, MissingJob, UserNotFoundError
 from trailblazer.store.base import BaseHandler
+from trailblazer.store.database import get_session
 from trailblazer.store.filters.analyses_filters import AnalysisFilter, apply_analysis_filter
 from trailblazer.store.filters.job_filters import JobFilter, apply_job_filters
 from trailblazer.store.filters.user_filters import UserFilter, apply_user_filter
-from trailblazer.store.models import Analysis, Job, User
+from trailblazer.store.loading_profiles import AnalysisLoadingProfile, apply_loading_profile
+from trailblazer.store.models import Analysis, Delivery, Job, User
+from trailblazer.store.utils import get_analyses_cursor
 
 
 class ReadHandler(BaseHandler):
@@ -104,21 +107,33 @@ class ReadHandler(BaseHandler):
             case_id=case_id,
         ).all()
 
-    def get_analyses_with_statuses(self, statuses: list[str]) -> list[Analysis] | None:
+    def get_analyses_with_statuses(
+        self, statuses: list[str], loading_profile: AnalysisLoadingProfile | None = None
+    ) -> list[Analysis] | None:
         """Get analyses by statuses."""
-        return apply_analysis_filter(
+        analyses: Query = apply_analysis_filter(
             analyses=self.get_query(table=Analysis),
             filter_functions=[AnalysisFilter.BY_STATUSES],
             statuses=statuses,
-        ).all()
+        )
+        return apply_loading_profile(analyses=analyses, profile=loading_profile).all()
 
-    def get_analysis_with_id(self, analysis_id: int) -> Analysis:
-        """Get a single analysis by id."""
-        analysis: Analysis | None = apply_analysis_filter(
-            analyses=self.get_query(table=Analysis),
-            filter_functions=[AnalysisFilter.BY_ENTRY_ID],
-            analysis_id=analysis_id,
-        ).first()
+    def get_analysis_with_id(
+        self, analysis_id: int, loading_profile: AnalysisLoadingProfile | None = None
+    ) -> Analysis:
+        """Get a single analysis by id.
+        Without a loading profile an analysis already loaded in the session is returned as is."""
+        if loading_profile:
+            analyses: Query = apply_analysis_filter(
+                analyses=self.get_query(table=Analysis),
+                filter_functions=[AnalysisFilter.BY_ENTRY_ID],
+                analysis_id=analysis_id,
+            )
+            analysis: Analysis | None = apply_loading_profile(
+                analyses=analyses, profile=loading_profile
+            ).first()
+        else:
+            analysis: Analysis | None = get_session().get(Analysis, analysis_id)
         if not analysis:
             raise MissingAnalysis(f"Analysis {analysis_id} does not exist")
         return analysis
@@ -200,6 +215,22 @@ class ReadHandler(BaseHandler):
             status=TrailblazerStatus.FAILED,
         ).first()
 
+    def get_latest_failed_jobs_for_analyses(self, analysis_ids: list[int]) -> dict[int, Job]:
+        """Return the latest failed job per analysis, keyed by analysis id."""
+        ranked_jobs: Subquery = apply_job_filters(
+            filters=[JobFilter.BY_ANALYSIS_IDS, JobFilter.BY_STATUS],
+            jobs=self.get_job_query_with_rank_per_analysis_label(),
+            analysis_ids=analysis_ids,
+            status=TrailblazerStatus.FAILED,
+        ).subquery()
+        latest_failed_jobs: list[Job] = (
+            self.get_query(Job)
+            .join(ranked_jobs, Job.id == ranked_jobs.c.id)
+            .filter(ranked_jobs.c.rank == 1)
+            .all()
+        )
+        return {job.analysis_id: job for job in latest_failed_jobs}
+
     def get_ongoing_upload_jobs(self) -> list[Job]:
         ongoing_statuses: list[str] = list(TrailblazerStatus.ongoing_statuses())
         return apply_job_filters(
@@ -219,23 +250,61 @@ class ReadHandler(BaseHandler):
             raise MissingJob(f"Job {job_id} does not exist")
         return job
 
-    def get_latest_analyses_for_order(self, order_id: int) -> list[Analysis]:
-        """Returns the latest analysis per case in the given order."""
-        return apply_analysis_filter(
-            analyses=self.get_query(Analysis),
-            filter_functions=[
-                AnalysisFilter.BY_ORDER_ID,
-                AnalysisFilter.BY_LATEST_PER_CASE,
-                AnalysisFilter.EXCLUDE_RSYNC,
-            ],
-            order_id=order_id,
-        ).all()
+    def get_latest_analysis_statuses_for_orders(self, order_ids: list[int]) -> list[Row]:
+        """Return the order id, case id, status and whether it is delivered for the latest
+        analysis per case in each of the given orders, in a single query."""
+        latest_started_at_per_case: Subquery = (
+            self.get_query(Analysis)
+            .with_entities(
+                Analysis.order_id,
+                Analysis.case_id,
+                func.max(Analysis.started_at).label("max_started_at"),
+            )
+            .filter(Analysis.order_id.in_(order_ids))
+            .group_by(Analysis.order_id, Analysis.case_id)
+            .subquery()
+        )
+        return (
+            self.get_query(Analysis)
+            .with_entities(
+                Analysis.order_id,
+                Analysis.case_id,
+                Analysis.status,
+                Delivery.id.isnot(None).label("is_delivered"),
+            )
+            .join(
+                latest_started_at_per_case,
+                and_(
+                    Analysis.order_id == latest_started_at_per_case.c.order_id,
+                    Analysis.case_id == latest_started_at_per_case.c.case_id,
+                    Analysis.started_at == latest_started_at_per_case.c.max_started_at,
+                ),
+            )
+            .outerjoin(Delivery, Delivery.analysis_id == Analysis.id)
+            .filter(Analysis.workflow != Workflow.RSYNC)
+            .all()
+        )
 
-    def get_paginated_analyses(self, request: AnalysesRequest) -> tuple[list[Analysis], int]:
+    def get_paginated_analyses(
+        self, request: AnalysesRequest
+    ) -> tuple[list[Analysis], int | None, str | None]:
+        """Return a page of analyses, the total count if requested and the cursor of the next
+        page if the page is full."""
         analyses: Query = self._filter_analyses(request)
-        total_count: int = analyses.count()
-        page: Query = self._paginate_analyses(analyses=analyses, request=request)
-        return page.all(), total_count
+        total_count: int | None = analyses.count() if request.include_total_count else None
+        page: Query = apply_loading_profile(
+            analyses=self._paginate_analyses(analyses=analyses, request=request),
+            profile=AnalysisLoadingProfile.LIST,
+        )
+        page_analyses: list[Analysis] = page.all()
+        next_cursor: str | None = None
+        if page_analyses and len(page_analyses) == request.page_size:
+            next_cursor = get_analyses_cursor(
+                analysis=page_analyses[-1],
+                sort_field=request.sort_field,
+                sort_order=request.sort_order,
+            ).encode()
+        return page_analyses, total_count, next_cursor
 
     def _filter_analyses(self, request: AnalysesRequest) -> Query:
         filters: list[AnalysisFilter] = [
@@ -272,15 +341,19 @@ class ReadHandler(BaseHandler):
         )
 
     def _paginate_analyses(self, analyses: Query, request: AnalysesRequest) -> Query:
+        """Paginate on the cursor if given, otherwise on the page number."""
         return apply_analysis_filter(
-            filter_functions=[AnalysisFilter.PAGINATION],
+            filter_functions=[AnalysisFilter.AFTER_CURSOR, AnalysisFilter.PAGINATION],
             analyses=analyses,
-            page=request.page,
+            cursor=request.cursor,
+            page=1 if request.cursor else request.page,
             page_size=request.page_size,
+            sort_field=request.sort_field,
+            sort_order=request.sort_order,
         )
 
     def get_analyses_being_uploaded(self, workflow: Workflow) -> list[Analysis]:
-        return apply_analysis_filter(
+        analyses: Query = apply_analysis_filter(
             filter_functions=[
                 AnalysisFilter.BY_NOT_UPLOADED,
                 AnalysisFilter.BY_COMPLETED,
@@ -288,4 +361,5 @@ class ReadHandler(BaseHandler):
             ],
             analyses=self.get_query(Analysis),
             workflow=workflow,
-        ).all()
+        )
+        return apply_loading_profile(analyses=analyses, profile=AnalysisLoadingProfile.SCAN).all()
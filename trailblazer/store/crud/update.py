@@ -9,6 +9,7 @@ from trailblazer.exc import MissingAnalysis
 from trailblazer.services.slurm.dtos import SlurmJobInfo
 from trailblazer.store.base import BaseHandler
 from trailblazer.store.database import get_session
+from trailblazer.store.loading_profiles import AnalysisLoadingProfile
 from trailblazer.store.models import Analysis, Delivery, Job, User
 
 LOG = logging.getLogger(__name__)
@@ -34,7 +35,9 @@ class UpdateHandler(BaseHandler):
     def get_ongoing_analyses(self) -> list[Analysis]:
         """Return all analyses with ongoing status."""
         ongoing_statuses: list[str] = list(TrailblazerStatus.ongoing_statuses())
-        return self.get_analyses_with_statuses(ongoing_statuses)
+        return self.get_analyses_with_statuses(
+            statuses=ongoing_statuses, loading_profile=AnalysisLoadingProfile.SCAN
+        )
 
     def update_analysis_status_by_case_id(self, case_id: str, status: str):
         """Setting analysis status."""
@@ -43,8 +46,7 @@ class UpdateHandler(BaseHandler):
             raise ValueError(f"Invalid status. Allowed values are: {TrailblazerStatus.statuses()}")
         analysis: Analysis | None = self.get_latest_analysis_for_case(case_id)
         analysis.status = status
-        session: Session = get_session()
-        session.commit()
+        self.commit()
         LOG.info(f"{analysis.case_id} - Status set to {status.upper()}")
 
     def update_analysis_status_to_completed(self, analysis_id: int) -> None:
@@ -157,15 +159,25 @@ class UpdateHandler(BaseHandler):
     def update_analysis_status(self, analysis_id: int, status: TrailblazerStatus) -> None:
         analysis: Analysis | None = self.get_analysis_with_id(analysis_id)
         analysis.status = status
-        session: Session = get_session()
-        session.commit()
+        self.commit()
         LOG.info(f"Updated status {analysis.case_id} - {analysis.id}: {analysis.status} ")
 
     def update_analysis_progress(self, analysis_id: int, progress: float) -> None:
         analysis: Analysis | None = self.get_analysis_with_id(analysis_id)
         analysis.progress = progress
-        session: Session = get_session()
-        session.commit()
+        self.commit()
+
+    def update_analysis_scanned_at(self, analysis_id: int, scanned_at: datetime) -> None:
+        analysis: Analysis | None = self.get_analysis_with_id(analysis_id)
+        analysis.scanned_at = scanned_at
+        self.commit()
+
+    def update_analysis_tower_workflow_updated_at(
+        self, analysis_id: int, workflow_updated_at: datetime | None
+    ) -> None:
+        analysis: Analysis | None = self.get_analysis_with_id(analysis_id)
+        analysis.tower_workflow_updated_at = workflow_updated_at
+        self.commit()
 
     def update_analysis_upload_date(self, analysis_id: int, uploaded_at: datetime) -> None:
         analysis: Analysis | None = self.get_analysis_with_id(analysis_id)
@@ -1,6 +1,14 @@
-from sqlalchemy import create_engine, inspect
+import time
+
+from sqlalchemy import create_engine, event, exc, inspect, make_url
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Session, declarative_base, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from trailblazer.constants import PrePingStrategy
+from trailblazer.models import DatabaseSettings
+from trailblazer.store.instrumentation import instrument_engine
+from trailblazer.utils.metrics import REGISTRY
 
 SESSION: Session | None = None
 ENGINE: Engine | None = None
@@ -8,13 +16,84 @@ ENGINE: Engine | None = None
 Model = declarative_base()
 
 
-def initialize_database(db_uri: str) -> None:
+CHECKED_IN_AT: str = "checked_in_at"
+
+
+def initialize_database(db_uri: str, settings: DatabaseSettings | None = None) -> None:
     global SESSION, ENGINE
-    ENGINE = create_engine(db_uri, pool_pre_ping=True)
+    settings = settings or DatabaseSettings()
+    ENGINE = create_engine(db_uri, **get_engine_options(db_uri=db_uri, settings=settings))
+    instrument_engine(engine=ENGINE, slow_query_threshold=settings.slow_query_threshold)
+    if settings.pool_pre_ping == PrePingStrategy.IDLE and is_pooled(db_uri):
+        ping_idle_connections(engine=ENGINE, idle_time=settings.pre_ping_idle_time)
     session_factory = sessionmaker(ENGINE)
     SESSION = scoped_session(session_factory)
 
 
+def get_engine_options(db_uri: str, settings: DatabaseSettings) -> dict:
+    options: dict = {"pool_pre_ping": settings.pool_pre_ping == PrePingStrategy.ALWAYS}
+    if settings.isolation_level:
+        options["isolation_level"] = settings.isolation_level
+    if is_pooled(db_uri):
+        options.update(
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.pool_timeout,
+            pool_recycle=settings.pool_recycle,
+        )
+    return options
+
+
+def is_pooled(db_uri: str) -> bool:
+    """Return whether the database is a server with a pool of connections, unlike SQLite."""
+    return make_url(db_uri).get_backend_name() != "sqlite"
+
+
+def ping_idle_connections(engine: Engine, idle_time: int) -> None:
+    """Ping connections which have been idle in the pool for longer than the idle time when they
+    are checked out, replacing them if the database has dropped them. Connections returned to the
+    pool recently are handed out without an extra round trip."""
+
+    def record_checkin(dbapi_connection, connection_record):
+        connection_record.info[CHECKED_IN_AT] = time.monotonic()
+
+    def ping_idle_connection(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at: float | None = connection_record.info.get(CHECKED_IN_AT)
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_time:
+            return
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        except Exception as error:
+            raise exc.DisconnectionError() from error
+        finally:
+            cursor.close()
+
+    event.listen(engine, "checkin", record_checkin)
+    event.listen(engine, "checkout", ping_idle_connection)
+
+
+def get_pool_statistics() -> dict[str, int]:
+    """Return the number of connections in the pool per state."""
+    if not ENGINE or not isinstance(ENGINE.pool, QueuePool):
+        return {}
+    pool: QueuePool = ENGINE.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
+REGISTRY.gauge(
+    name="trailblazer_db_pool_connections",
+    documentation="Number of database connections in the pool per state.",
+    label_name="state",
+    callback=get_pool_statistics,
+)
+
+
 def get_session() -> Session:
     return SESSION
 
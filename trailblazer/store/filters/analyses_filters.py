@@ -7,10 +7,11 @@ from sqlalchemy import Subquery, func, select
 from sqlalchemy.orm import Query
 
 from trailblazer.constants import TrailblazerStatus, Workflow
-from trailblazer.dto.analyses_request import AnalysisSortField
+from trailblazer.dto.analyses_request import AnalysesCursor, AnalysisSortField
 from trailblazer.dto.common import SortOrder
 from trailblazer.store.database import get_session
 from trailblazer.store.models import Analysis
+from trailblazer.store.search import escape_like, get_comment_search_condition
 
 
 def filter_analyses_by_comment(analyses: Query, comment: str, **kwargs) -> Query:
@@ -49,17 +50,25 @@ def filter_analyses_by_order_id(analyses: Query, order_id: int | None, **kwargs)
 
 
 def filter_analyses_by_search_term(analyses: Query, search_term: str | None, **kwargs) -> Query:
-    """Filter analyses by search term using multiple fields."""
+    """Filter analyses by search term using multiple fields.
+    Case ids and workflows are matched on their prefix, statuses on the known statuses starting
+    with the search term and comments using full-text search."""
     if not search_term:
         return analyses
-    return analyses.filter(
-        sqlalchemy.or_(
-            Analysis.case_id.ilike(f"%{search_term}%"),
-            Analysis.status.ilike(f"%{search_term}%"),
-            Analysis.workflow.ilike(f"%{search_term}%"),
-            Analysis.comment.ilike(f"%{search_term}%"),
-        )
-    )
+    prefix_pattern: str = f"{escape_like(search_term)}%"
+    conditions: list = [
+        Analysis.case_id.like(prefix_pattern, escape="\\"),
+        Analysis.workflow.like(prefix_pattern, escape="\\"),
+        get_comment_search_condition(
+            dialect_name=analyses.session.get_bind().dialect.name, search_term=search_term
+        ),
+    ]
+    statuses: list[str] = [
+        status for status in TrailblazerStatus.statuses() if status.startswith(search_term.lower())
+    ]
+    if statuses:
+        conditions.append(Analysis.status.in_(statuses))
+    return analyses.filter(sqlalchemy.or_(*conditions))
 
 
 def filter_analyses_by_started_at(analyses: Query, started_at: datetime, **kwargs) -> Query:
@@ -159,10 +168,63 @@ def sort_analyses(
 ) -> Query:
     if not sort_field or not sort_order:
         return analyses
-    column = getattr(Analysis, sort_field)
+    column = get_sort_column(sort_field)
+    if sort_order == SortOrder.ASC:
+        return analyses.order_by(sqlalchemy.asc(column), sqlalchemy.asc(Analysis.id))
+    return analyses.order_by(sqlalchemy.desc(column), sqlalchemy.desc(Analysis.id))
+
+
+def filter_analyses_after_cursor(
+    analyses: Query,
+    cursor: AnalysesCursor | None,
+    sort_field: AnalysisSortField,
+    sort_order: SortOrder,
+    **kwargs,
+) -> Query:
+    """Return the analyses sorted after the cursor, using the id as tiebreaker.
+    NULL is treated as the smallest value, as when sorting in MySQL and SQLite."""
+    if not cursor:
+        return analyses
+    column = get_sort_column(sort_field)
+    value = get_cursor_value(cursor=cursor, column=column)
     if sort_order == SortOrder.ASC:
-        return analyses.order_by(sqlalchemy.asc(column))
-    return analyses.order_by(sqlalchemy.desc(column))
+        if value is None:
+            return analyses.filter(
+                sqlalchemy.or_(
+                    column.isnot(None), sqlalchemy.and_(column.is_(None), Analysis.id > cursor.id)
+                )
+            )
+        return analyses.filter(
+            sqlalchemy.or_(
+                column > value, sqlalchemy.and_(column == value, Analysis.id > cursor.id)
+            )
+        )
+    if value is None:
+        return analyses.filter(column.is_(None), Analysis.id < cursor.id)
+    return analyses.filter(
+        sqlalchemy.or_(
+            column < value,
+            sqlalchemy.and_(column == value, Analysis.id < cursor.id),
+            column.is_(None),
+        )
+    )
+
+
+def get_sort_column(sort_field: AnalysisSortField):
+    """Return the column to sort on.
+    Enum columns, such as the status, are sorted alphabetically as strings rather than in the
+    order of their enum values. MySQL sorts enum columns by the position of their values but
+    compares them to the cursor value as strings, so the cursor would otherwise skip analyses."""
+    column = getattr(Analysis, sort_field)
+    if isinstance(column.type, sqlalchemy.Enum):
+        return sqlalchemy.cast(column, sqlalchemy.String)
+    return column
+
+
+def get_cursor_value(cursor: AnalysesCursor, column) -> datetime | str | None:
+    if cursor.value is not None and isinstance(column.type, sqlalchemy.DateTime):
+        return datetime.fromisoformat(cursor.value)
+    return cursor.value
 
 
 def paginate_analyses(analyses: Query, page: int, page_size: int, **kwargs) -> Query:
@@ -186,6 +248,7 @@ def get_completed_analyses(analyses: Query, **kwargs) -> Query:
 class AnalysisFilter(Enum):
     """Define Analysis filter functions."""
 
+    AFTER_CURSOR: Callable = filter_analyses_after_cursor
     BY_BEFORE_STARTED_AT: Callable = filter_analyses_by_before_started_at
     BY_CASE_ID: Callable = filter_analyses_by_case_id
     BY_COMMENT: Callable = filter_analyses_by_comment
@@ -216,6 +279,7 @@ def apply_analysis_filter(
     analysis_id: int | None = None,
     case_id: str | None = None,
     comment: str | None = None,
+    cursor: AnalysesCursor | None = None,
     delivered: bool | None = None,
     has_comment: bool | None = None,
     hold_delivery: bool | None = None,
@@ -242,6 +306,7 @@ def apply_analysis_filter(
             analysis_id=analysis_id,
             case_id=case_id,
             comment=comment,
+            cursor=cursor,
             delivered=delivered,
             has_comment=has_comment,
             hold_delivery=hold_delivery,
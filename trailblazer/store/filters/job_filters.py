@@ -26,6 +26,11 @@ def filter_jobs_by_analysis_id(jobs: Query, analysis_id: str, **kwargs) -> Query
     return jobs.filter(Job.analysis_id == analysis_id)
 
 
+def filter_jobs_by_analysis_ids(jobs: Query, analysis_ids: list[int], **kwargs) -> Query:
+    """Filter jobs belonging to any of the given analyses."""
+    return jobs.filter(Job.analysis_id.in_(analysis_ids))
+
+
 def sort_jobs_by_started_at(jobs: Query, **kwargs) -> Query:
     """Sort jobs by start date."""
     return jobs.order_by(Job.started_at.desc())
@@ -47,6 +52,7 @@ class JobFilter(Enum):
     BY_STATUS: Callable = filter_jobs_by_status
     BY_STATUSES: Callable = filter_jobs_by_statuses
     BY_ANALYSIS_ID: Callable = filter_jobs_by_analysis_id
+    BY_ANALYSIS_IDS: Callable = filter_jobs_by_analysis_ids
     BY_ID: Callable = filter_jobs_by_id
     BY_TYPE: Callable = filter_by_job_type
     SORT_BY_STARTED_AT: Callable = sort_jobs_by_started_at
@@ -59,6 +65,7 @@ def apply_job_filters(
     status: str | None = None,
     statuses: list[str] | None = None,
     analysis_id: str | None = None,
+    analysis_ids: list[int] | None = None,
     job_id: int | None = None,
     job_type: str | None = None,
 ) -> Query:
@@ -70,6 +77,7 @@ def apply_job_filters(
             status=status,
             statuses=statuses,
             analysis_id=analysis_id,
+            analysis_ids=analysis_ids,
             job_id=job_id,
             job_type=job_type,
         )
@@ -0,0 +1,145 @@
+"""Instrumentation of the database engine.
+
+Queries are timed on the engine and added to the statistics of the current unit of work, a request
+or a CLI command, if one is being tracked. Queries slower than the threshold are logged with their
+bound parameters and the store method issuing them."""
+
+import logging
+import sys
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+from trailblazer.constants import DEFAULT_SLOW_QUERY_THRESHOLD
+from trailblazer.utils.metrics import DB_POOL_CHECKOUT_WAIT
+
+LOG = logging.getLogger(__name__)
+
+MAX_SLOWEST_QUERIES: int = 5
+QUERY_START_TIMES: str = "query_start_times"
+STORE_DIRECTORY: str = str(Path(__file__).parent)
+
+
+@dataclass
+class QueryStats:
+    """Number of queries, total time and slowest statements of a unit of work."""
+
+    count: int = 0
+    total_time: float = 0.0
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+
+    def add(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        if len(self.slowest) < MAX_SLOWEST_QUERIES or duration > self.slowest[-1][0]:
+            self.slowest.append((duration, statement))
+            self.slowest.sort(key=lambda query: query[0], reverse=True)
+            del self.slowest[MAX_SLOWEST_QUERIES:]
+
+    def get_summary(self) -> str:
+        summary: str = f"{self.count} queries in {self.total_time * 1000:.1f} ms"
+        for duration, statement in self.slowest:
+            summary += f"\n  {duration * 1000:.1f} ms: {' '.join(statement.split())}"
+        return summary
+
+
+QUERY_STATS: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_tracking() -> Token:
+    """Start collecting the statistics of the queries of a unit of work."""
+    return QUERY_STATS.set(QueryStats())
+
+
+def stop_query_tracking(token: Token) -> QueryStats | None:
+    """Stop collecting query statistics and return the statistics of the unit of work."""
+    query_stats: QueryStats | None = QUERY_STATS.get()
+    QUERY_STATS.reset(token)
+    return query_stats
+
+
+def get_query_stats() -> QueryStats | None:
+    return QUERY_STATS.get()
+
+
+def instrument_engine(
+    engine: Engine, slow_query_threshold: float = DEFAULT_SLOW_QUERY_THRESHOLD
+) -> None:
+    """Time the queries of the engine and log the queries slower than the threshold in seconds."""
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(QUERY_START_TIMES, []).append(time.perf_counter())
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration: float = time.perf_counter() - conn.info[QUERY_START_TIMES].pop()
+        if query_stats := QUERY_STATS.get():
+            query_stats.add(statement=statement, duration=duration)
+        if duration >= slow_query_threshold:
+            LOG.warning(
+                f"Slow query ({duration * 1000:.1f} ms) in {get_store_method()}: "
+                f"{' '.join(statement.split())} with parameters {parameters}"
+            )
+
+    def handle_error(exception_context):
+        if exception_context.connection is not None:
+            if start_times := exception_context.connection.info.get(QUERY_START_TIMES):
+                start_times.pop()
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+
+    def engine_disposed(disposed_engine: Engine):
+        observe_pool_checkout_wait(disposed_engine.pool)
+
+    event.listen(engine, "handle_error", handle_error)
+    event.listen(engine, "engine_disposed", engine_disposed)
+    observe_pool_checkout_wait(engine.pool)
+
+
+def observe_pool_checkout_wait(pool: Pool) -> None:
+    """Observe the time spent waiting for a connection from the pool.
+    The public checkout and connect events of the pool are only emitted once a connection has been
+    acquired, so they can not measure the wait. Instead, the private Pool._do_get, which acquires
+    the connection, is wrapped. The wrapper belongs to the pool instance, so the pool which
+    replaces it when the engine is disposed is wrapped again by the engine instrumentation. If a
+    SQLAlchemy upgrade removes it, the wait is not observed and a warning is logged rather than
+    failing to create the engine."""
+    do_get: Callable | None = getattr(pool, "_do_get", None)
+    if not callable(do_get):
+        LOG.warning(f"Pool checkout wait is not observed for {type(pool).__name__}")
+        return
+
+    def timed_do_get():
+        with DB_POOL_CHECKOUT_WAIT.time():
+            return do_get()
+
+    pool._do_get = timed_do_get
+
+
+def get_store_method() -> str:
+    """Return the outermost store method in the call stack, or the caller of the store."""
+    frame: FrameType | None = sys._getframe(1)
+    store_method: str | None = None
+    caller: str | None = None
+    while frame:
+        file_name: str = frame.f_code.co_filename
+        if file_name.startswith(STORE_DIRECTORY) and file_name != __file__:
+            store_method = get_frame_name(frame)
+        elif "sqlalchemy" not in file_name and file_name != __file__ and not caller:
+            caller = get_frame_name(frame)
+        frame = frame.f_back
+    return store_method or caller or "unknown"
+
+
+def get_frame_name(frame: FrameType) -> str:
+    instance = frame.f_locals.get("self")
+    if instance is not None:
+        return f"{type(instance).__name__}.{frame.f_code.co_name}"
+    return frame.f_code.co_name
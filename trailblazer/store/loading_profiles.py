@@ -0,0 +1,35 @@
+from enum import StrEnum
+
+from sqlalchemy.orm import Query, joinedload, selectinload
+
+from trailblazer.store.models import Analysis, Delivery
+
+
+class AnalysisLoadingProfile(StrEnum):
+    """Named read paths, each loading the relationships of the analyses it serializes."""
+
+    DETAIL: str = "detail"
+    LIST: str = "list"
+    SCAN: str = "scan"
+
+
+def get_loading_options(profile: AnalysisLoadingProfile) -> list:
+    """Return the loader options of the profile."""
+    if profile == AnalysisLoadingProfile.DETAIL:
+        return [
+            selectinload(Analysis.jobs),
+            joinedload(Analysis.user),
+            selectinload(Analysis.delivery).joinedload(Delivery.user),
+        ]
+    if profile == AnalysisLoadingProfile.LIST:
+        return [selectinload(Analysis.delivery).joinedload(Delivery.user)]
+    if profile == AnalysisLoadingProfile.SCAN:
+        return [selectinload(Analysis.jobs)]
+    return []
+
+
+def apply_loading_profile(analyses: Query, profile: AnalysisLoadingProfile | None) -> Query:
+    """Apply the loader options of the profile, keeping the default lazy loading without one."""
+    if not profile:
+        return analyses
+    return analyses.options(*get_loading_options(profile))
@@ -1,7 +1,7 @@
 import datetime
 import uuid
 
-from sqlalchemy import Column, ForeignKey, UniqueConstraint, orm, types
+from sqlalchemy import Column, ForeignKey, Index, UniqueConstraint, orm, types
 
 from trailblazer.constants import (
     PRIORITY_OPTIONS,
@@ -70,6 +70,7 @@ class Analysis(Model):
     __tablename__ = "analysis"
     __table_args__ = (
         UniqueConstraint("case_id", "started_at", "status", name="_uc_case_id_start_status"),
+        Index("ix_analysis_comment_fulltext", "comment", mysql_prefix="FULLTEXT"),
     )
 
     case_id = Column(types.String(128), nullable=False)
@@ -91,9 +92,12 @@ class Analysis(Model):
     uploaded_at = Column(types.DateTime)
     user_id = Column(ForeignKey(User.id))
     version = Column(types.String(32))
-    workflow = Column(types.String(32))
+    workflow = Column(types.String(32), index=True)
     workflow_manager = Column(types.Enum(*WorkflowManager.list()), default=WorkflowManager.SLURM)
     tower_workflow_id = Column(types.String(32), nullable=True, default=None)
+    tower_workflow_updated_at = Column(types.DateTime, nullable=True, default=None)
+    job_fingerprint = Column(types.String(64), nullable=True, default=None)
+    scanned_at = Column(types.DateTime, nullable=True, default=None)
 
     jobs = orm.relationship("Job", cascade="all,delete", backref="analysis")
     delivery = orm.relationship("Delivery", uselist=False)
@@ -0,0 +1,63 @@
+"""Full-text search on analysis comments.
+
+MySQL uses a FULLTEXT index on the comment column. SQLite, used in development and tests, uses an
+FTS5 table with a trigram tokenizer kept in sync with the analysis table by triggers."""
+
+import re
+
+import sqlalchemy
+from sqlalchemy import DDL, ColumnElement, event
+
+from trailblazer.store.models import Analysis
+
+MIN_TOKEN_LENGTH: int = 3
+MYSQL_BOOLEAN_OPERATORS = re.compile(r"[+\-<>()~*\"@]")
+SQLITE_SEARCH_TABLE: str = "analysis_search"
+
+SQLITE_SEARCH_DDL: list[str] = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_SEARCH_TABLE} USING fts5("
+    "comment, content='analysis', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS analysis_search_insert AFTER INSERT ON analysis BEGIN "
+    f"INSERT INTO {SQLITE_SEARCH_TABLE}(rowid, comment) VALUES (new.id, new.comment); END",
+    "CREATE TRIGGER IF NOT EXISTS analysis_search_delete AFTER DELETE ON analysis BEGIN "
+    f"INSERT INTO {SQLITE_SEARCH_TABLE}({SQLITE_SEARCH_TABLE}, rowid, comment) "
+    "VALUES ('delete', old.id, old.comment); END",
+    "CREATE TRIGGER IF NOT EXISTS analysis_search_update AFTER UPDATE OF comment ON analysis BEGIN "
+    f"INSERT INTO {SQLITE_SEARCH_TABLE}({SQLITE_SEARCH_TABLE}, rowid, comment) "
+    "VALUES ('delete', old.id, old.comment); "
+    f"INSERT INTO {SQLITE_SEARCH_TABLE}(rowid, comment) VALUES (new.id, new.comment); END",
+]
+
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(Analysis.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(
+    Analysis.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SQLITE_SEARCH_TABLE}").execute_if(dialect="sqlite"),
+)
+
+
+def get_comment_search_condition(dialect_name: str, search_term: str) -> ColumnElement:
+    """Return the condition matching analyses with the search term in their comment."""
+    if dialect_name == "mysql":
+        if boolean_query := get_mysql_boolean_query(search_term):
+            return Analysis.comment.match(boolean_query)
+    elif dialect_name == "sqlite" and len(search_term) >= MIN_TOKEN_LENGTH:
+        phrase: str = search_term.replace('"', '""')
+        matches = sqlalchemy.text(
+            f"SELECT rowid FROM {SQLITE_SEARCH_TABLE} WHERE {SQLITE_SEARCH_TABLE} MATCH :phrase"
+        ).bindparams(phrase=f'"{phrase}"')
+        return Analysis.id.in_(matches)
+    return Analysis.comment.ilike(f"%{search_term}%")
+
+
+def get_mysql_boolean_query(search_term: str) -> str:
+    """Return a boolean mode query requiring all words of the search term as prefixes.
+    Words shorter than the minimum token length are not indexed and therefore left out."""
+    words: list[str] = MYSQL_BOOLEAN_OPERATORS.sub(" ", search_term).split()
+    return " ".join(f"+{word}*" for word in words if len(word) >= MIN_TOKEN_LENGTH)
+
+
+def escape_like(search_term: str) -> str:
+    """Escape the wildcards of a LIKE pattern, using backslash as escape character."""
+    return re.sub(r"([\\%_])", r"\\\1", search_term)
@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from trailblazer.dto.analyses_request import AnalysesCursor, AnalysisSortField
+from trailblazer.dto.common import SortOrder
+from trailblazer.store.models import Analysis, Job
+
+JOB_UPDATE_FIELDS: list[str] = ["name", "context", "started_at", "elapsed", "status"]
+
+
+def get_job_key(job: Job) -> int | str:
+    """Return the key identifying a job within an analysis, falling back to the name for jobs
+    which have not yet been submitted. Ids given as strings, such as Tower native ids, are
+    compared as integers like the stored ids."""
+    return int(job.slurm_id) if job.slurm_id is not None else job.name
+
+
+def update_job_fields(job: Job, updated_job: Job) -> None:
+    """Update the fields of a job which differ from the updated job."""
+    for field in JOB_UPDATE_FIELDS:
+        updated_value = getattr(updated_job, field)
+        if getattr(job, field) != updated_value:
+            setattr(job, field, updated_value)
+
+
+def get_analyses_cursor(
+    analysis: Analysis, sort_field: AnalysisSortField, sort_order: SortOrder
+) -> AnalysesCursor:
+    """Return the cursor pointing after the analysis when sorting on the sort field."""
+    value: datetime | str | None = getattr(analysis, sort_field)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return AnalysesCursor(sort_field=sort_field, sort_order=sort_order, value=value, id=analysis.id)
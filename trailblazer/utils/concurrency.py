@@ -0,0 +1,27 @@
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Hashable, TypeVar
+
+Key = TypeVar("Key", bound=Hashable)
+Argument = TypeVar("Argument")
+Result = TypeVar("Result")
+
+
+def run_concurrently(
+    function: Callable[[Argument], Result], arguments: dict[Key, Argument], max_workers: int
+) -> tuple[dict[Key, Result], dict[Key, Exception]]:
+    """Call the function with each argument in a thread pool.
+    Returns the results and the raised errors, keyed like the arguments.
+    The function must not use the database session, which belongs to the calling thread."""
+    results: dict[Key, Result] = {}
+    errors: dict[Key, Exception] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: dict[Future, Key] = {
+            executor.submit(function, argument): key for key, argument in arguments.items()
+        }
+        for future in as_completed(futures):
+            key: Key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as error:
+                errors[key] = error
+    return results, errors
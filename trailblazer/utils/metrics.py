@@ -0,0 +1,348 @@
+"""Process-wide operational metrics rendered in the Prometheus text exposition format.
+
+The metrics are served by the REST server on /metrics and can be written to a text file by CLI
+commands, to be picked up by a textfile collector or pushed to a pushgateway.
+
+The metrics are kept per process. When the REST server runs with several workers, each worker
+writes a snapshot of its metrics to a shared directory and /metrics renders the sum of the
+snapshots of all workers, so that a scrape does not depend on which worker serves it."""
+
+import functools
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+)
+SCAN_BUCKETS: tuple[float, ...] = (1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+SNAPSHOT_PREFIX: str = "trailblazer_metrics_"
+EXITED_SNAPSHOT_NAME: str = f"{SNAPSHOT_PREFIX}exited.json"
+
+
+class Histogram:
+    """Histogram of observed values, such as durations in seconds, per combination of labels."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        label_values: tuple[str, ...] = tuple(str(labels[name]) for name in self.label_names)
+        with self._lock:
+            bucket_counts, total = self._series.setdefault(
+                label_values, ([0] * len(self.buckets), [0.0])
+            )
+            for index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    bucket_counts[index] += 1
+            total[0] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the duration of the block in seconds."""
+        started_at: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at, **labels)
+
+    def get_series(self) -> dict[tuple[str, ...], tuple[list[int], float]]:
+        """Return the bucket counts and sum per combination of labels."""
+        with self._lock:
+            return {
+                labels: (list(counts), total[0]) for labels, (counts, total) in self._series.items()
+            }
+
+    def get_snapshot(self, series: dict | None = None) -> list:
+        """Return the series of the histogram, or the given merged series, as a snapshot."""
+        if series is None:
+            series = self.get_series()
+        return [[list(labels), counts, total] for labels, (counts, total) in series.items()]
+
+    def merge_snapshots(
+        self, snapshots: list[list]
+    ) -> dict[tuple[str, ...], tuple[list[int], float]]:
+        """Return the series of the snapshots summed per combination of labels."""
+        series: dict[tuple[str, ...], tuple[list[int], float]] = {}
+        for snapshot in snapshots:
+            for label_values, bucket_counts, total in snapshot:
+                counts, current_total = series.get(
+                    tuple(label_values), ([0] * len(self.buckets), 0.0)
+                )
+                series[tuple(label_values)] = (
+                    [count + added for count, added in zip(counts, bucket_counts)],
+                    current_total + total,
+                )
+        return series
+
+    def render(self, series: dict | None = None) -> list[str]:
+        """Render the series of the histogram, or the given merged series."""
+        lines: list[str] = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        if series is None:
+            series = self.get_series()
+        for label_values, (bucket_counts, total) in sorted(series.items()):
+            labels: list[str] = [
+                f'{name}="{escape_label_value(value)}"'
+                for name, value in zip(self.label_names, label_values)
+            ]
+            for upper_bound, count in zip(self.buckets, bucket_counts):
+                bucket_labels: str = ",".join(labels + [f'le="{format_bound(upper_bound)}"'])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {count}")
+            label_text: str = f"{{{','.join(labels)}}}" if labels else ""
+            lines.append(f"{self.name}_sum{label_text} {total}")
+            lines.append(f"{self.name}_count{label_text} {bucket_counts[-1]}")
+        return lines
+
+
+class Gauge:
+    """Gauge reading its current values per label value from a callback when rendered."""
+
+    def __init__(
+        self, name: str, documentation: str, label_name: str, callback: Callable[[], dict]
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_name = label_name
+        self.callback = callback
+
+    def get_snapshot(self) -> dict:
+        return {str(label_value): value for label_value, value in self.callback().items()}
+
+    def merge_snapshots(self, snapshots: list[dict]) -> dict:
+        """Return the values of the snapshots summed per label value."""
+        values: dict = {}
+        for snapshot in snapshots:
+            for label_value, value in snapshot.items():
+                values[label_value] = values.get(label_value, 0) + value
+        return values
+
+    def render(self, values: dict | None = None) -> list[str]:
+        """Render the current values of the gauge, or the given merged values."""
+        lines: list[str] = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} gauge",
+        ]
+        if values is None:
+            values = self.callback()
+        for label_value, value in sorted(values.items()):
+            lines.append(
+                f'{self.name}{{{self.label_name}="{escape_label_value(str(label_value))}"}} {value}'
+            )
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: list[Histogram | Gauge] = []
+        self._snapshot_written_at: float | None = None
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        histogram = Histogram(
+            name=name, documentation=documentation, label_names=label_names, buckets=buckets
+        )
+        self._metrics.append(histogram)
+        return histogram
+
+    def gauge(
+        self, name: str, documentation: str, label_name: str, callback: Callable[[], dict]
+    ) -> Gauge:
+        gauge = Gauge(
+            name=name, documentation=documentation, label_name=label_name, callback=callback
+        )
+        self._metrics.append(gauge)
+        return gauge
+
+    def render(self) -> str:
+        lines: list[str] = [line for metric in self._metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+    def write_text_file(self, file_path: Path) -> None:
+        """Write the metrics to a file, replacing it atomically so readers never see a partial
+        file."""
+        write_file_atomically(file_path=file_path, content=self.render())
+
+    def get_snapshot(self) -> dict[str, list | dict]:
+        """Return the current values of the metrics by name, to be merged with the snapshots of
+        other processes."""
+        return {metric.name: metric.get_snapshot() for metric in self._metrics}
+
+    def write_snapshot(self, directory: Path, min_interval: float = 0) -> None:
+        """Write the snapshot of the metrics of this process to the directory, unless one was
+        written less than the minimum interval in seconds ago."""
+        now: float = time.monotonic()
+        if self._snapshot_written_at is not None and now - self._snapshot_written_at < min_interval:
+            return
+        self._snapshot_written_at = now
+        write_file_atomically(
+            file_path=get_snapshot_path(directory=directory, process_id=os.getpid()),
+            content=json.dumps(self.get_snapshot()),
+        )
+
+    def retire_snapshot(self, directory: Path, process_id: int) -> None:
+        """Fold the histograms of the snapshot of an exited process into the snapshot of all
+        exited processes and remove its snapshot, so that the summed counts do not drop when a
+        worker is replaced. Gauges describe running processes and are not kept."""
+        snapshot_file: Path = get_snapshot_path(directory=directory, process_id=process_id)
+        if not snapshot_file.exists():
+            return
+        exited_file = Path(directory, EXITED_SNAPSHOT_NAME)
+        snapshots: list[dict] = read_snapshot_files(
+            [file for file in [exited_file, snapshot_file] if file.exists()]
+        )
+        exited_snapshot: dict[str, list] = {
+            metric.name: metric.get_snapshot(
+                metric.merge_snapshots(
+                    [snapshot[metric.name] for snapshot in snapshots if metric.name in snapshot]
+                )
+            )
+            for metric in self._metrics
+            if isinstance(metric, Histogram)
+        }
+        write_file_atomically(file_path=exited_file, content=json.dumps(exited_snapshot))
+        snapshot_file.unlink()
+
+    def render_snapshots(self, directory: Path) -> str:
+        """Render the metrics summed over the snapshots of all processes in the directory."""
+        snapshots: list[dict] = read_snapshots(directory)
+        lines: list[str] = [
+            line
+            for metric in self._metrics
+            for line in metric.render(
+                metric.merge_snapshots(
+                    [snapshot[metric.name] for snapshot in snapshots if metric.name in snapshot]
+                )
+            )
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def get_snapshot_path(directory: Path, process_id: int) -> Path:
+    return Path(directory, f"{SNAPSHOT_PREFIX}{process_id}.json")
+
+
+def get_snapshot_files(directory: Path) -> list[Path]:
+    """Return the metric snapshot files in the directory, leaving out any other files."""
+    return sorted(directory.glob(f"{SNAPSHOT_PREFIX}*.json"))
+
+
+def remove_snapshots(directory: Path) -> None:
+    for snapshot_file in get_snapshot_files(directory):
+        snapshot_file.unlink(missing_ok=True)
+
+
+def read_snapshots(directory: Path) -> list[dict]:
+    """Return the metric snapshots in the directory, skipping files which can not be read."""
+    return read_snapshot_files(get_snapshot_files(directory))
+
+
+def read_snapshot_files(snapshot_files: list[Path]) -> list[dict]:
+    snapshots: list[dict] = []
+    for snapshot_file in snapshot_files:
+        try:
+            snapshots.append(json.loads(snapshot_file.read_text()))
+        except (OSError, ValueError) as error:
+            LOG.warning(f"Skipping metrics snapshot {snapshot_file}: {error}")
+    return snapshots
+
+
+def write_file_atomically(file_path: Path, content: str) -> None:
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=file_path.parent, suffix=".tmp")
+    with os.fdopen(file_descriptor, "w") as file:
+        file.write(content)
+    os.replace(temporary_path, file_path)
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def format_bound(upper_bound: float) -> str:
+    return "+Inf" if upper_bound == math.inf else repr(float(upper_bound))
+
+
+def timed(histogram: Histogram, **labels: str) -> Callable:
+    """Decorator observing the duration of each call of the function.
+    The name of the function is used as the operation label unless it is given."""
+
+    def decorator(function: Callable) -> Callable:
+        function_labels: dict[str, str] = labels
+        if "operation" in histogram.label_names and "operation" not in labels:
+            function_labels = labels | {"operation": function.__name__}
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with histogram.time(**function_labels):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_DURATION: Histogram = REGISTRY.histogram(
+    name="trailblazer_http_request_duration_seconds",
+    documentation="Duration of REST requests per endpoint.",
+    label_names=("endpoint", "method", "status"),
+)
+AUTH_VERIFICATION_DURATION: Histogram = REGISTRY.histogram(
+    name="trailblazer_auth_verification_duration_seconds",
+    documentation="Duration of the user verification of REST requests.",
+)
+DB_POOL_CHECKOUT_WAIT: Histogram = REGISTRY.histogram(
+    name="trailblazer_db_pool_checkout_wait_seconds",
+    documentation="Time spent waiting for a database connection from the pool.",
+)
+EXTERNAL_REQUEST_DURATION: Histogram = REGISTRY.histogram(
+    name="trailblazer_external_request_duration_seconds",
+    documentation="Duration of calls to external services per client and operation.",
+    label_names=("client", "operation"),
+)
+SCAN_DURATION: Histogram = REGISTRY.histogram(
+    name="trailblazer_scan_duration_seconds",
+    documentation="Duration of scan cycles updating the ongoing analyses.",
+    buckets=SCAN_BUCKETS,
+)